@@ -0,0 +1,119 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Compare the round trip latency of setting the value of a value downlink with the threaded and the asynchronous
+# client. A local server acknowledges sync requests and echoes every command back as an event.
+#
+# Usage: python -m benchmarks.client_latency [round_trips]
+import asyncio
+import statistics
+import sys
+import threading
+import time
+
+import websockets
+
+from swimai import SwimClient, AsyncSwimClient
+from swimai.warp._warp import _Envelope
+
+HOST = 'localhost'
+PORT = 9087
+
+
+async def serve(websocket) -> None:
+    async for message in websocket:
+        envelope = _Envelope._parse_recon(message)
+        route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+
+        if envelope._tag == 'sync':
+            await websocket.send(f'@linked{route}')
+            await websocket.send(f'@synced{route}')
+        elif envelope._tag == 'command':
+            await websocket.send(f'@event{route}{message[message.index(")") + 1:]}')
+
+
+def run_server(started: threading.Event, stopped: threading.Event) -> None:
+    async def main() -> None:
+        async with websockets.serve(serve, HOST, PORT):
+            started.set()
+
+            while not stopped.is_set():
+                await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+
+def report(label: str, latencies: list) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f'{label:<16} median {statistics.median(latencies) * 1e6:>8,.0f} us   p99 {p99 * 1e6:>8,.0f} us')
+
+
+def measure_threaded(round_trips: int) -> list:
+    received = threading.Event()
+    latencies = []
+
+    with SwimClient() as client:
+        view = client.downlink_value().set_host_uri(f'ws://{HOST}:{PORT}').set_node_uri('/unit').set_lane_uri('value')
+        view.did_set(lambda new_value, old_value: received.set())
+        view.open()
+        view.get(wait_sync=True)
+
+        for index in range(0, round_trips):
+            received.clear()
+            start = time.perf_counter()
+            view.set(index)
+            received.wait()
+            latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+async def measure_async(round_trips: int) -> list:
+    received = asyncio.Event()
+    latencies = []
+
+    async with AsyncSwimClient() as client:
+        view = client.downlink_value().set_host_uri(f'ws://{HOST}:{PORT}').set_node_uri('/unit').set_lane_uri('value')
+        view.did_set(lambda new_value, old_value: received.set())
+        await client.open(view)
+        await client.get(view, wait_sync=True)
+
+        for index in range(0, round_trips):
+            received.clear()
+            start = time.perf_counter()
+            await client.set(view, index)
+            await received.wait()
+            latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def main(round_trips: int) -> None:
+    started = threading.Event()
+    stopped = threading.Event()
+    server = threading.Thread(target=run_server, args=(started, stopped))
+    server.start()
+    started.wait()
+
+    try:
+        report('SwimClient', measure_threaded(round_trips))
+        report('AsyncSwimClient', asyncio.run(measure_async(round_trips)))
+    finally:
+        stopped.set()
+        server.join()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
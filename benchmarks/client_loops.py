@@ -0,0 +1,127 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Compare the event throughput and the round trip latency of the Swim client with the default asyncio loop and with
+# uvloop, if it is installed. A local server acknowledges sync requests, echoes every command on the `value` lane back
+# as an event and answers a command with a number `n` on the `burst` lane with `n` events on the `value` lane.
+#
+# Usage: python -m benchmarks.client_loops [events] [round_trips]
+import asyncio
+import statistics
+import sys
+import threading
+import time
+
+import websockets
+
+from swimai import SwimClient
+from swimai.client import uvloop_factory
+from swimai.warp._warp import _Envelope
+
+HOST = 'localhost'
+PORT = 9088
+
+
+async def serve(websocket) -> None:
+    async for message in websocket:
+        envelope = _Envelope._parse_recon(message)
+        route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+
+        if envelope._tag == 'sync':
+            await websocket.send(f'@linked{route}')
+            await websocket.send(f'@synced{route}')
+        elif envelope._tag == 'command' and envelope._lane_uri == 'burst':
+            value_route = f'(node:"{envelope._node_uri}",lane:value)'
+
+            for index in range(0, envelope._body.value):
+                await websocket.send(f'@event{value_route}{index}')
+        elif envelope._tag == 'command':
+            await websocket.send(f'@event{route}{message[message.index(")") + 1:]}')
+
+
+def run_server(started: threading.Event, stopped: threading.Event) -> None:
+    async def main() -> None:
+        async with websockets.serve(serve, HOST, PORT):
+            started.set()
+
+            while not stopped.is_set():
+                await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+
+def measure(loop_factory, events: int, round_trips: int) -> tuple:
+    received = threading.Event()
+    state = {'count': 0, 'target': 0}
+    latencies = []
+
+    def did_set(new_value, old_value):
+        state['count'] += 1
+
+        if state['count'] >= state['target']:
+            received.set()
+
+    with SwimClient(loop_factory=loop_factory) as client:
+        view = client.downlink_value().set_host_uri(f'ws://{HOST}:{PORT}').set_node_uri('/unit').set_lane_uri('value')
+        view.did_set(did_set)
+        view.open()
+        view.get(wait_sync=True)
+
+        state['count'], state['target'] = 0, events
+        received.clear()
+        start = time.perf_counter()
+        client.command(f'ws://{HOST}:{PORT}', '/unit', 'burst', events)
+        received.wait()
+        throughput = events / (time.perf_counter() - start)
+
+        for index in range(0, round_trips):
+            state['count'], state['target'] = 0, 1
+            received.clear()
+            start = time.perf_counter()
+            view.set(index)
+            received.wait()
+            latencies.append(time.perf_counter() - start)
+
+    return throughput, latencies
+
+
+def report(label: str, throughput: float, latencies: list) -> None:
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f'{label:<10} {throughput:>10,.0f} events/s   median {statistics.median(latencies) * 1e6:>6,.0f} us   '
+          f'p99 {p99 * 1e6:>6,.0f} us')
+
+
+def main(events: int, round_trips: int) -> None:
+    started = threading.Event()
+    stopped = threading.Event()
+    server = threading.Thread(target=run_server, args=(started, stopped))
+    server.start()
+    started.wait()
+
+    try:
+        report('asyncio', *measure(asyncio.new_event_loop, events, round_trips))
+
+        try:
+            import uvloop  # noqa: F401
+            report('uvloop', *measure(uvloop_factory, events, round_trips))
+        except ImportError:
+            print('uvloop     not installed')
+    finally:
+        stopped.set()
+        server.join()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000, int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
@@ -0,0 +1,71 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Measure how fast a map downlink ingests `update` events and how long `get_all` takes afterwards. The envelopes are
+# parsed before the measurement and replayed directly into the downlink manager of a single map view without
+# callbacks on the loop of the client, so only the work of the downlink itself is measured. `get_all` is called from the
+# main thread, like in a user application.
+#
+# Usage: python -m benchmarks.client_map_ingest [events]
+import asyncio
+import sys
+import time
+
+from swimai import SwimClient
+from swimai.client._connections import _DownlinkManager, _DownlinkManagerStatus
+from swimai.warp._warp import _Envelope
+
+
+async def open_view(client: SwimClient):
+    view = client.downlink_map().set_host_uri('ws://localhost:9001').set_node_uri('/unit').set_lane_uri('map')
+    manager = _DownlinkManager(None)
+    manager._open = lambda: asyncio.sleep(0)
+    await manager._add_view(view)
+    manager.status = _DownlinkManagerStatus.OPEN
+    view._is_open = True
+    return view, manager
+
+
+async def ingest(manager: _DownlinkManager, messages: list) -> float:
+    start = time.perf_counter()
+
+    for message in messages:
+        await manager._receive_message(message)
+
+    return time.perf_counter() - start
+
+
+def measure(events: int) -> None:
+    messages = [_Envelope._parse_recon(f'@event(node:"/unit",lane:map)@update(key:{index}){{a:{index},b:"x"}}')
+                for index in range(0, events)]
+
+    with SwimClient() as client:
+        view, manager = client._schedule_task(open_view, client).result()
+        duration = client._schedule_task(ingest, manager, messages).result()
+
+        start = time.perf_counter()
+        view.get_all()
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        view.get_all()
+        second = time.perf_counter() - start
+
+    print(f'{"ingest":<16} {duration:>8.3f} s for {events:,} events ({events / duration:,.0f} events/s)')
+    print(f'{"get_all first":<16} {first:>8.3f} s for {events:,} entries')
+    print(f'{"get_all again":<16} {second:>8.3f} s for {events:,} entries')
+
+
+if __name__ == '__main__':
+    measure(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,102 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Compare the startup time of the Swim client for a large number of value downlinks, when the downlinks are opened one
+# by one and when they are opened with `open_many`. A local server answers every sync request with `linked` and
+# `synced` responses in its own process. The startup time is measured until all downlinks have been synced.
+#
+# Usage: python -m benchmarks.client_open_many [links]
+import asyncio
+import multiprocessing
+import sys
+import time
+
+import websockets
+
+from swimai import SwimClient
+from swimai.warp._warp import _Envelope
+
+HOST = 'localhost'
+PORT = 9090
+
+
+async def serve(websocket) -> None:
+    async for message in websocket:
+        envelope = _Envelope._parse_recon(message)
+        route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+
+        if envelope._tag == 'sync':
+            await websocket.send(f'@linked{route}')
+            await websocket.send(f'@synced{route}')
+
+
+def run_server() -> None:
+    async def serve_forever() -> None:
+        async with websockets.serve(serve, HOST, PORT):
+            await asyncio.Future()
+
+    asyncio.run(serve_forever())
+
+
+def create_views(client: SwimClient, links: int) -> list:
+    views = []
+
+    for index in range(0, links):
+        view = client.downlink_value().set_host_uri(f'ws://{HOST}:{PORT}').set_node_uri(f'/unit/{index}')
+        views.append(view.set_lane_uri('value'))
+
+    return views
+
+
+async def wait_synced(views: list) -> None:
+    while any(view._model is None for view in views):
+        await asyncio.sleep(0.001)
+
+    await asyncio.gather(*[view._model._wait_established() for view in views])
+
+
+def measure_open(links: int) -> float:
+    with SwimClient() as client:
+        views = create_views(client, links)
+        start = time.perf_counter()
+
+        for view in views:
+            view.open()
+
+        client._run_task(wait_synced, views)
+        return time.perf_counter() - start
+
+
+def measure_open_many(links: int) -> float:
+    with SwimClient() as client:
+        views = create_views(client, links)
+        start = time.perf_counter()
+        client.open_many(views).result()
+        return time.perf_counter() - start
+
+
+def main(links: int) -> None:
+    server = multiprocessing.get_context('spawn').Process(target=run_server, daemon=True)
+    server.start()
+    time.sleep(1)
+
+    try:
+        print(f'{"open":<10} {measure_open(links):>8.2f} s for {links:,} links')
+        print(f'{"open_many":<10} {measure_open_many(links):>8.2f} s for {links:,} links')
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,111 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Compare the aggregate event throughput of the Swim client with the sharded client and an increasing number of worker
+# processes. Local servers, each running in its own process, answer a command with a number `n` on the `burst` lane of
+# a node with `n` record events on the `value` lane of the node. Each downlink receives the events of its own node and
+# the nodes are spread across the servers.
+#
+# Usage: python -m benchmarks.client_sharded [lanes] [events_per_lane] [max_shards] [servers]
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+import websockets
+
+from swimai import SwimClient, ShardedSwimClient
+from swimai.warp._warp import _Envelope
+
+HOST = 'localhost'
+PORT = 9089
+
+
+async def serve(websocket) -> None:
+    async for message in websocket:
+        envelope = _Envelope._parse_recon(message)
+        route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+
+        if envelope._tag == 'sync':
+            await websocket.send(f'@linked{route}')
+            await websocket.send(f'@synced{route}')
+        elif envelope._tag == 'command' and envelope._lane_uri == 'burst':
+            value_route = f'(node:"{envelope._node_uri}",lane:value)'
+
+            for index in range(0, envelope._body.value):
+                await websocket.send(f'@event{value_route}{{id:{index},name:"sensor",temperature:21.5,ok:true}}')
+
+
+def run_server(port: int) -> None:
+    async def serve_forever() -> None:
+        async with websockets.serve(serve, HOST, port):
+            await asyncio.Future()
+
+    asyncio.run(serve_forever())
+
+
+def measure(client, lanes: int, events_per_lane: int, servers: int) -> float:
+    host_uris = [f'ws://{HOST}:{PORT + index}' for index in range(0, servers)]
+    received = threading.Event()
+    lock = threading.Lock()
+    state = {'count': 0}
+    total = lanes * events_per_lane
+
+    def did_set(new_value, old_value):
+        with lock:
+            state['count'] += 1
+
+            if state['count'] >= total:
+                received.set()
+
+    with client:
+        for index in range(0, lanes):
+            view = client.downlink_value().set_host_uri(host_uris[index % servers]).set_node_uri(f'/unit/{index}')
+            view.set_lane_uri('value')
+            view.did_set(did_set)
+            view.open()
+
+        time.sleep(1)
+        start = time.perf_counter()
+
+        for index in range(0, lanes):
+            client.command(host_uris[index % servers], f'/unit/{index}', 'burst', events_per_lane)
+
+        received.wait()
+        return total / (time.perf_counter() - start)
+
+
+def main(lanes: int, events_per_lane: int, max_shards: int, servers: int) -> None:
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=run_server, args=(PORT + index,), daemon=True) for index in range(0, servers)]
+    [process.start() for process in processes]
+    time.sleep(1)
+
+    try:
+        print(f'{"SwimClient":<16} {measure(SwimClient(), lanes, events_per_lane, servers):>10,.0f} events/s')
+        shards = 1
+
+        while shards <= max_shards:
+            throughput = measure(ShardedSwimClient(shards=shards), lanes, events_per_lane, servers)
+            print(f'{f"{shards} shards":<16} {throughput:>10,.0f} events/s')
+            shards *= 2
+    finally:
+        [process.terminate() for process in processes]
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 64, int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+         int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count(), int(sys.argv[4]) if len(sys.argv) > 4 else 4)
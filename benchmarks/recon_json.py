@@ -0,0 +1,55 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Compare the Recon to JSON transcoder with parsing messages into records and converting them.
+#
+# Usage: python -m benchmarks.recon_json [messages]
+import sys
+import time
+
+from swimai.recon import Recon
+from swimai.structures import RecordConverter
+
+EVENTS = ['@event(node:"/unit/sensor-42",lane:readings){id:"sensor-42",status:ok,'
+          'reading:{temperature:21.5,humidity:40,battery:98},location:{lat:51.5072,lng:-0.1276,floor:3}}',
+          '@event(node:"/unit/sensor-42",lane:history)@update(key:"2021-06-01T10:00:00Z")'
+          '{samples:{21.5,21.7,21.6,21.9},unit:celsius}',
+          '@event(node:"/unit/sensor-42",lane:status)"online"']
+
+
+def measure(label: str, function, items: list) -> None:
+    start = time.perf_counter()
+
+    for item in items:
+        function(item)
+
+    elapsed = time.perf_counter() - start
+    print(f'{label:<40}{len(items) / elapsed:>12,.0f} per s')
+
+
+def main(messages: int) -> None:
+    converter = RecordConverter.get_converter()
+    recon_strings = [EVENTS[index % len(EVENTS)] for index in range(0, messages)]
+    json_strings = [Recon.transcode_to_json(recon_string) for recon_string in recon_strings]
+
+    measure('Recon.parse + record_to_json_bytes',
+            lambda recon_string: converter.record_to_json_bytes(Recon.parse(recon_string)), recon_strings)
+    measure('Recon.transcode_to_json', Recon.transcode_to_json, recon_strings)
+    measure('Recon.parse + Recon.to_string', lambda recon_string: Recon.to_string(Recon.parse(recon_string)),
+            recon_strings)
+    measure('Recon.transcode_from_json', Recon.transcode_from_json, json_strings)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
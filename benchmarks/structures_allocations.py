@@ -0,0 +1,58 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Measure the number of allocations retained by each parsed WARP frame.
+#
+# Usage: python -m benchmarks.structures_allocations [frames]
+import sys
+import time
+import tracemalloc
+
+from swimai.recon import Recon
+
+FRAMES = [
+    '@event(node:"/unit/foo",lane:shopping_cart){@update(key:milk){count:3,available:true}}',
+    '@event(node:"/unit/foo",lane:shopping_cart){@remove(key:bread)}',
+    '@event(node:"/unit/foo",lane:info)"Hello, World"',
+    '@synced(node:"/unit/foo",lane:shopping_cart)',
+]
+
+
+def main(frames: int) -> None:
+    messages = [FRAMES[index % len(FRAMES)] for index in range(0, frames)]
+    parsed = list()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+
+    for message in messages:
+        parsed.append(Recon.parse(message))
+
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+
+    print(f'Frames:           {len(parsed)}')
+    print(f'Parse time:       {elapsed:.2f} s')
+    print(f'Retained blocks:  {blocks / frames:.1f} per frame')
+    print(f'Retained memory:  {size / frames:.0f} B per frame')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
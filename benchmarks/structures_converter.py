@@ -0,0 +1,66 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Measure the throughput of the conversion between objects and records.
+#
+# Usage: python -m benchmarks.structures_converter [objects]
+import sys
+import time
+from dataclasses import dataclass
+
+from swimai.structures import RecordConverter
+
+
+class Person:
+
+    def __init__(self, name=None, age=None, city=None):
+        self.name = name
+        self.age = age
+        self.city = city
+
+
+@dataclass
+class DataPerson:
+    name: str = None
+    age: int = None
+    city: str = None
+
+
+def measure(label: str, function, items: list) -> None:
+    start = time.perf_counter()
+
+    for item in items:
+        function(item)
+
+    elapsed = time.perf_counter() - start
+    print(f'{label:<32}{len(items) / elapsed:>12,.0f} per s')
+
+
+def main(objects: int) -> None:
+    converter = RecordConverter.get_converter()
+
+    for custom_class in [Person, DataPerson]:
+        items = [custom_class(f'name-{index}', index, 'London') for index in range(0, objects)]
+        records = [converter.object_to_record(item) for item in items]
+        classes = {custom_class.__name__: custom_class}
+
+        measure(f'{custom_class.__name__} to record', converter.object_to_record, items)
+        measure(f'{custom_class.__name__} to object', lambda record: converter.record_to_object(record, classes, True),
+                records)
+        measure(f'{custom_class.__name__} to unknown object',
+                lambda record: converter.record_to_object(record, {}, False), records)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
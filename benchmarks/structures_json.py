@@ -0,0 +1,57 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Compare the conversion of records into JSON-compatible structures with the conversion into objects.
+# The flat payload is converted completely by both methods. The nested payload is only measured for the JSON conversion,
+# as the conversion into objects does not convert nested records and would not do the same work.
+#
+# Usage: python -m benchmarks.structures_json [records]
+import json
+import sys
+import time
+
+from swimai.recon import Recon
+from swimai.structures import RecordConverter
+
+FLAT_PAYLOAD = '{id:"sensor-42",status:ok,temperature:21.5,humidity:40,battery:98,lat:51.5072,lng:-0.1276,floor:3}'
+NESTED_PAYLOAD = '{id:"sensor-42",status:ok,reading:{temperature:21.5,humidity:40,battery:98},' \
+                 'location:{lat:51.5072,lng:-0.1276,floor:3}}'
+
+
+def measure(label: str, function, items: list) -> None:
+    start = time.perf_counter()
+
+    for item in items:
+        function(item)
+
+    elapsed = time.perf_counter() - start
+    print(f'{label:<40}{len(items) / elapsed:>12,.0f} per s')
+
+
+def main(records: int) -> None:
+    converter = RecordConverter.get_converter()
+    flat_items = [Recon.parse(FLAT_PAYLOAD) for _ in range(0, records)]
+    nested_items = [Recon.parse(NESTED_PAYLOAD) for _ in range(0, records)]
+
+    measure('flat record_to_object', lambda record: converter.record_to_object(record, {}, False), flat_items)
+    measure('flat record_to_json', converter.record_to_json, flat_items)
+    measure('flat record_to_object + json.dumps',
+            lambda record: json.dumps(converter.record_to_object(record, {}, False)).encode('utf-8'), flat_items)
+    measure('flat record_to_json_bytes', converter.record_to_json_bytes, flat_items)
+    measure('nested record_to_json', converter.record_to_json, nested_items)
+    measure('nested record_to_json_bytes', converter.record_to_json_bytes, nested_items)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,60 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Measure the memory used by a record tree with a given number of entries.
+#
+# Usage: python -m benchmarks.structures_memory [entries]
+import sys
+import time
+import tracemalloc
+
+from swimai.structures import RecordMap, Slot, Text, Num, Attr
+
+
+def build_tree(entries: int) -> 'RecordMap':
+    """
+    Build a record tree, similar to a parsed map downlink snapshot, with a given number of entries.
+
+    :param entries:         - Number of entries in the tree.
+    :return:                - Record with one slot per entry.
+    """
+    tree = RecordMap.create()
+
+    for index in range(0, entries):
+        value = RecordMap.create()
+        value.add(Attr.create_attr(Text.create_from('entry'), Text.create_from(f'id-{index}')))
+        value.add(Slot.create_slot(Text.create_from('count'), Num.create_from(index)))
+        tree.add(Slot.create_slot(Text.create_from(f'key-{index}'), value))
+
+    return tree
+
+
+def main(entries: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    tree = build_tree(entries)
+
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'Entries:          {tree.size}')
+    print(f'Build time:       {elapsed:.2f} s')
+    print(f'Current memory:   {current / 2 ** 20:.1f} MiB ({current / entries:.0f} B per entry)')
+    print(f'Peak memory:      {peak / 2 ** 20:.1f} MiB')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
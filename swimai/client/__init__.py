@@ -13,5 +13,8 @@
 #  limitations under the License.
 
 from ._swim_client import SwimClient
+from ._async_swim_client import AsyncSwimClient
+from ._sharded_swim_client import ShardedSwimClient
+from ._utils import uvloop_factory
 
-__all__ = [SwimClient]
+__all__ = [SwimClient, AsyncSwimClient, ShardedSwimClient, uvloop_factory]
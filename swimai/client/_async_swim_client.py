@@ -0,0 +1,284 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import sys
+
+from concurrent.futures import Executor
+from traceback import TracebackException
+from typing import Callable, Any, Optional, List
+from ._downlinks._downlinks import _DownlinkView, _MapDownlinkView, _ValueDownlinkView
+from ._swim_client import SwimClient
+from ._utils import after_started
+
+
+class AsyncSwimClient(SwimClient):
+    """
+    Swim client that runs on the asyncio loop of the caller, instead of starting its own loop in a separate thread.
+    Tasks are executed directly on the loop of the caller, so the client must only be used from the thread of
+    that loop.
+    """
+
+    def __init__(self, terminate_on_exception: bool = False, execute_on_exception: Callable = None,
+                 debug: bool = False, decode_executor: 'Executor' = None) -> None:
+        super().__init__(terminate_on_exception=terminate_on_exception, execute_on_exception=execute_on_exception,
+                         debug=debug, decode_executor=decode_executor)
+        self.__tasks = set()
+        self.__drainable_tasks = set()
+
+    def __enter__(self) -> 'AsyncSwimClient':
+        raise Exception('The asynchronous client must be used with "async with"!')
+
+    async def __aenter__(self) -> 'AsyncSwimClient':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Optional[type], exc_value: Optional[Exception],
+                        exc_traceback: Optional[TracebackException]) -> 'AsyncSwimClient':
+
+        if exc_value or exc_traceback:
+            self._handle_exception(exc_value, exc_traceback)
+
+        await self.stop()
+        return self
+
+    async def start(self) -> 'AsyncSwimClient':
+        """
+        Start the Swim client on the running asyncio loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._has_started = True
+
+        return self
+
+    async def stop(self, drain: bool = False, timeout: float = 5) -> 'AsyncSwimClient':
+        """
+        Stop the client.
+        Cancel all tasks of the client and close its connections. The asyncio loop itself is left running.
+
+        :param drain:           - If True, wait for pending messages and callbacks and close the connections before
+                                  cancelling the remaining tasks. If False, cancel them immediately.
+        :param timeout:         - Maximum time in seconds for draining the client, including closing the connections.
+        """
+        if drain:
+            await self._drain(timeout)
+
+        tasks = list(self.__tasks)
+        [task.cancel() for task in tasks]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await self._close_connections()
+        self._has_started = False
+
+        return self
+
+    async def command(self, host_uri: str, node_uri: str, lane_uri: str, body: Any) -> None:
+        """
+        Send a command message to a command lane on a remote Swim agent.
+
+        :param host_uri:        - Host URI of the remote agent.
+        :param node_uri:        - Node URI of the remote agent.
+        :param lane_uri:        - Lane URI of the command lane of the remote agent.
+        :param body:            - The message body.
+        """
+        await self._send_command(host_uri, node_uri, lane_uri, body)
+
+    async def open(self, downlink_view: '_DownlinkView') -> '_DownlinkView':
+        """
+        Open a downlink and wait until it has been added to the connection of its host.
+
+        :param downlink_view:   - Downlink view to open.
+        :return:                - The downlink view.
+        """
+        if not downlink_view._is_open:
+            await self._add_downlink_view(downlink_view)
+            downlink_view._is_open = True
+
+        return downlink_view
+
+    async def close(self, downlink_view: '_DownlinkView') -> '_DownlinkView':
+        """
+        Close a downlink and wait until it has been removed from the connection of its host.
+
+        :param downlink_view:   - Downlink view to close.
+        :return:                - The downlink view.
+        """
+        if downlink_view._is_open:
+            downlink_view._is_open = False
+            await self._remove_downlink_view(downlink_view)
+
+        return downlink_view
+
+    async def open_many(self, downlink_views: List['_DownlinkView'], timeout: float = None) -> List['_DownlinkView']:
+        """
+        Open multiple downlinks at once and wait until all of them have been linked, or synced for value and map
+        downlinks. The downlinks are grouped by host and the requests for establishing them are sent in a single pass
+        for each host. Downlinks that are already open are skipped.
+
+        :param downlink_views:  - Downlink views to open.
+        :param timeout:         - Maximum time in seconds to wait for the downlinks to be established. If some of them
+                                  are not established in time, an exception with the routes of those downlinks is
+                                  raised and they stay open. If None, wait without a limit.
+        :return:                - The downlink views.
+        """
+        closed_views = [downlink_view for downlink_view in downlink_views if not downlink_view._is_open]
+
+        for downlink_view in closed_views:
+            downlink_view._is_open = True
+
+        await self._open_downlink_views(closed_views, timeout)
+
+        return downlink_views
+
+    async def close_many(self, downlink_views: List['_DownlinkView']) -> List['_DownlinkView']:
+        """
+        Close multiple downlinks at once and wait until all of them have been removed from the connections of their
+        hosts. Downlinks that are not open are skipped.
+
+        :param downlink_views:  - Downlink views to close.
+        :return:                - The downlink views.
+        """
+        open_views = [downlink_view for downlink_view in downlink_views if downlink_view._is_open]
+
+        for downlink_view in open_views:
+            downlink_view._is_open = False
+
+        await self._close_downlink_views(open_views)
+
+        return downlink_views
+
+    async def get(self, downlink_view: '_DownlinkView', key: Any = None, wait_sync: bool = False) -> Any:
+        """
+        Return the value of a value downlink, or the value of an entry of a map downlink.
+
+        :param downlink_view:   - Value or map downlink view.
+        :param key:             - Key of the entry of a map downlink. If None, all entries are returned.
+        :param wait_sync:       - If True, wait for the initial `sync` to be completed before returning.
+                                  If False, return immediately.
+        :return:                - The value of the downlink or of the entry.
+        """
+        self.__check_open(downlink_view, 'get')
+
+        if isinstance(downlink_view, _ValueDownlinkView):
+            return await downlink_view._get_value() if wait_sync else downlink_view._value
+        elif isinstance(downlink_view, _MapDownlinkView):
+            if not wait_sync:
+                return downlink_view._map(key)
+            elif key is None:
+                return await downlink_view._get_all_values()
+            else:
+                return await downlink_view._get_value(key)
+        else:
+            raise TypeError(f'Downlink of type "{type(downlink_view).__name__}" does not support "get"!')
+
+    async def set(self, downlink_view: '_ValueDownlinkView', value: Any) -> None:
+        """
+        Set the value of the lane of a value downlink and wait until it has been sent to the server.
+
+        :param downlink_view:   - Value downlink view.
+        :param value:           - New value for the lane of the remote agent.
+        """
+        self.__check_open(downlink_view, 'set')
+        await downlink_view._send_message(value)
+
+    async def put(self, downlink_view: '_MapDownlinkView', key: Any, value: Any) -> None:
+        """
+        Put an entry in the lane of a map downlink and wait until it has been sent to the server.
+
+        :param downlink_view:   - Map downlink view.
+        :param key:             - Entry key.
+        :param value:           - Entry value.
+        """
+        self.__check_open(downlink_view, 'put')
+        await downlink_view._put_message(key, value)
+
+    async def remove(self, downlink_view: '_MapDownlinkView', key: Any) -> None:
+        """
+        Remove an entry from the lane of a map downlink and wait until it has been sent to the server.
+
+        :param downlink_view:   - Map downlink view.
+        :param key:             - Entry key.
+        """
+        self.__check_open(downlink_view, 'remove')
+        await downlink_view._remove_message(key)
+
+    def _pending_tasks(self) -> set:
+        """
+        Return the drainable tasks scheduled by the client that have not yet completed. Other tasks on the loop of the
+        caller are ignored.
+
+        :return:                - Set of pending tasks.
+        """
+        return set(self.__drainable_tasks)
+
+    @after_started
+    def _schedule_task(self, task: Callable, *args: Any, drainable: bool = True) -> 'asyncio.Task':
+        """
+        Schedule a task for execution in the asyncio loop of the caller.
+
+        :param task:            - Coroutine to be executed in the asyncio loop.
+        :param args:            - Arguments to be passed to the coroutine.
+        :param drainable:       - If False, the task is not waited for when the client is drained, e.g. because it only
+                                  completes when the connections are closed.
+        :return:                - Task object that holds information about the task execution and final result.
+        """
+        try:
+            future = self._loop.create_task(task(*args))
+            self.__tasks.add(future)
+            future.add_done_callback(self.__tasks.discard)
+
+            if drainable:
+                self.__drainable_tasks.add(future)
+                future.add_done_callback(self.__drainable_tasks.discard)
+
+            future.add_done_callback(self._exception_handler)
+            return future
+        except Exception:
+            exc_type, exc_value, exc_traceback = sys.exc_info()
+            self._handle_exception(exc_value, exc_traceback)
+
+    def _run_task(self, task: Callable, *args: Any) -> Any:
+        """
+        Refuse to wait for a task, as the loop of the caller cannot be blocked. The awaitable methods of the client
+        should be used instead.
+
+        :param task:            - Coroutine that would be executed.
+        :param args:            - Arguments that would be passed to the coroutine.
+        """
+        raise Exception(f'Cannot wait for "{task.__name__}" with the asynchronous client! Use the awaitable methods of '
+                        f'the client instead.')
+
+    def _check_blocking(self, name: str) -> None:
+        """
+        Refuse to block until a method of a downlink view has completed, as the loop of the caller cannot be blocked.
+
+        :param name:            - Name of the method.
+        """
+        if hasattr(AsyncSwimClient, name):
+            raise Exception(f'Cannot block on "{name}" with the asynchronous client! Use "await client.{name}(...)" '
+                            f'instead.')
+
+        raise Exception(f'Cannot block on "{name}" with the asynchronous client! Use "async for event in '
+                        f'downlink.events()" instead.')
+
+    @staticmethod
+    def __check_open(downlink_view: '_DownlinkView', name: str) -> None:
+        """
+        Check that a downlink has been opened before executing a method on it.
+
+        :param downlink_view:   - Downlink view to check.
+        :param name:            - Name of the method.
+        """
+        if not downlink_view._is_open:
+            raise Exception(f'Cannot execute "{name}" before the downlink has been opened!')
@@ -15,9 +15,10 @@
 import asyncio
 import websockets
 
+from concurrent.futures import Executor
 from enum import Enum
 from swimai.warp._warp import _Envelope
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List
 
 if TYPE_CHECKING:
     from ._downlinks._downlinks import _DownlinkModel
@@ -26,8 +27,9 @@ if TYPE_CHECKING:
 
 class _ConnectionPool:
 
-    def __init__(self) -> None:
+    def __init__(self, decode_executor: 'Executor' = None) -> None:
         self.__connections = dict()
+        self.__decode_executor = decode_executor
 
     @property
     def _size(self) -> int:
@@ -45,22 +47,39 @@ class _ConnectionPool:
         connection = self.__connections.get(host_uri)
 
         if connection is None or connection.status == _ConnectionStatus.CLOSED:
-            connection = _WSConnection(host_uri, scheme)
+            connection = _WSConnection(host_uri, scheme, self.__decode_executor)
             self.__connections[host_uri] = connection
 
         return connection
 
-    async def _remove_connection(self, host_uri: str) -> None:
+    async def _remove_connection(self, host_uri: str, close_timeout: float = 0.1) -> None:
         """
         Remove a connection from the pool.
 
         :param host_uri:        - URI of the connection host.
+        :param close_timeout:   - Maximum time in seconds to wait for the closing handshake of the connection.
         """
         connection = self.__connections.get(host_uri)
 
         if connection:
             self.__connections.pop(host_uri)
-            await connection._close()
+            await connection._close(close_timeout)
+
+    async def _close_connections(self, close_timeout: float = 0.1) -> None:
+        """
+        Close and remove all connections from the pool concurrently.
+
+        :param close_timeout:   - Maximum time in seconds to wait for the closing handshakes of the connections.
+        """
+        await asyncio.gather(*[self._remove_connection(host_uri, close_timeout) for host_uri in
+                               list(self.__connections.keys())])
+
+    def _stop_receiving(self) -> None:
+        """
+        Stop delivering the messages received by the connections of the pool to their subscribers.
+        """
+        for connection in self.__connections.values():
+            connection._stop_receiving()
 
     async def _add_downlink_view(self, downlink_view: '_DownlinkView') -> None:
         """
@@ -92,15 +111,75 @@ class _ConnectionPool:
             if connection.status == _ConnectionStatus.CLOSED:
                 await self._remove_connection(host_uri)
 
+    async def _add_downlink_views(self, downlink_views: List['_DownlinkView']) -> None:
+        """
+        Subscribe multiple downlink views to connections from the pool. The views are grouped by host and the views
+        of each host are subscribed to its connection in a single task, concurrently with the other hosts.
+
+        :param downlink_views:  - Downlink views to subscribe to connections.
+        """
+        await asyncio.gather(*[self.__add_host_views(views) for views in _group_by_host(downlink_views)])
+
+    async def _remove_downlink_views(self, downlink_views: List['_DownlinkView']) -> None:
+        """
+        Unsubscribe multiple downlink views from connections from the pool. The views are grouped by host and the
+        views of each host are unsubscribed from its connection in a single task, concurrently with the other hosts.
+
+        :param downlink_views:  - Downlink views to unsubscribe from connections.
+        """
+        await asyncio.gather(*[self.__remove_host_views(views) for views in _group_by_host(downlink_views)])
+
+    async def __add_host_views(self, downlink_views: List['_DownlinkView']) -> None:
+        host_uri = downlink_views[0]._host_uri
+        scheme = downlink_views[0]._scheme
+        connection = await self._get_connection(host_uri, scheme)
+
+        for downlink_view in downlink_views:
+            downlink_view._connection = connection
+
+        await connection._subscribe_many(downlink_views)
+
+    async def __remove_host_views(self, downlink_views: List['_DownlinkView']) -> None:
+        connection: '_WSConnection'
+
+        host_uri = downlink_views[0]._host_uri
+        connection = self.__connections.get(host_uri)
+
+        if connection:
+            await connection._unsubscribe_many(downlink_views)
+
+            if connection.status == _ConnectionStatus.CLOSED:
+                await self._remove_connection(host_uri)
+
+
+def _group_by_host(downlink_views: List['_DownlinkView']) -> List[List['_DownlinkView']]:
+    """
+    Group downlink views by the URI of their host, keeping the order of the views.
+
+    :param downlink_views:  - Downlink views to group.
+    :return:                - Lists of the downlink views of each host.
+    """
+    hosts = dict()
+
+    for downlink_view in downlink_views:
+        hosts.setdefault(downlink_view._host_uri, []).append(downlink_view)
+
+    return list(hosts.values())
+
 
 class _WSConnection:
+    _DECODE_BATCH_SIZE = 256
+    _MAX_PENDING_FRAMES = 4096
+    _MAX_PENDING_BATCHES = 4
 
-    def __init__(self, host_uri: str, scheme: str) -> None:
+    def __init__(self, host_uri: str, scheme: str, decode_executor: 'Executor' = None) -> None:
         self.host_uri = host_uri
         self.scheme = scheme
         self.connected = asyncio.Event()
         self.websocket = None
         self.status = _ConnectionStatus.CLOSED
+        self.decode_executor = decode_executor
+        self.receiving = True
 
         self.__subscribers = _DownlinkManagerPool()
 
@@ -120,15 +199,36 @@ class _WSConnection:
             self.status = _ConnectionStatus.IDLE
             self.connected.set()
 
-    async def _close(self) -> None:
+    async def _close(self, close_timeout: float = 0.1) -> None:
         if self.status != _ConnectionStatus.CLOSED:
             self.status = _ConnectionStatus.CLOSED
+            self.__subscribers._close_views()
 
             if self.websocket:
-                self.websocket.close_timeout = 0.1
+                self.websocket.close_timeout = close_timeout
                 await self.websocket.close()
                 self.connected.clear()
 
+    def _stop_receiving(self) -> None:
+        """
+        Stop delivering received events to the subscribers. The connection keeps reading from the socket, so that it
+        can still be closed cleanly, and keeps delivering the responses that establish or end the downlinks, so that
+        pending messages can still be sent. Changes that the downlinks hold back, such as batched map changes, are
+        delivered right away.
+        """
+        self.receiving = False
+        self.__subscribers._flush_pending()
+
+    def __is_delivered(self, response: '_Envelope') -> bool:
+        """
+        Check if a received envelope should be delivered to the subscribers. Events are discarded once the connection
+        has stopped receiving.
+
+        :param response:        - Envelope received from the remote agent.
+        :return:                - True if the envelope should be delivered, False otherwise.
+        """
+        return self.receiving or response._tag != 'event'
+
     def _has_subscribers(self) -> bool:
         """
         Check if the connection has any subscribers.
@@ -149,6 +249,33 @@ class _WSConnection:
 
         await self.__subscribers._register_downlink_view(downlink_view)
 
+    async def _subscribe_many(self, downlink_views: List['_DownlinkView']) -> None:
+        """
+        Add multiple downlink views to the subscriber list of the current connection.
+        If there are no subscribers yet, open the connection. The requests for establishing the downlinks are all
+        written to the connection before any of the responses are awaited.
+
+        :param downlink_views:  - Downlink views to add to the subscribers.
+        """
+        if self.__subscribers._size == 0:
+            await self._open()
+
+        for downlink_view in downlink_views:
+            await self.__subscribers._register_downlink_view(downlink_view)
+
+    async def _unsubscribe_many(self, downlink_views: List['_DownlinkView']) -> None:
+        """
+        Remove multiple downlink views from the subscriber list of the current connection.
+        If there are no other subscribers, close the connection.
+
+        :param downlink_views:  - Downlink views to remove from the subscribers.
+        """
+        for downlink_view in downlink_views:
+            await self.__subscribers._deregister_downlink_view(downlink_view)
+
+        if not self._has_subscribers():
+            await self._close()
+
     async def _unsubscribe(self, downlink_view: '_DownlinkView') -> None:
         """
         Remove a downlink view from the subscriber list of the current connection.
@@ -183,13 +310,105 @@ class _WSConnection:
         if self.status == _ConnectionStatus.IDLE:
             self.status = _ConnectionStatus.RUNNING
             try:
-                while self.status == _ConnectionStatus.RUNNING:
-                    message = await self.websocket.recv()
-                    response = _Envelope._parse_recon(message)
-                    await self.__subscribers._receive_message(response)
+                if self.decode_executor is None:
+                    while self.status == _ConnectionStatus.RUNNING:
+                        message = await self.websocket.recv()
+                        response = _Envelope._parse_recon(message)
+
+                        if self.__is_delivered(response):
+                            await self.__subscribers._receive_message(response)
+                else:
+                    await self.__wait_for_decoded_messages()
+            except websockets.exceptions.ConnectionClosed:
+                if self.status != _ConnectionStatus.CLOSED:
+                    raise
             finally:
                 await self._close()
 
+    async def __wait_for_decoded_messages(self) -> None:
+        """
+        Receive messages from the remote agent on the loop, decode them in batches with the decode executor and
+        propagate them to all subscribers in the order in which they were received.
+        Frames that arrive while the previous batches are decoded are combined into the next batch. If the subscribers
+        or the executor fall behind, the pending frames fill up and the connection stops reading from the socket.
+        """
+        loop = asyncio.get_running_loop()
+        frames = asyncio.Queue(self._MAX_PENDING_FRAMES)
+        batches = asyncio.Queue(self._MAX_PENDING_BATCHES)
+        receiver = loop.create_task(self.__receive_frames(frames))
+        decoder = loop.create_task(self.__decode_frames(loop, frames, batches))
+
+        try:
+            while True:
+                batch = await batches.get()
+
+                if batch is None:
+                    break
+
+                for response in await batch:
+                    if self.__is_delivered(response):
+                        await self.__subscribers._receive_message(response)
+
+            await receiver
+        finally:
+            receiver.cancel()
+            decoder.cancel()
+
+    async def __receive_frames(self, frames: 'asyncio.Queue') -> None:
+        """
+        Receive frames from the WebSocket connection until the connection stops running or fails.
+        A None frame is added at the end, unless the receiver is cancelled.
+
+        :param frames:          - Queue of the frames that are waiting to be decoded.
+        """
+        try:
+            while self.status == _ConnectionStatus.RUNNING:
+                await frames.put(await self.websocket.recv())
+        except Exception:
+            await frames.put(None)
+            raise
+
+        await frames.put(None)
+
+    async def __decode_frames(self, loop: 'asyncio.AbstractEventLoop', frames: 'asyncio.Queue',
+                              batches: 'asyncio.Queue') -> None:
+        """
+        Submit the frames that are waiting to be decoded to the decode executor in batches. The futures of the batches
+        are added to a queue in order, followed by a None item after the last frame.
+
+        :param loop:            - Loop of the connection.
+        :param frames:          - Queue of the frames that are waiting to be decoded.
+        :param batches:         - Queue of the futures of the decoded batches.
+        """
+        while True:
+            frame = await frames.get()
+            batch = []
+
+            while frame is not None:
+                batch.append(frame)
+
+                if len(batch) >= self._DECODE_BATCH_SIZE or frames.empty():
+                    break
+
+                frame = frames.get_nowait()
+
+            if batch:
+                await batches.put(loop.run_in_executor(self.decode_executor, _decode_messages, batch))
+
+            if frame is None:
+                await batches.put(None)
+                return
+
+
+def _decode_messages(messages: List[str]) -> List['_Envelope']:
+    """
+    Decode a batch of messages into envelopes. Defined at module level, so that it can be used by process pools.
+
+    :param messages:        - Recon messages received from the remote agent.
+    :return:                - Envelopes of the messages.
+    """
+    return [_Envelope._parse_recon(message) for message in messages]
+
 
 class _ConnectionStatus(Enum):
     CLOSED = 0
@@ -239,6 +458,21 @@ class _DownlinkManagerPool:
             if downlink_manager._view_count == 0:
                 self.__downlink_managers.pop(downlink_view.route)
 
+    def _close_views(self) -> None:
+        """
+        Set the status of the downlink views of all managers in the pool to closed.
+        """
+        for downlink_manager in self.__downlink_managers.values():
+            downlink_manager._close_views()
+
+    def _flush_pending(self) -> None:
+        """
+        Schedule the delivery of the changes that the downlink models of all managers in the pool hold back.
+        """
+        for downlink_manager in self.__downlink_managers.values():
+            if downlink_manager.downlink_model is not None:
+                downlink_manager.downlink_model._flush_pending()
+
     async def _receive_message(self, message: '_Envelope') -> None:
         """
         Route a received message for the given host URI to the downlink manager for the corresponding
@@ -322,6 +556,7 @@ class _DownlinkManager:
         """
         if hash(downlink_view) in self.__downlink_views:
             self.__downlink_views.pop(hash(downlink_view))
+            downlink_view._close_events()
 
             if self._view_count == 0:
                 await self._close()
@@ -340,8 +575,8 @@ class _DownlinkManager:
         """
         Execute the `did_set` method of all value downlink views of the downlink manager.
 
-        :param current_value:       - The new value of the downlink.
-        :param old_value:           - The previous value of the downlink.
+        :param current_value:       - The new value of the downlink as a Value object.
+        :param old_value:           - The previous value of the downlink as a Value object.
         """
         for view in self.__downlink_views.values():
             await view._execute_did_set(current_value, old_value)
@@ -350,7 +585,7 @@ class _DownlinkManager:
         """
         Execute the `on_event` method of all event downlink views of the downlink manager.
 
-        :param event:       - Event from the remote lane.
+        :param event:       - Event from the remote lane as a Value object.
         """
 
         for view in self.__downlink_views.values():
@@ -360,9 +595,9 @@ class _DownlinkManager:
         """
         Execute the `did_update` method of all map downlink views of the downlink manager.
 
-        :param key:                 - The key of the entry.
-        :param new_value:           - The new value of entry.
-        :param old_value:           - The previous value of the entry.
+        :param key:                 - The key of the entry as a Value object.
+        :param new_value:           - The new value of entry as a Value object.
+        :param old_value:           - The previous value of the entry as a Value object.
         """
         for view in self.__downlink_views.values():
             await view._execute_did_update(key, new_value, old_value)
@@ -371,18 +606,29 @@ class _DownlinkManager:
         """
          Execute the `did_remove` method of all map downlink views of the downlink manager.
 
-         :param key:                 - The key of the entry.
-         :param old_value:           - The previous value of the entry.
+         :param key:                 - The key of the entry as a Value object.
+         :param old_value:           - The previous value of the entry as a Value object.
          """
         for view in self.__downlink_views.values():
             await view._execute_did_remove(key, old_value)
 
+    async def _subscribers_did_update_batch(self, changes: list) -> None:
+        """
+        Execute the `did_update_batch` method of all map downlink views of the downlink manager.
+
+        :param changes:             - List of `(key, new_value, old_value)` tuples of Value objects with the net change
+                                      of each entry.
+        """
+        for view in self.__downlink_views.values():
+            await view._execute_did_update_batch(changes)
+
     def _close_views(self) -> None:
         """
         Set the status of all downlink views of the current manager to closed.
         """
         for view in self.__downlink_views.values():
             view._is_open = False
+            view._close_events()
 
 
 class _DownlinkManagerStatus(Enum):
@@ -13,16 +13,19 @@
 #  limitations under the License.
 
 import asyncio
-from asyncio import Future
+import heapq
+import weakref
 
 from collections.abc import Callable
+from queue import SimpleQueue, Empty
 from abc import abstractmethod, ABC
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Union
 from swimai.recon import Recon
 from swimai.structures import Value, RecordConverter
 from swimai.warp._warp import _SyncRequest, _CommandMessage, _Envelope, _LinkRequest
 from .._utils import _URI
-from ._utils import before_open, UpdateRequest, RemoveRequest, after_open, validate_callback
+from ._utils import before_open, UpdateRequest, RemoveRequest, after_open, validate_callback, convert_to_async
+from ._indexes import _MapColumns, _SortedKeys, _ValueIndex, _ConvertedEntries
 
 # Imports for type annotations
 if TYPE_CHECKING:
@@ -37,6 +40,8 @@ class _DownlinkModel(ABC):
         self.host_uri = None
         self.node_uri = None
         self.lane_uri = None
+        self.prio = 0.0
+        self.rate = 0.0
         self.task = None
         self.connection = None
         self.linked = asyncio.Event()
@@ -65,11 +70,30 @@ class _DownlinkModel(ABC):
         """
         raise NotImplementedError
 
+    async def _wait_established(self) -> None:
+        """
+        Wait until the remote agent has linked the downlink.
+        """
+        await self.linked.wait()
+
     def _open(self) -> '_DownlinkModel':
-        self.task = self.client._schedule_task(self.connection._wait_for_messages)
-        self.task.add_done_callback(self.__close_views)
+        self.task = self.client._schedule_task(self.connection._wait_for_messages, drainable=False)
         return self
 
+    def _clear_conversions(self) -> None:
+        """
+        Clear the values of the downlink that have been converted into objects, after the registered classes or the
+        strict status of the downlink have changed.
+        """
+        pass
+
+    def _flush_pending(self) -> None:
+        """
+        Schedule the delivery of the changes that the downlink holds back from its subscribers, e.g. before the client
+        is drained.
+        """
+        pass
+
     def _close(self) -> '_DownlinkModel':
         self.client._schedule_task(self.__close)
         return self
@@ -109,13 +133,10 @@ class _DownlinkModel(ABC):
     async def __close(self) -> None:
         self.task.cancel()
 
-    # noinspection PyUnusedLocal
-    def __close_views(self, future: Future) -> None:
-        if self.downlink_manager is not None:
-            self.downlink_manager._close_views()
-
 
 class _DownlinkView(ABC):
+    _FORMATS = ('object', 'value', 'recon')
+    _EVENTS_CLOSED = object()
 
     def __init__(self, client: 'SwimClient') -> None:
         self._client = client
@@ -123,15 +144,22 @@ class _DownlinkView(ABC):
         self._scheme = None
         self._node_uri = None
         self._lane_uri = None
+        self._prio = 0.0
+        self._rate = 0.0
         self._connection = None
         self._model = None
         self._downlink_manager = None
         self._is_open = False
+        self._events = None
+        self._events_consumers = 0
+        self._polled_events = None
+        self._events_closed = False
 
         self.__registered_classes = dict()
         self.__deregistered_classes = set()
         self.__clear_classes = False
         self.__strict = False
+        self.__format = 'object'
 
     @property
     def route(self) -> str:
@@ -157,6 +185,27 @@ class _DownlinkView(ABC):
             self.__strict = strict
         else:
             self._downlink_manager.strict = strict
+            self.__clear_conversions()
+
+    @property
+    def format(self) -> str:
+        """
+        The format is used for the values received by the downlink. With the `object` format, values are converted
+        into Python objects. With the `value` format, values are delivered as Recon records and with the `recon`
+        format as Recon strings, without converting them into objects. Values sent with the `recon` format are
+        parsed from Recon strings. Each view has its own format, so views of the same downlink can receive the same
+        values in different formats.
+
+        :return:                    - The format of the downlink view.
+        """
+        return self.__format
+
+    @format.setter
+    def format(self, downlink_format: str) -> None:
+        if downlink_format not in _DownlinkView._FORMATS:
+            raise Exception(f'Format "{downlink_format}" is not supported!')
+
+        self.__format = downlink_format
 
     @property
     def registered_classes(self) -> dict:
@@ -180,6 +229,73 @@ class _DownlinkView(ABC):
 
         return self
 
+    def events(self, max_batch: int = None, max_size: int = 1000) -> AsyncIterator:
+        """
+        Return an asynchronous iterator over the events received by the downlink, which ends when the downlink is
+        closed. Events are stored in a bounded queue until they are consumed. If the queue is full, the downlink
+        stops reading from its connection until there is space again, so that slow consumers apply backpressure to
+        the remote agent instead of buffering events without limit. All downlinks that share the same connection
+        stop while the queue is full.
+        The queue is detached from the downlink once all of its iterators have ended, raised an exception, been closed
+        with `aclose` or been garbage collected, so that abandoned iterators do not stall the connection.
+
+        Event downlinks return the received events, value downlinks `(new_value, old_value)` tuples and map downlinks
+        `(key, new_value, old_value)` tuples, where removed entries have a new value of Absent.
+
+        :param max_batch:       - If set, return lists with all events that are ready, up to the given number of
+                                  events, instead of single events.
+        :param max_size:        - Maximum number of events stored in the queue of the downlink view.
+        :return:                - Asynchronous iterator over the events or batches of events.
+        """
+        if self._events is None:
+            self._events = asyncio.Queue(max_size)
+
+        return _DownlinkEvents(self, self._events, max_batch)
+
+    def poll(self, max_events: int = 1000, timeout: float = None) -> list:
+        """
+        Return the events received by the downlink since the previous call, up to a maximum, so that synchronous
+        consumers can process them in batches from their own threads. Events are collected from the first call onwards
+        and are handed off through an unbounded thread-safe queue, without waiting for the consumer.
+        This method blocks the calling thread and must not be called from the loop of the client.
+
+        Events have the same format as the events returned by `events`.
+
+        :param max_events:      - Maximum number of events to return.
+        :param timeout:         - Maximum time in seconds to wait for an event, if none are pending.
+                                  If None, wait until an event is received or the downlink is closed.
+        :return:                - List of events. Empty if the timeout has expired or the downlink has been closed.
+        """
+        self._client._check_blocking('poll')
+
+        if self._runs_on_loop():
+            raise Exception('Cannot poll the events of a downlink on the loop of the client! Use "events" instead.')
+
+        if self._polled_events is None:
+            self._polled_events = SimpleQueue()
+
+        events = self._polled_events
+        batch = []
+
+        while not batch:
+            if self._events_closed and events.empty():
+                return batch
+
+            try:
+                event = events.get(timeout=timeout)
+            except Empty:
+                return batch
+
+            while event is not _DownlinkView._EVENTS_CLOSED:
+                batch.append(event)
+
+                if len(batch) >= max_events or events.empty():
+                    break
+
+                event = events.get_nowait()
+
+        return batch
+
     @before_open
     def set_host_uri(self, host_uri: str) -> '_DownlinkView':
         self._host_uri, self._scheme = _URI._parse_uri(host_uri)
@@ -195,6 +311,32 @@ class _DownlinkView(ABC):
         self._lane_uri = lane_uri
         return self
 
+    @before_open
+    def set_prio(self, prio: float) -> '_DownlinkView':
+        """
+        Set the priority of the downlink, which is sent to the remote agent with the request for establishing the
+        downlink. The remote agent can use it to decide which links to serve first when it is under load.
+        Downlinks to the same lane share the priority of the first downlink that has been opened.
+
+        :param prio:                - Priority of the downlink. The default of 0 sends no priority.
+        :return:                    - The downlink view.
+        """
+        self._prio = prio
+        return self
+
+    @before_open
+    def set_rate(self, rate: float) -> '_DownlinkView':
+        """
+        Set the rate of the downlink, which is sent to the remote agent with the request for establishing the
+        downlink. The remote agent can use it to throttle the events of high-volume lanes.
+        Downlinks to the same lane share the rate of the first downlink that has been opened.
+
+        :param rate:                - Rate of the downlink. The default of 0 sends no rate.
+        :return:                    - The downlink view.
+        """
+        self._rate = rate
+        return self
+
     def register_class(self, custom_class: Any) -> None:
         """
         Register a class with the downlink view. The registered classes are used for constructing objects when
@@ -219,6 +361,7 @@ class _DownlinkView(ABC):
             self.__deregistered_classes.add(custom_class.__name__)
         else:
             self._downlink_manager.registered_classes.pop(custom_class.__name__, None)
+            self.__clear_conversions()
 
     def deregister_classes(self, classes_list: list) -> None:
         for custom_class in classes_list:
@@ -231,6 +374,7 @@ class _DownlinkView(ABC):
         if self._downlink_manager is not None:
             self.__deregistered_classes.update(set(self._downlink_manager.registered_classes.keys()))
             self._downlink_manager.registered_classes.clear()
+            self.__clear_conversions()
         else:
             self.__clear_classes = True
             self.__registered_classes.clear()
@@ -267,6 +411,8 @@ class _DownlinkView(ABC):
         model.host_uri = self._host_uri
         model.node_uri = self._node_uri
         model.lane_uri = self._lane_uri
+        model.prio = self._prio
+        model.rate = self._rate
 
     async def _assign_manager(self, manager: '_DownlinkManager') -> None:
         """
@@ -286,13 +432,170 @@ class _DownlinkView(ABC):
 
         manager.strict = self.strict
         self._downlink_manager = manager
+        self._events_closed = False
+
+    def _has_event_consumers(self) -> bool:
+        """
+        Check if the events of the downlink view are consumed, either by asynchronous iterators or by polling.
+
+        :return:                    - True if the events are consumed, False otherwise.
+        """
+        return self._events is not None or self._polled_events is not None
+
+    async def _put_event(self, event: Any) -> None:
+        """
+        Add an event to the queues of the downlink view, if its events are consumed. Wait while the queue of the
+        asynchronous iterator is full.
+
+        :param event:               - Event received by the downlink.
+        """
+        if self._polled_events is not None:
+            self._polled_events.put(event)
+
+        if self._events is not None:
+            await self._events.put(event)
+
+    async def _next_events(self, max_batch: int) -> list:
+        """
+        Wait for the next events of the downlink view and return all events that are ready, up to a maximum.
+
+        :param max_batch:           - Maximum number of events to return.
+        :return:                    - List of events or an empty list if the downlink view has been closed.
+        """
+        events = self._events
+        batch = []
+
+        while not batch:
+            if self._events_closed and events.empty():
+                return batch
+
+            event = await events.get()
+
+            while event is not _DownlinkView._EVENTS_CLOSED:
+                batch.append(event)
+
+                if len(batch) >= max_batch or events.empty():
+                    break
+
+                event = events.get_nowait()
+
+        return batch
+
+    def _close_events(self) -> None:
+        """
+        Mark the events of the downlink view as closed and wake up the consumers waiting for them.
+        """
+        self._events_closed = True
+
+        if self._polled_events is not None:
+            self._polled_events.put(_DownlinkView._EVENTS_CLOSED)
+
+        if self._events is not None and not self._events.full():
+            self._events.put_nowait(_DownlinkView._EVENTS_CLOSED)
+
+    def _to_object(self, record: 'Value') -> Any:
+        """
+        Convert a Recon record received by the downlink, according to the format of the downlink view.
+        Absent values are returned as they are.
+
+        :param record:              - Recon record to convert.
+        :return:                    - The record itself, its Recon string or the object represented by the record.
+        """
+        if self.__format == 'value' or record is Value.absent():
+            return record
+        elif self.__format == 'recon':
+            return Recon.to_string(record)
+        else:
+            return RecordConverter.get_converter().record_to_object(record, self.registered_classes, self.strict)
+
+    def _to_record(self, obj: Any) -> 'Value':
+        """
+        Convert an object sent by the downlink into a Recon record, according to the format of the downlink.
+
+        :param obj:                 - Object to convert.
+        :return:                    - Recon record representing the object.
+        """
+        if self.format == 'recon' and isinstance(obj, str):
+            return Recon.parse(obj)
+        else:
+            return RecordConverter.get_converter().object_to_record(obj)
+
+    def _is_synced(self) -> bool:
+        """
+        Check if the downlink model of the view has been synced with the remote agent. The flag is only ever set from
+        the loop of the client, so it can be read from any thread.
+
+        :return:                    - True if the model of the downlink has been synced, False otherwise.
+        """
+        return self._model is not None and self._model._synced.is_set()
+
+    def _runs_on_loop(self) -> bool:
+        """
+        Check if the caller is running on the loop of the client, for example in a callback of the downlink.
+
+        :return:                    - True if the caller is running on the loop of the client, False otherwise.
+        """
+        try:
+            return asyncio.get_running_loop() is self._client._loop
+        except RuntimeError:
+            return False
+
+    def _call_on_loop(self, function: Callable, *args: Any) -> Any:
+        """
+        Call a function on the loop of the client and return its result. If the caller is already running on the
+        loop, the function is called directly, as waiting for the loop from the loop itself would never return.
+
+        :param function:            - Function to call.
+        :param args:                - Arguments passed to the function.
+        :return:                    - The return value of the function.
+        """
+        if self._runs_on_loop():
+            return function(*args)
+
+        return self._client._run_task(convert_to_async(function), *args)
+
+    def _release_events(self, events: 'asyncio.Queue') -> None:
+        """
+        Release the queue of an iterator over the events of the downlink view. When the last iterator is released, the
+        queue is detached and emptied on the loop of the client, so that a downlink waiting for space can continue.
+
+        :param events:              - Queue of the released iterator.
+        """
+        self._events_consumers -= 1
+
+        if self._events_consumers > 0:
+            return
+
+        loop = self._client._loop
+
+        if loop is None or loop.is_closed() or self._runs_on_loop():
+            self.__detach_events(events)
+        else:
+            loop.call_soon_threadsafe(self.__detach_events, events)
+
+    def __detach_events(self, events: 'asyncio.Queue') -> None:
+        if self._events is events and self._events_consumers == 0:
+            self._events = None
+
+        while not events.empty():
+            events.get_nowait()
+
+    def __clear_conversions(self) -> None:
+        """
+        Clear the values of the downlink model that have been converted into objects, after the registered classes or
+        the strict status of the downlink have changed.
+        """
+        if self._model is not None:
+            self._model._clear_conversions()
 
     def __register_class(self, custom_class: Any) -> None:
         try:
-            custom_class()
+            if not RecordConverter.get_converter()._get_codec(custom_class)._can_create_objects():
+                raise Exception(f'Class "{custom_class.__name__}" cannot be created from a record.')
 
             if self._downlink_manager is not None:
                 self._downlink_manager.registered_classes[custom_class.__name__] = custom_class
+                self.__clear_conversions()
             else:
                 self.__registered_classes[custom_class.__name__] = custom_class
                 self.__deregistered_classes.discard(custom_class.__name__)
@@ -301,18 +604,61 @@ class _DownlinkView(ABC):
                 f'Class "{custom_class.__name__}" must have a default constructor or default values for all arguments!')
 
 
+class _DownlinkEvents:
+    """
+    Asynchronous iterator over the events of a downlink view. Events are consumed directly if the iterator runs on the
+    loop of the client and through a task on the loop of the client otherwise.
+    """
+
+    def __init__(self, downlink_view: '_DownlinkView', events: 'asyncio.Queue', max_batch: Optional[int]) -> None:
+        self._downlink_view = downlink_view
+        self._max_batch = max_batch
+
+        downlink_view._events_consumers += 1
+        self.__release = weakref.finalize(self, downlink_view._release_events, events)
+        self.__release.atexit = False
+
+    def __aiter__(self) -> '_DownlinkEvents':
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self.__release.alive:
+            raise StopAsyncIteration
+
+        downlink_view = self._downlink_view
+        max_batch = self._max_batch or 1
+
+        try:
+            if downlink_view._runs_on_loop():
+                batch = await downlink_view._next_events(max_batch)
+            else:
+                batch = await asyncio.wrap_future(downlink_view._client._schedule_task(downlink_view._next_events,
+                                                                                       max_batch, drainable=False))
+        except BaseException:
+            self.__release()
+            raise
+
+        if not batch:
+            self.__release()
+            raise StopAsyncIteration
+
+        return batch[0] if self._max_batch is None else batch
+
+    async def aclose(self) -> None:
+        """
+        Stop the iterator and release its queue.
+        """
+        self.__release()
+
+
 class _EventDownlinkModel(_DownlinkModel):
 
     async def _establish_downlink(self) -> None:
-        link_request = _LinkRequest(self.node_uri, self.lane_uri)
+        link_request = _LinkRequest(self.node_uri, self.lane_uri, self.prio, self.rate)
         await self.connection._send_message(link_request._to_recon())
 
     async def _receive_event(self, message: _Envelope) -> None:
-        converter = RecordConverter.get_converter()
-        event = converter.record_to_object(message._body, self.downlink_manager.registered_classes,
-                                           self.downlink_manager.strict)
-
-        await self.downlink_manager._subscribers_on_event(event)
+        await self.downlink_manager._subscribers_on_event(message._body)
 
     async def _receive_synced(self) -> None:
         raise TypeError('Event downlink does not support synced responses!')
@@ -347,11 +693,18 @@ class _EventDownlinkView(_DownlinkView):
         """
         Execute the custom `on_event` callback of the current downlink view.
 
-        :param event:       - The event received by the downlink.
+        :param event:       - The event received by the downlink as a Value object.
         """
+        if self._on_event_callback is None and not self._has_event_consumers():
+            return
+
+        event = self._to_object(event)
+
         if self._on_event_callback:
             self._client._schedule_task(self._on_event_callback, event)
 
+        await self._put_event(event)
+
 
 class _ValueDownlinkModel(_DownlinkModel):
 
@@ -361,7 +714,7 @@ class _ValueDownlinkModel(_DownlinkModel):
         self._synced = asyncio.Event()
 
     async def _establish_downlink(self) -> None:
-        sync_request = _SyncRequest(self.node_uri, self.lane_uri)
+        sync_request = _SyncRequest(self.node_uri, self.lane_uri, self.prio, self.rate)
         await self.connection._send_message(sync_request._to_recon())
 
     async def _receive_event(self, message: '_Envelope') -> None:
@@ -370,6 +723,12 @@ class _ValueDownlinkModel(_DownlinkModel):
     async def _receive_synced(self) -> None:
         self._synced.set()
 
+    async def _wait_established(self) -> None:
+        """
+        Wait until the remote agent has synced the downlink.
+        """
+        await self._synced.wait()
+
     async def _send_message(self, message: '_Envelope') -> None:
         """
         Send a message to the remote agent of the downlink.
@@ -395,9 +754,7 @@ class _ValueDownlinkModel(_DownlinkModel):
         :return:
         """
         old_value = self._value
-        converter = RecordConverter.get_converter()
-        self._value = converter.record_to_object(message._body, self.downlink_manager.registered_classes,
-                                                 self.downlink_manager.strict)
+        self._value = message._body
 
         await self.downlink_manager._subscribers_did_set(self._value, old_value)
 
@@ -408,6 +765,7 @@ class _ValueDownlinkView(_DownlinkView):
         super().__init__(client)
         self._did_set_callback = None
         self._initialised = asyncio.Event()
+        self.__converted_value = (Value.absent(), 'value', Value.absent())
 
     @after_open
     def get(self, wait_sync: bool = False) -> Any:
@@ -418,9 +776,9 @@ class _ValueDownlinkView(_DownlinkView):
                                   If False, return immediately.
         :return:                - The value of the Downlink.
         """
-        if wait_sync:
-            task = self._client._schedule_task(self.__get_value)
-            return task.result()
+        if wait_sync and not self._is_synced():
+            self._client._check_blocking('get')
+            return self._client._run_task(self._get_value)
         else:
             return self._value
 
@@ -432,10 +790,11 @@ class _ValueDownlinkView(_DownlinkView):
         :param blocking:        - If True, block until the value has been sent to the server.
         :param value:           - New value for the lane of the remote agent.
         """
-        task = self._client._schedule_task(self._send_message, value)
-
         if blocking:
-            task.result()
+            self._client._check_blocking('set')
+            self._client._run_task(self._send_message, value)
+        else:
+            self._client._schedule_task(self._send_message, value)
 
     def did_set(self, function: Callable) -> '_ValueDownlinkView':
         """
@@ -451,8 +810,15 @@ class _ValueDownlinkView(_DownlinkView):
     def _value(self) -> 'Any':
         if self._model is None:
             return Value.absent()
-        else:
-            return self._model._value
+
+        record = self._model._value
+        converted_record, converted_format, converted_value = self.__converted_value
+
+        if record is not converted_record or self.format != converted_format:
+            converted_value = self._to_object(record)
+            self.__converted_value = (record, self.format, converted_value)
+
+        return converted_value
 
     async def _register_manager(self, manager: '_DownlinkManager') -> None:
         await self._assign_manager(manager)
@@ -474,7 +840,7 @@ class _ValueDownlinkView(_DownlinkView):
         :param value:           - New value for the lane of the remote agent.
         """
         await self._initialised.wait()
-        recon = RecordConverter.get_converter().object_to_record(value)
+        recon = self._to_record(value)
         message = _CommandMessage(self._node_uri, self._lane_uri, recon)
 
         await self._model._send_message(message)
@@ -484,15 +850,23 @@ class _ValueDownlinkView(_DownlinkView):
         """
         Execute the custom `did_set` callback of the current downlink view.
 
-        :param current_value:       - The new value of the downlink.
-        :param old_value:           - The previous value of the downlink.
+        :param current_value:       - The new value of the downlink as a Value object.
+        :param old_value:           - The previous value of the downlink as a Value object.
         """
+        if self._did_set_callback is None and not self._has_event_consumers():
+            return
+
+        current_value = self._to_object(current_value)
+        old_value = self._to_object(old_value)
+
         if self._did_set_callback:
             self._client._schedule_task(self._did_set_callback, current_value, old_value)
 
-    async def __get_value(self) -> 'Any':
+        await self._put_event((current_value, old_value))
+
+    async def _get_value(self) -> 'Any':
         await self._initialised.wait()
-        return await self._model._get_value()
+        return self._to_object(await self._model._get_value())
 
 
 class _MapDownlinkModel(_DownlinkModel):
@@ -501,9 +875,16 @@ class _MapDownlinkModel(_DownlinkModel):
         super().__init__(client)
         self._map = {}
         self._synced = asyncio.Event()
+        self._batch_window = None
+        self._batch = {}
+        self._batch_handle = None
+        self._columns = None
+        self._sorted = None
+        self._indexes = {}
+        self._conversions = {}
 
     async def _establish_downlink(self) -> None:
-        sync_request = _SyncRequest(self.node_uri, self.lane_uri)
+        sync_request = _SyncRequest(self.node_uri, self.lane_uri, self.prio, self.rate)
         await self.connection._send_message(sync_request._to_recon())
 
     async def _receive_event(self, message: '_Envelope') -> None:
@@ -515,6 +896,15 @@ class _MapDownlinkModel(_DownlinkModel):
     async def _receive_synced(self) -> None:
         self._synced.set()
 
+        if self._batch_window is not None:
+            await self._flush_batch()
+
+    async def _wait_established(self) -> None:
+        """
+        Wait until the remote agent has synced the downlink.
+        """
+        await self._synced.wait()
+
     async def _send_message(self, message: '_Envelope') -> None:
         """
         Send a message to the remote agent of the downlink.
@@ -524,11 +914,11 @@ class _MapDownlinkModel(_DownlinkModel):
         await self.linked.wait()
         await self.connection._send_message(message._to_recon())
 
-    async def _get_value(self, key) -> Any:
+    async def _get_value(self, key: Value) -> Any:
         """
         Get a value from the map of the downlink using a given key, after it has been synced.
 
-        :param key              - The key of the entry.
+        :param key              - The key of the entry as a Value object.
         :return:                - The current value of the downlink.
         """
         return self._map.get(key, (Value.absent(), Value.absent()))[1]
@@ -541,30 +931,217 @@ class _MapDownlinkModel(_DownlinkModel):
         """
         return list(self._map.values())
 
+    def _get_conversion(self, downlink_format: str) -> '_ConvertedEntries':
+        """
+        Return the converted entries of the map for a format of the downlink views, which are shared by all views with
+        the same format. Must be called on the loop of the client.
+
+        :param downlink_format: - Format of the downlink views, either `object` or `recon`.
+        :return:                - The converted entries of the map.
+        """
+        conversion = self._conversions.get(downlink_format)
+
+        if conversion is None:
+            conversion = _ConvertedEntries(self.__get_converter(downlink_format))
+            self._conversions[downlink_format] = conversion
+
+        return conversion
+
+    def _get_converted(self, downlink_format: str) -> list:
+        """
+        Return all entries of the map converted into a format of the downlink views. Must be called on the loop of the
+        client.
+
+        :param downlink_format: - Format of the downlink views, either `object` or `recon`.
+        :return:                - List of converted `(key, value)` tuples.
+        """
+        return self._get_conversion(downlink_format)._get_all(self._map)
+
+    def _clear_conversions(self) -> None:
+        self._conversions = {}
+
+        if self._columns is not None:
+            self._columns._clear_converted_keys()
+
+    def __get_converter(self, downlink_format: str) -> Callable:
+        """
+        Return a function that converts the keys and values of the map into a format of the downlink views, with the
+        registered classes and the strict status of the downlink manager. Absent values are returned as they are.
+
+        :param downlink_format: - Format of the downlink views, either `object` or `recon`.
+        :return:                - Function that receives a Value object and returns the converted value.
+        """
+        manager = self.downlink_manager
+        converter = RecordConverter.get_converter()
+
+        def convert(record: 'Value') -> Any:
+            if record is Value.absent():
+                return record
+            elif downlink_format == 'recon':
+                return Recon.to_string(record)
+            else:
+                return converter.record_to_object(record, manager.registered_classes, manager.strict)
+
+        return convert
+
+    def _get_columns(self, fields: list, downlink_format: str = 'value', convert: Callable = None) -> tuple:
+        """
+        Return a snapshot of the numeric columns for the given fields of the map values. If the fields are not
+        extracted as columns yet, start maintaining them. Must be called on the loop of the client.
+
+        :param fields:          - Names of the fields to extract as columns.
+        :param downlink_format: - Format of the downlink view that the keys are converted into.
+        :param convert:         - Function that converts a key into the format, or None to return the keys as they are.
+        :return:                - Tuple with the tuple of keys in row order and a dictionary with the name of each field
+                                  and a memoryview of its column.
+        """
+        if self._columns is None:
+            self._columns = _MapColumns(fields, self._map)
+        elif not self._columns._has_fields(fields):
+            self._columns._add_fields(fields, self._map)
+
+        return self._columns._snapshot(fields, downlink_format, convert)
+
+    def _track_sorted(self) -> '_SortedKeys':
+        """
+        Start maintaining the keys of the map in sorted order. Must be called on the loop of the client.
+
+        :return:                - The sorted keys of the map.
+        """
+        if self._sorted is None:
+            self._sorted = _SortedKeys(self._map.keys())
+
+        return self._sorted
+
+    def _query_sorted(self, query: Callable) -> list:
+        """
+        Run a query on the sorted keys of the map and return the matching entries. The sorted keys are only modified on
+        the loop of the client, so the query must be called on the loop of the client as well.
+
+        :param query:           - Function that receives the sorted keys and returns a list of matching keys.
+        :return:                - List of `(key, entry)` tuples of the matching keys, with the entries as Value objects.
+        """
+        entries = list()
+
+        for key_value in query(self._track_sorted()):
+            entry = self._map.get(key_value)
+
+            if entry is not None:
+                entries.append((key_value, entry))
+
+        return entries
+
+    def _add_index(self, name: str, extractor: Union[str, Callable]) -> '_ValueIndex':
+        """
+        Start maintaining a secondary index on the map values, if an index with the same name does not exist already.
+        Must be called on the loop of the client.
+
+        :param name:            - Name of the index.
+        :param extractor:       - Name of the indexed field or a function that receives a value and returns the
+                                  indexed value.
+        :return:                - The secondary index with the given name.
+        """
+        if name not in self._indexes:
+            self._indexes[name] = _ValueIndex(extractor, self._map)
+
+        return self._indexes[name]
+
+    def _flush_pending(self) -> None:
+        if self._batch_handle is not None or self._batch:
+            self.client._schedule_task(self._flush_batch)
+
+    def _close(self) -> '_MapDownlinkModel':
+        """
+        Close the downlink and discard the pending changes, so that no batch is delivered after the downlink is closed.
+        Must be called on the loop of the client.
+        """
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+
+        self._batch = {}
+        return super()._close()
+
+    async def _flush_batch(self) -> None:
+        """
+        Deliver all pending changes to the `did_update_batch` callbacks of the downlink subscribers.
+        """
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+
+        if self._batch:
+            changes = list(self._batch.values())
+            self._batch = {}
+            await self.downlink_manager._subscribers_did_update_batch(changes)
+
+    def _batch_change(self, key_value: Value, new_value: Value, old_value: Value) -> None:
+        """
+        Conflate a change of an entry with the pending changes for the same key. Only the net effect is kept, which is
+        the latest value of the entry and its value before the first pending change. Entries that are both added and
+        removed within the same batch are dropped.
+
+        :param key_value:       - The key of the entry as a Value object.
+        :param new_value:       - The new value of the entry or Absent if it was removed.
+        :param old_value:       - The previous value of the entry.
+        """
+        if self._batch_window is None:
+            return
+
+        change = self._batch.get(key_value)
+
+        if change is None:
+            self._batch[key_value] = (key_value, new_value, old_value)
+        elif change[2] == Value.absent() and new_value == Value.absent():
+            self._batch.pop(key_value)
+        else:
+            self._batch[key_value] = (key_value, new_value, change[2])
+
+        if self._synced.is_set() and self._batch_handle is None:
+            self._batch_handle = asyncio.get_event_loop().call_later(self._batch_window, self.client._schedule_task,
+                                                                     self._flush_batch)
+
     async def __receive_update(self, message: '_Envelope') -> None:
-        key = RecordConverter.get_converter().record_to_object(message._body._get_head().value._get_head().value,
-                                                               self.downlink_manager.registered_classes,
-                                                               self.downlink_manager.strict)
+        key_value = message._body._get_head().value._get_head().value.commit()
+        value = message._body.get_body().commit()
+
+        old_value = await self._get_value(key_value)
+
+        for conversion in self._conversions.values():
+            conversion._update(key_value)
+
+        self._map[key_value] = (key_value, value)
 
-        value = RecordConverter.get_converter().record_to_object(message._body.get_body(),
-                                                                 self.downlink_manager.registered_classes,
-                                                                 self.downlink_manager.strict)
+        if self._columns is not None:
+            self._columns._update(key_value, value)
 
-        recon_key = Recon.to_string(message._body._get_head().value._get_head().value)
-        old_value = await self._get_value(recon_key)
+        if self._sorted is not None:
+            self._sorted._insert(key_value)
 
-        self._map[recon_key] = (key, value)
-        await self.downlink_manager._subscribers_did_update(key, value, old_value)
+        for index in self._indexes.values():
+            index._update(key_value, value)
+
+        await self.downlink_manager._subscribers_did_update(key_value, value, old_value)
+        self._batch_change(key_value, value, old_value)
 
     async def __receive_remove(self, message: '_Envelope') -> None:
-        key = RecordConverter.get_converter().record_to_object(message._body._get_head().value._get_head().value,
-                                                               self.downlink_manager.registered_classes,
-                                                               self.downlink_manager.strict)
+        key_value = message._body._get_head().value._get_head().value.commit()
+        old_value = self._map.pop(key_value, (Value.absent(), Value.absent()))[1]
+
+        for conversion in self._conversions.values():
+            conversion._remove(key_value)
+
+        if self._columns is not None:
+            self._columns._remove(key_value)
 
-        recon_key = Recon.to_string(message._body._get_head().value._get_head().value)
-        old_value = self._map.pop(recon_key, (Value.absent(), Value.absent()))[1]
+        if self._sorted is not None:
+            self._sorted._remove(key_value)
 
-        await self.downlink_manager._subscribers_did_remove(key, old_value)
+        for index in self._indexes.values():
+            index._remove(key_value)
+
+        await self.downlink_manager._subscribers_did_remove(key_value, old_value)
+        self._batch_change(key_value, Value.absent(), old_value)
 
 
 class _MapDownlinkView(_DownlinkView):
@@ -573,24 +1150,193 @@ class _MapDownlinkView(_DownlinkView):
         super().__init__(client)
         self._did_update_callback = None
         self._did_remove_callback = None
+        self._did_update_batch_callback = None
+        self._batch_window = None
+        self._indexes = {}
         self._initialised = asyncio.Event()
 
     @after_open
     def get(self, key: Any, wait_sync: bool = False) -> Any:
-        if wait_sync:
-            task = self._client._schedule_task(self.__get_value, key)
-            return task.result()
+        if wait_sync and not self._is_synced():
+            self._client._check_blocking('get')
+            return self._client._run_task(self._get_value, key)
         else:
             return self._map(key)
 
     @after_open
     def get_all(self, wait_sync: bool = False) -> list:
-        if wait_sync:
-            task = self._client._schedule_task(self.__get_all_values)
-            return task.result()
+        if wait_sync and not self._is_synced():
+            self._client._check_blocking('get')
+            return self._client._run_task(self._get_all_values)
         else:
             return self._map(None)
 
+    @after_open
+    def to_columns(self, fields: list = None) -> tuple:
+        """
+        Return numeric fields of the map values as columns of doubles, together with the keys of the entries in the
+        row order of the columns. The columns are maintained incrementally as updates and removals are received, so
+        only the first call for a given field builds them and later calls return views of the columns without copying.
+        The keys are converted once as well and the same tuple of keys is returned until entries are added or removed.
+        The returned keys and columns are a consistent snapshot that is not modified by events received afterwards.
+        Fields of dictionaries and attributes of objects are supported, values that are numbers themselves are used as
+        they are and all other values are NaN.
+
+        :param fields:          - Names of the fields to return. Defaults to a single `value` column.
+        :return:                - Tuple with the tuple of keys and a dictionary with the name of each field and a
+                                  read-only memoryview of its column.
+        """
+        if fields is None:
+            fields = ['value']
+
+        if self._model is None:
+            return (), {}
+
+        convert = None if self.format == 'value' else self._to_object
+        return self._call_on_loop(self._model._get_columns, fields, self.format, convert)
+
+    @after_open
+    def to_numpy(self, fields: list = None) -> tuple:
+        """
+        Return numeric fields of the map values as NumPy arrays, together with the keys of the entries in the row
+        order of the arrays. The arrays share memory with the snapshot returned by `to_columns` and are therefore
+        read-only. Requires NumPy.
+
+        :param fields:          - Names of the fields to return. Defaults to a single `value` column.
+        :return:                - Tuple with the tuple of keys and a dictionary with the name of each field and a NumPy
+                                  array of its column.
+        """
+        import numpy
+
+        keys, columns = self.to_columns(fields)
+        return keys, {field: numpy.frombuffer(column, dtype=numpy.float64) for field, column in columns.items()}
+
+    @after_open
+    def range(self, lower: Any = None, upper: Any = None) -> list:
+        """
+        Return all entries with keys from a lower bound (inclusive) to an upper bound (exclusive), ordered by key.
+        Numeric keys are ordered before boolean keys, boolean keys before string keys and string keys before
+        object keys. The keys are kept sorted from the first ordered query onwards, so each query takes
+        logarithmic time in the size of the map, plus the number of returned entries.
+
+        :param lower:           - Lower bound of the keys or None for no lower bound.
+        :param upper:           - Upper bound of the keys or None for no upper bound.
+        :return:                - List of `(key, value)` tuples within the bounds.
+        """
+        lower = None if lower is None else self._to_record(lower)
+        upper = None if upper is None else self._to_record(upper)
+
+        return self.__get_entries(lambda keys: keys._range(lower, upper))
+
+    @after_open
+    def prefix(self, prefix: str) -> list:
+        """
+        Return all entries with string keys starting with a given prefix, ordered by key.
+
+        :param prefix:          - The prefix of the keys.
+        :return:                - List of `(key, value)` tuples with keys starting with the prefix.
+        """
+        return self.__get_entries(lambda keys: keys._prefix(prefix))
+
+    @after_open
+    def first(self) -> Any:
+        """
+        Return the entry with the smallest key.
+
+        :return:                - The `(key, value)` tuple with the smallest key or Absent if the map is empty.
+        """
+        entries = self.__get_entries(lambda keys: keys._first())
+        return entries[0] if entries else Value.absent()
+
+    @after_open
+    def last(self) -> Any:
+        """
+        Return the entry with the largest key.
+
+        :return:                - The `(key, value)` tuple with the largest key or Absent if the map is empty.
+        """
+        entries = self.__get_entries(lambda keys: keys._last())
+        return entries[0] if entries else Value.absent()
+
+    @after_open
+    def top_k(self, k: int, by: Callable = None) -> list:
+        """
+        Return the k largest entries. Without a `by` function, the entries with the largest keys are returned in
+        logarithmic time. Otherwise, all entries are ranked by the result of the function.
+
+        :param k:               - Number of entries to return.
+        :param by:              - Function that receives the key and value of an entry and returns its rank.
+        :return:                - List of `(key, value)` tuples in descending order.
+        """
+        if by is None:
+            return self.__get_entries(lambda keys: keys._last(k))
+        elif self._model is None:
+            return []
+        else:
+            entries = self.__get_all()
+            return heapq.nlargest(k, entries, key=lambda entry: by(entry[0], entry[1]))
+
+    def add_index(self, name: str, extractor: Union[str, Callable]) -> '_MapDownlinkView':
+        """
+        Add a secondary index on the values of the downlink. The index is maintained as updates and removals are
+        received and can be queried with `lookup`. Indexes are shared by all views of the same downlink.
+        If the downlink is already open, the index is built on the loop of the client without blocking and the first
+        `lookup` waits for it.
+
+        :param name:            - Name of the index.
+        :param extractor:       - Name of the indexed field or attribute of the values, or a function that receives
+                                  a value and returns the indexed value. Unhashable indexed values are not indexed.
+        :return:                - The current downlink view.
+        """
+        if not isinstance(extractor, str):
+            extractor = self.__convert_extractor(extractor)
+
+        self._indexes[name] = extractor
+
+        if self._model is not None:
+            if self._runs_on_loop():
+                self._model._add_index(name, extractor)
+            else:
+                self._client._schedule_task(convert_to_async(self._model._add_index), name, extractor)
+
+        return self
+
+    @after_open
+    def lookup(self, name: str, value: Any) -> list:
+        """
+        Return all entries with a given indexed value from a secondary index.
+
+        :param name:            - Name of the index.
+        :param value:           - The indexed value.
+        :return:                - List of `(key, value)` tuples with the indexed value.
+        """
+        if self._model is None:
+            return []
+
+        entries = list()
+
+        for key_value in self.__get_index(name)._lookup(value):
+            entry = self._model._map.get(key_value)
+
+            if entry is not None:
+                entries.append(self.__to_entry(key_value, entry))
+
+        return entries
+
+    @after_open
+    def index_memory(self, name: str) -> int:
+        """
+        Return an estimate of the memory used by a secondary index in bytes, excluding the keys and values that
+        are shared with the map.
+
+        :param name:            - Name of the index.
+        :return:                - Size of the index in bytes.
+        """
+        if self._model is None:
+            return 0
+
+        return self.__get_index(name)._memory()
+
     @after_open
     def put(self, key: Any, value: Any, blocking: bool = False) -> None:
         """
@@ -600,10 +1346,11 @@ class _MapDownlinkView(_DownlinkView):
         :param value:           - Entry value.
         :param blocking:        - If True, block until the value has been sent to the server.
         """
-        task = self._client._schedule_task(self.__put_message, key, value)
-
         if blocking:
-            task.result()
+            self._client._check_blocking('put')
+            self._client._run_task(self._put_message, key, value)
+        else:
+            self._client._schedule_task(self._put_message, key, value)
 
     @after_open
     def remove(self, key: Any, blocking: bool = False) -> None:
@@ -613,10 +1360,11 @@ class _MapDownlinkView(_DownlinkView):
         :param key:             - Entry key.
         :param blocking:        - If True, block until the value has been sent to the server.
         """
-        task = self._client._schedule_task(self.__remove_message, key)
-
         if blocking:
-            task.result()
+            self._client._check_blocking('remove')
+            self._client._run_task(self._remove_message, key)
+        else:
+            self._client._schedule_task(self._remove_message, key)
 
     def did_update(self, function: Callable) -> '_MapDownlinkView':
         """
@@ -638,61 +1386,237 @@ class _MapDownlinkView(_DownlinkView):
         self._did_remove_callback = validate_callback(function)
         return self
 
+    def did_update_batch(self, function: Callable, window: float = 0.1) -> '_MapDownlinkView':
+        """
+        Set the `did_update_batch` callback of the current downlink view to a given function.
+        Updates and removals are conflated per key and delivered together, once the initial sync has completed and
+        afterwards at most once per batch window. The callback receives a list of `(key, new_value, old_value)`
+        tuples with the net change of each key. Removed entries have a new value of Absent.
+
+        :param function:   - Function to be called with the batched changes of the downlink.
+        :param window:     - Number of seconds for which changes are accumulated before the callback is called.
+        :return:           - The current downlink view.
+        """
+        self._did_update_batch_callback = validate_callback(function)
+        self.__set_batch_window(window)
+        return self
+
     async def _register_manager(self, manager: '_DownlinkManager') -> None:
         await self._assign_manager(manager)
 
+        if self._batch_window is not None:
+            self.__set_batch_window(self._batch_window)
+
+        for name, extractor in self._indexes.items():
+            self._model._add_index(name, extractor)
+
         if manager._is_open:
             for key, value in self._model._map.values():
                 await self._execute_did_update(key, value, Value.absent())
 
+            if self._model._map:
+                await self._execute_did_update_batch(
+                    [(key, value, Value.absent()) for key, value in self._model._map.values()])
+
         self._initialised.set()
 
     async def _create_downlink_model(self, downlink_manager: '_DownlinkManager') -> '_MapDownlinkModel':
         model = _MapDownlinkModel(self._client)
         await self._initalise_model(downlink_manager, model)
+        model._batch_window = self._batch_window
+
+        for name, extractor in self._indexes.items():
+            model._add_index(name, extractor)
+
         return model
 
     def _map(self, key: Any) -> [Value, dict]:
         if self._model is None:
             return Value.absent()
+        elif key is None:
+            return self.__get_all()
         else:
-            if key is None:
-                return list(self._model._map.values())
-            else:
-                return self._model._map.get(key, (Value.absent(), Value.absent()))[1]
+            key_value = self._to_record(key).commit()
+            entry = self._model._map.get(key_value)
+            return Value.absent() if entry is None else self.__to_entry(key_value, entry)[1]
 
     # noinspection PyAsyncCall
     async def _execute_did_update(self, key: Any, new_value: Any, old_value: Any) -> None:
         """
         Execute the custom `did_update` callback of the current downlink view.
 
-        :param key:             - The entry key of the item.
-        :param new_value:       - The new value of the item.
-        :param old_value:       - The current value of the item.
+        :param key:             - The entry key of the item as a Value object.
+        :param new_value:       - The new value of the item as a Value object.
+        :param old_value:       - The current value of the item as a Value object.
         """
+        if self._did_update_callback is None and not self._has_event_consumers():
+            return
+
+        if not self.__uses_conversions():
+            key, new_value, old_value = self._to_object(key), self._to_object(new_value), self._to_object(old_value)
+        else:
+            conversion = self._model._get_conversion(self.format)
+            previous = conversion._get_previous(key)
+            old_value = self._to_object(old_value) if previous is None else previous[1]
+            key, new_value = conversion._get(key, (key, new_value))
+
         if self._did_update_callback:
             self._client._schedule_task(self._did_update_callback, key, new_value, old_value)
 
+        await self._put_event((key, new_value, old_value))
+
     # noinspection PyAsyncCall
     async def _execute_did_remove(self, key: Any, old_value: Any) -> None:
         """
         Execute the custom `did_remove` callback of the current downlink view.
 
-        :param key:             - The entry key of the item.
-        :param old_value:       - The current value of the item.
+        :param key:             - The entry key of the item as a Value object.
+        :param old_value:       - The current value of the item as a Value object.
         """
+        if self._did_remove_callback is None and not self._has_event_consumers():
+            return
+
+        previous = None
+
+        if self.__uses_conversions():
+            previous = self._model._get_conversion(self.format)._get_previous(key)
+
+        if previous is None:
+            key, old_value = self._to_object(key), self._to_object(old_value)
+        else:
+            key, old_value = previous
+
         if self._did_remove_callback:
             self._client._schedule_task(self._did_remove_callback, key, old_value)
 
-    async def __get_value(self, key: Any) -> Any:
+        await self._put_event((key, Value.absent(), old_value))
+
+    # noinspection PyAsyncCall
+    async def _execute_did_update_batch(self, changes: list) -> None:
+        """
+        Execute the custom `did_update_batch` callback of the current downlink view.
+
+        :param changes:         - List of `(key, new_value, old_value)` tuples with the net change of each entry,
+                                  as Value objects.
+        """
+        if self._did_update_batch_callback:
+            changes = [tuple(self._to_object(item) for item in change) for change in changes]
+            self._client._schedule_task(self._did_update_batch_callback, changes)
+
+    def __set_batch_window(self, window: Optional[float]) -> None:
+        """
+        Set the batch window of the current downlink view and of its model. If multiple views share the same model,
+        the shortest batch window is used.
+
+        :param window:          - Number of seconds for which changes are accumulated.
+        """
+        self._batch_window = window
+
+        if self._model is not None and window is not None:
+            if self._model._batch_window is None or window < self._model._batch_window:
+                self._model._batch_window = window
+
+    def __get_index(self, name: str) -> '_ValueIndex':
+        """
+        Return a secondary index of the downlink. If the index has been added to the view but has not been built by
+        the loop of the client yet, wait for it to be built.
+
+        :param name:            - Name of the index.
+        :return:                - The secondary index with the given name.
+        """
+        index = self._model._indexes.get(name)
+
+        if index is None:
+            if name not in self._indexes:
+                raise KeyError(f'Index "{name}" does not exist!')
+
+            index = self._call_on_loop(self._model._add_index, name, self._indexes[name])
+
+        return index
+
+    def __get_entries(self, query: Callable) -> list:
+        """
+        Run a query on the sorted keys of the map and return the matching entries. The query runs on the loop of the
+        client, where the sorted keys are modified. If the keys of the map are not sorted yet, start maintaining them in
+        sorted order.
+
+        :param query:           - Function that receives the sorted keys and returns a list of matching keys.
+        :return:                - List of `(key, value)` tuples of the matching keys.
+        """
+        if self._model is None:
+            return []
+
+        return [self.__to_entry(key_value, entry) for key_value, entry in
+                self._call_on_loop(self._model._query_sorted, query)]
+
+    async def _get_value(self, key: Any) -> Any:
         await self._initialised.wait()
-        return await self._model._get_value(key)
+        return self._map(key)
 
-    async def __get_all_values(self) -> list:
+    async def _get_all_values(self) -> list:
         await self._initialised.wait()
-        return await self._model._get_values()
 
-    async def __put_message(self, key: Any, value: Any) -> None:
+        if self.__uses_conversions():
+            return self._model._get_converted(self.format)
+
+        return [self.__to_entry(entry[0], entry) for entry in await self._model._get_values()]
+
+    def __get_all(self) -> list:
+        """
+        Return all entries of the map, according to the format of the downlink view. The converted entries are cached
+        by the downlink model, so only the entries that have changed since the previous call are converted, on the
+        loop of the client.
+
+        :return:                - List of converted `(key, value)` tuples.
+        """
+        if not self.__uses_conversions():
+            return [self.__to_entry(entry[0], entry) for entry in list(self._model._map.values())]
+
+        conversion = self._model._conversions.get(self.format)
+        entries = None if conversion is None else conversion._snapshot()
+
+        if entries is None:
+            entries = self._call_on_loop(self._model._get_converted, self.format)
+
+        return entries
+
+    def __to_entry(self, key_value: Value, entry: tuple) -> tuple:
+        """
+        Convert an entry of the map, according to the format of the downlink view. Converted entries that are cached by
+        the downlink model and up to date are reused.
+
+        :param key_value:       - The key of the entry as a Value object.
+        :param entry:           - The `(key, value)` tuple of the entry as Value objects.
+        :return:                - The converted `(key, value)` tuple.
+        """
+        if self.__uses_conversions():
+            conversion = self._model._conversions.get(self.format)
+            converted = None if conversion is None else conversion._lookup(key_value)
+
+            if converted is not None:
+                return converted
+
+        return self._to_object(entry[0]), self._to_object(entry[1])
+
+    def __uses_conversions(self) -> bool:
+        """
+        Check if the converted entries cached by the downlink model can be used by the downlink view. Entries in the
+        `value` format are not converted.
+
+        :return:                - True if the cached entries can be used, False otherwise.
+        """
+        return self.format != 'value' and self._model is not None and self._model.downlink_manager is not None
+
+    def __convert_extractor(self, extractor: Callable) -> Callable:
+        """
+        Wrap an index extractor, so that it receives the values of the map according to the format of the view.
+
+        :param extractor:       - Function that receives a value and returns the indexed value.
+        :return:                - Function that receives a value as a Value object and returns the indexed value.
+        """
+        return lambda value: extractor(self._to_object(value))
+
+    async def _put_message(self, key: Any, value: Any) -> None:
         """
         Send a `put` message to the remote agent of the downlink.
 
@@ -701,10 +1625,11 @@ class _MapDownlinkView(_DownlinkView):
         """
         await self._initialised.wait()
 
-        message = _CommandMessage(self._node_uri, self._lane_uri, UpdateRequest(key, value).to_record())
+        request = UpdateRequest(self._to_record(key), self._to_record(value))
+        message = _CommandMessage(self._node_uri, self._lane_uri, request.to_record())
         await self._model._send_message(message)
 
-    async def __remove_message(self, key: Any) -> None:
+    async def _remove_message(self, key: Any) -> None:
         """
         Send a `remove` message to the remote agent of the downlink.
 
@@ -712,5 +1637,5 @@ class _MapDownlinkView(_DownlinkView):
         """
         await self._initialised.wait()
 
-        message = _CommandMessage(self._node_uri, self._lane_uri, RemoveRequest(key).to_record())
+        message = _CommandMessage(self._node_uri, self._lane_uri, RemoveRequest(self._to_record(key)).to_record())
         await self._model._send_message(message)
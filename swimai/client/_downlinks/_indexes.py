@@ -0,0 +1,561 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import math
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Any, Optional, Callable, Union
+from swimai.structures import Value, Num, Bool, Text, Attr, Slot
+from swimai.structures._structs import _Record
+
+
+def _get_field(value: Any, field: str) -> Any:
+    """
+    Extract a field from the value of a map entry.
+
+    :param value:           - Value of the map entry.
+    :param field:           - Name of the field. Dictionary keys, object attributes and record slots are supported.
+    :return:                - The field or None if it is missing.
+    """
+    if isinstance(value, dict):
+        return value.get(field)
+    elif isinstance(value, _Record):
+        item = value.get(field)
+
+        if isinstance(item, (Text, Num, Bool)):
+            return item.value
+        elif item == Value.absent():
+            return None
+        else:
+            return item
+    elif isinstance(value, Value):
+        return None
+    else:
+        return getattr(value, field, None)
+
+
+def _to_float(value: Any, field: Optional[str]) -> float:
+    """
+    Extract a numeric field from the value of a map entry.
+
+    :param value:           - Value of the map entry.
+    :param field:           - Name of the field. Values that are numbers themselves are returned for any field.
+    :return:                - The field as a float or NaN if it is missing or not numeric.
+    """
+    if isinstance(value, (Num, Bool)):
+        value = value.value
+
+    if not isinstance(value, (int, float)):
+        value = _get_field(value, field)
+
+        if not isinstance(value, (int, float)):
+            return math.nan
+
+    return float(value)
+
+
+def _sort_key(item: Any) -> tuple:
+    """
+    Create a sort key for a Value object. Numbers are ordered before booleans, booleans before strings and strings
+    before records. Records are ordered item by item.
+
+    :param item:            - Value object to create a sort key for.
+    :return:                - Sort key of the Value object.
+    """
+    if isinstance(item, Num):
+        return 0, item.value
+    elif isinstance(item, Bool):
+        return 1, item.value
+    elif isinstance(item, Text):
+        return 2, item.value
+    elif isinstance(item, _Record):
+        return 3, tuple(_sort_key(child) for child in item._iter_items())
+    elif isinstance(item, Attr):
+        return 4, _sort_key(item.key), _sort_key(item.value)
+    elif isinstance(item, Slot):
+        return 5, _sort_key(item.key), _sort_key(item.value)
+    else:
+        return 6,
+
+
+class _SortedKeys:
+    """
+    Keys of a map downlink, kept in sorted order as entries are updated and removed.
+    """
+
+    def __init__(self, key_values: Any) -> None:
+        self._entries = sorted(((_sort_key(key_value), key_value) for key_value in key_values), key=lambda e: e[0])
+
+    @property
+    def _size(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, key_value: Value) -> None:
+        """
+        Insert a key, if it does not exist already.
+
+        :param key_value:       - The key of the entry as a Value object.
+        """
+        sort_key = _sort_key(key_value)
+        index = bisect_left(self._entries, (sort_key,))
+
+        if index == len(self._entries) or self._entries[index][0] != sort_key:
+            self._entries.insert(index, (sort_key, key_value))
+
+    def _remove(self, key_value: Value) -> None:
+        """
+        Remove a key, if it exists.
+
+        :param key_value:       - The key of the entry as a Value object.
+        """
+        sort_key = _sort_key(key_value)
+        index = bisect_left(self._entries, (sort_key,))
+
+        if index < len(self._entries) and self._entries[index][0] == sort_key:
+            del self._entries[index]
+
+    def _range(self, lower: Optional[Value], upper: Optional[Value]) -> list:
+        """
+        Return the keys from a lower bound (inclusive) to an upper bound (exclusive) in ascending order.
+
+        :param lower:           - Lower bound as a Value object or None for no lower bound.
+        :param upper:           - Upper bound as a Value object or None for no upper bound.
+        :return:                - List of keys within the bounds.
+        """
+        start = 0 if lower is None else bisect_left(self._entries, (_sort_key(lower),))
+        end = len(self._entries) if upper is None else bisect_left(self._entries, (_sort_key(upper),))
+
+        return [key_value for _, key_value in self._entries[start:end]]
+
+    def _prefix(self, prefix: str) -> list:
+        """
+        Return all string keys starting with a given prefix in ascending order.
+
+        :param prefix:          - The prefix of the keys.
+        :return:                - List of keys with the prefix.
+        """
+        index = bisect_left(self._entries, ((2, prefix),))
+        keys = list()
+
+        while index < len(self._entries):
+            sort_key, key_value = self._entries[index]
+
+            if sort_key[0] != 2 or not sort_key[1].startswith(prefix):
+                break
+
+            keys.append(key_value)
+            index += 1
+
+        return keys
+
+    def _first(self, count: int = 1) -> list:
+        """
+        Return the smallest keys in ascending order.
+
+        :param count:           - Number of keys to return.
+        :return:                - List of the smallest keys.
+        """
+        return [key_value for _, key_value in self._entries[:count]]
+
+    def _last(self, count: int = 1) -> list:
+        """
+        Return the largest keys in descending order.
+
+        :param count:           - Number of keys to return.
+        :return:                - List of the largest keys.
+        """
+        return [key_value for _, key_value in self._entries[:-count - 1:-1]] if count > 0 else []
+
+
+class _MapColumns:
+    """
+    Numeric columns with the fields of the values of a map downlink. Rows are densely packed and removing an entry
+    moves the last row into its place, so the columns never contain gaps. The columns are copied on write after a
+    snapshot has been taken, so snapshots are never modified by later changes. The copy is made once per snapshot,
+    by the first change that follows it, and copies all columns in full, which takes less than 0.1 ms per column of
+    100,000 rows. Keys converted into the formats of the downlink views are maintained incrementally and their
+    snapshots are tuples that are only rebuilt after rows have been added or removed.
+    """
+
+    def __init__(self, fields: list, entries: dict) -> None:
+        self._columns = dict()
+        self._rows = dict()
+        self._key_values = list()
+        self._converted_keys = dict()
+        self._key_snapshots = dict()
+        self._size = 0
+        self._capacity = 0
+        self._shared = False
+
+        self._add_fields(fields, entries)
+
+        for key_value, (key, value) in entries.items():
+            self._update(key_value, value)
+
+    def _has_fields(self, fields: list) -> bool:
+        """
+        Check if all of the given fields are extracted as columns.
+
+        :param fields:          - Names of the fields.
+        :return:                - True if all of the fields have columns, False otherwise.
+        """
+        return all(field in self._columns for field in fields)
+
+    def _add_fields(self, fields: list, entries: dict) -> None:
+        """
+        Add columns for the given fields and fill them with the values of the existing rows.
+
+        :param fields:          - Names of the fields to extract as columns.
+        :param entries:         - Current entries of the map downlink.
+        """
+        for field in fields:
+            if field not in self._columns:
+                column = array('d', bytes(8 * self._capacity))
+
+                for row in range(0, self._size):
+                    column[row] = _to_float(entries[self._key_values[row]][1], field)
+
+                self._columns[field] = column
+
+    def _update(self, key_value: Value, value: Any) -> None:
+        """
+        Update or insert the row of a map entry.
+
+        :param key_value:       - The key of the entry as a Value object.
+        :param value:           - The new value of the entry.
+        """
+        self.__unshare()
+        row = self._rows.get(key_value)
+
+        if row is None:
+            row = self._size
+
+            if row == self._capacity:
+                self.__grow()
+
+            self._rows[key_value] = row
+            self._key_values.append(key_value)
+
+            for convert, keys in self._converted_keys.values():
+                keys.append(convert(key_value))
+
+            self._key_snapshots = dict()
+
+        for field, column in self._columns.items():
+            column[row] = _to_float(value, field)
+
+        self._size = len(self._key_values)
+
+    def _remove(self, key_value: Value) -> None:
+        """
+        Remove the row of a map entry by moving the last row into its place.
+
+        :param key_value:       - The key of the entry as a Value object.
+        """
+        row = self._rows.pop(key_value, None)
+
+        if row is None:
+            return
+
+        self.__unshare()
+        last = self._size - 1
+
+        if row != last:
+            for column in self._columns.values():
+                column[row] = column[last]
+
+            moved = self._key_values[last]
+            self._key_values[row] = moved
+            self._rows[moved] = row
+
+            for convert, keys in self._converted_keys.values():
+                keys[row] = keys[last]
+
+        self._size = last
+        self._key_values.pop()
+
+        for convert, keys in self._converted_keys.values():
+            keys.pop()
+
+        self._key_snapshots = dict()
+
+    def _snapshot(self, fields: list, downlink_format: str = 'value', convert: Optional[Callable] = None) -> tuple:
+        """
+        Return the keys and the columns of the given fields as one consistent snapshot. The columns are read-only views
+        that are not copied, instead the next change copies the columns before modifying them.
+
+        :param fields:          - Names of the fields.
+        :param downlink_format: - Format of the downlink view that the keys are converted into.
+        :param convert:         - Function that converts a key from a Value object into the format, or None to return
+                                  the keys as Value objects.
+        :return:                - Tuple with the tuple of keys in row order and a dictionary with the name of each
+                                  field and a memoryview of its column.
+        """
+        self._shared = True
+        size = self._size
+        return self.__get_keys(downlink_format, convert), \
+            {field: memoryview(self._columns[field]).toreadonly()[:size] for field in fields}
+
+    def _clear_converted_keys(self) -> None:
+        """
+        Clear the converted keys, after the conversion of the keys has changed.
+        """
+        self._converted_keys = dict()
+        self._key_snapshots = dict()
+
+    def __get_keys(self, downlink_format: str, convert: Optional[Callable]) -> tuple:
+        """
+        Return the keys of the rows in a format of the downlink views. The keys of a format are converted on the first
+        call and maintained incrementally afterwards.
+
+        :param downlink_format: - Format of the downlink view that the keys are converted into.
+        :param convert:         - Function that converts a key from a Value object into the format, or None to return
+                                  the keys as Value objects.
+        :return:                - Tuple with the keys in row order.
+        """
+        keys = self._key_snapshots.get(downlink_format)
+
+        if keys is None:
+            if convert is None:
+                keys = tuple(self._key_values)
+            else:
+                converted = self._converted_keys.get(downlink_format)
+
+                if converted is None:
+                    converted = (convert, [convert(key_value) for key_value in self._key_values])
+                    self._converted_keys[downlink_format] = converted
+
+                keys = tuple(converted[1])
+
+            self._key_snapshots[downlink_format] = keys
+
+        return keys
+
+    def __unshare(self) -> None:
+        """
+        Copy the columns if they are exported to a snapshot, so that the snapshot is not modified.
+        """
+        if self._shared:
+            for field, column in self._columns.items():
+                self._columns[field] = array('d', column)
+
+            self._shared = False
+
+    def __grow(self) -> None:
+        """
+        Double the capacity of the columns.
+        """
+        capacity = max(16, 2 * self._capacity)
+        extension = bytes(8 * (capacity - self._capacity))
+        self._capacity = capacity
+
+        for column in self._columns.values():
+            column.frombytes(extension)
+
+
+class _ValueIndex:
+    """
+    Secondary index of a map downlink from an extracted field of the values to the keys of the entries.
+    """
+
+    def __init__(self, extractor: Union[str, Callable], entries: dict) -> None:
+        if isinstance(extractor, str):
+            field = extractor
+            extractor = lambda value: _get_field(value, field)  # noqa: E731
+
+        self._extractor = extractor
+        self._keys = dict()
+        self._values = dict()
+
+        for key_value, (key, value) in entries.items():
+            self._update(key_value, value)
+
+    def _update(self, key_value: Value, value: Any) -> None:
+        """
+        Index the value of an entry. Entries with unhashable indexed values are not indexed.
+
+        :param key_value:       - The key of the entry as a Value object.
+        :param value:           - The new value of the entry.
+        """
+        indexed = self._extractor(value)
+
+        try:
+            if key_value in self._values and self._values[key_value] == indexed:
+                return
+
+            self._keys.setdefault(indexed, dict())
+        except TypeError:
+            self._remove(key_value)
+            return
+
+        self._remove(key_value)
+        self._keys[indexed][key_value] = None
+        self._values[key_value] = indexed
+
+    def _remove(self, key_value: Value) -> None:
+        """
+        Remove an entry from the index.
+
+        :param key_value:       - The key of the entry as a Value object.
+        """
+        if key_value in self._values:
+            indexed = self._values.pop(key_value)
+            keys = self._keys[indexed]
+            keys.pop(key_value)
+
+            if not keys:
+                self._keys.pop(indexed)
+
+    def _lookup(self, indexed: Any) -> list:
+        """
+        Return the keys of all entries with a given indexed value.
+
+        :param indexed:         - The indexed value.
+        :return:                - List of keys with the indexed value.
+        """
+        return list(self._keys.get(indexed, ()))
+
+    def _memory(self) -> int:
+        """
+        Return an estimate of the memory used by the index in bytes. Keys and values that are shared with the map
+        are not included.
+
+        :return:                - Size of the index in bytes.
+        """
+        return sys.getsizeof(self._keys) + sys.getsizeof(self._values) + sum(
+            sys.getsizeof(keys) for keys in list(self._keys.values()))
+
+
+class _ConvertedEntries:
+    """
+    Entries of a map downlink converted into one format of its views. Entries are only converted when they are read
+    and the converted entries are cached until the entries change. The cache is modified on the loop of the client,
+    while converted entries that are up to date can be read from any thread.
+    """
+
+    def __init__(self, convert: Callable) -> None:
+        self._convert = convert
+        self._entries = dict()
+        self._stale = dict()
+        self._complete = False
+        self._previous = (None, None)
+
+    def _update(self, key_value: Value) -> None:
+        """
+        Mark the converted entry of a key as out of date, after the value of the entry has changed. The previous
+        converted entry is kept until the next change, so that the views can reuse it as the old value of the change.
+
+        :param key_value:       - The key of the entry as a Value object.
+        """
+        entry = self._entries.get(key_value)
+        self._previous = (key_value, entry)
+
+        if entry is not None or self._complete:
+            self._stale[key_value] = None
+
+    def _remove(self, key_value: Value) -> None:
+        """
+        Remove the converted entry of a key, after the entry has been removed from the map. The removed converted
+        entry is kept until the next change, so that the views can reuse it as the old value of the removal.
+
+        :param key_value:       - The key of the entry as a Value object.
+        """
+        self._previous = (key_value, self._entries.pop(key_value, None))
+        self._stale.pop(key_value, None)
+
+    def _get_previous(self, key_value: Value) -> Optional[tuple]:
+        """
+        Return the converted entry of a key from before its latest change, if it had been converted.
+
+        :param key_value:       - The key of the entry as a Value object.
+        :return:                - The converted `(key, value)` tuple or None.
+        """
+        previous_key, entry = self._previous
+        return entry if previous_key is key_value else None
+
+    def _lookup(self, key_value: Value) -> Optional[tuple]:
+        """
+        Return the converted entry of a key, if it is cached and up to date. Can be called from any thread.
+
+        :param key_value:       - The key of the entry as a Value object.
+        :return:                - The converted `(key, value)` tuple or None.
+        """
+        if key_value in self._stale:
+            return None
+
+        return self._entries.get(key_value)
+
+    def _get(self, key_value: Value, entry: tuple) -> tuple:
+        """
+        Return the converted entry of a key, converting and caching it if it is not up to date.
+
+        :param key_value:       - The key of the entry as a Value object.
+        :param entry:           - The current `(key, value)` tuple of the entry as Value objects.
+        :return:                - The converted `(key, value)` tuple.
+        """
+        converted = self._lookup(key_value)
+
+        if converted is None:
+            converted = self.__convert_entry(entry, self._entries.get(key_value))
+            self._entries[key_value] = converted
+            self._stale.pop(key_value, None)
+
+        return converted
+
+    def _get_all(self, entries: dict) -> list:
+        """
+        Return all converted entries in the order of the map. Only the entries that have changed since the previous
+        call are converted.
+
+        :param entries:         - Current entries of the map downlink.
+        :return:                - List of converted `(key, value)` tuples.
+        """
+        if not self._complete:
+            converted = dict()
+
+            for key_value, entry in entries.items():
+                cached = self._lookup(key_value)
+                converted[key_value] = self.__convert_entry(entry, None) if cached is None else cached
+
+            self._entries = converted
+            self._complete = True
+        else:
+            for key_value in list(self._stale):
+                self._entries[key_value] = self.__convert_entry(entries[key_value], self._entries.get(key_value))
+
+        self._stale = dict()
+        return list(self._entries.values())
+
+    def _snapshot(self) -> Optional[list]:
+        """
+        Return all converted entries, if all of them are cached and up to date. Can be called from any thread.
+
+        :return:                - List of converted `(key, value)` tuples or None.
+        """
+        if self._complete and not self._stale:
+            return list(self._entries.values())
+
+        return None
+
+    def __convert_entry(self, entry: tuple, cached: Optional[tuple]) -> tuple:
+        """
+        Convert an entry of the map. The converted key of a cached entry is reused, since keys do not change.
+
+        :param entry:           - The `(key, value)` tuple of the entry as Value objects.
+        :param cached:          - The previous converted `(key, value)` tuple of the entry or None.
+        :return:                - The converted `(key, value)` tuple.
+        """
+        key = self._convert(entry[0]) if cached is None else cached[0]
+        return key, self._convert(entry[1])
@@ -118,7 +118,7 @@ class MapRequest(ABC):
         """
         key_slot = RecordMap.create()
         key_slot.add(
-            Slot.create_slot(Text.create_from('key'), RecordConverter.get_converter().object_to_record(self.key)))
+            Slot.create_slot(Text._intern('key'), RecordConverter.get_converter().object_to_record(self.key)))
 
         return key_slot
 
@@ -138,7 +138,7 @@ class UpdateRequest(MapRequest):
         key_slot = self.get_key_item()
         value_slot = self.get_value_item()
 
-        update_record = RecordMap.create_record_map(Attr.create_attr(Text.create_from('update'), key_slot))
+        update_record = RecordMap.create_record_map(Attr.create_attr(Text._intern('update'), key_slot))
         update_record.add(value_slot)
         return update_record
 
@@ -147,5 +147,5 @@ class RemoveRequest(MapRequest):
     def to_record(self) -> '_Record':
         key_slot = self.get_key_item()
 
-        remove_record = RecordMap.create_record_map(Attr.create_attr(Text.create_from('remove'), key_slot))
+        remove_record = RecordMap.create_record_map(Attr.create_attr(Text._intern('remove'), key_slot))
         return remove_record
@@ -0,0 +1,615 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import inspect
+import multiprocessing
+import os
+import sys
+import traceback
+import warnings
+import zlib
+
+from abc import ABC, abstractmethod
+from concurrent.futures import wait
+from multiprocessing.connection import Connection
+from queue import SimpleQueue
+from threading import Thread, Lock
+from traceback import TracebackException
+from typing import Any, Callable, Optional
+from ._downlinks._downlinks import _DownlinkView
+from ._downlinks._utils import before_open, after_open
+from ._swim_client import SwimClient
+from ._utils import _URI
+from swimai.structures import Value, RecordConverter
+from swimai.structures._structs import _Absent
+
+_BATCH_SIZE = 1000
+_FLUSH_TIMEOUT = 5
+
+
+class ShardedSwimClient:
+    """
+    Swim client that distributes its downlinks across worker processes, each running its own `SwimClient`, so that
+    the decoding and conversion of messages are not limited to a single CPU core.
+    Downlinks are assigned to workers by a hash of their host URI and route. The events of the downlinks are sent back
+    to the client in batches and the callbacks of the downlinks are called on a receiver thread for each worker.
+    Values that are sent by the downlinks must be picklable. Values received by the downlinks are forwarded by the
+    workers as Recon records and converted into Python objects by the client.
+    The worker processes are started with the `spawn` method, so the main module of the application must only start
+    the client under `if __name__ == '__main__'`.
+    """
+
+    def __init__(self, shards: int = None, debug: bool = False) -> None:
+        self.shards = shards or os.cpu_count() or 1
+        self.debug = debug
+
+        self._has_started = False
+        self._views = dict()
+        self.__shards = []
+        self.__next_id = 0
+
+    def __enter__(self) -> 'ShardedSwimClient':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_value: Optional[Exception],
+                 exc_traceback: Optional[TracebackException]) -> 'ShardedSwimClient':
+
+        if exc_value or exc_traceback:
+            self._handle_exception(exc_value, exc_traceback)
+
+        self.stop()
+        return self
+
+    def start(self) -> 'ShardedSwimClient':
+        """
+        Start the Swim client.
+        Start a worker process for each shard and a thread that receives the events of each worker.
+        """
+        context = multiprocessing.get_context('spawn')
+
+        for index in range(0, self.shards):
+            commands_receiver, commands_sender = context.Pipe(duplex=False)
+            events_receiver, events_sender = context.Pipe(duplex=False)
+            process = context.Process(target=_run_shard, args=(commands_receiver, events_sender), daemon=True)
+            process.start()
+
+            commands_receiver.close()
+            events_sender.close()
+
+            shard = _Shard(process, commands_sender, events_receiver)
+            shard.thread = Thread(target=self.__receive_events, args=(shard,), daemon=True)
+            shard.thread.start()
+            self.__shards.append(shard)
+
+        self._has_started = True
+        return self
+
+    def stop(self) -> 'ShardedSwimClient':
+        """
+        Stop the client.
+        Stop the worker processes, after they have closed their connections and sent their remaining events.
+        """
+        for shard in self.__shards:
+            shard._send(('stop',))
+
+        for shard in self.__shards:
+            shard.thread.join()
+            shard.process.join()
+            shard.commands.close()
+            shard.events.close()
+
+        self.__shards = []
+        self._views.clear()
+        self._has_started = False
+
+        return self
+
+    def command(self, host_uri: str, node_uri: str, lane_uri: str, body: Any) -> None:
+        """
+        Send a command message to a command lane on a remote Swim agent, from the worker of the route of the lane.
+
+        :param host_uri:        - Host URI of the remote agent.
+        :param node_uri:        - Node URI of the remote agent.
+        :param lane_uri:        - Lane URI of the command lane of the remote agent.
+        :param body:            - The message body.
+        """
+        shard = self._get_shard(host_uri, node_uri, lane_uri)
+
+        if shard is not None:
+            shard._send(('command', host_uri, node_uri, lane_uri, body))
+
+    def downlink_event(self) -> '_ShardedEventDownlinkView':
+        """
+        Create an Event Downlink.
+        """
+        return _ShardedEventDownlinkView(self)
+
+    def downlink_value(self) -> '_ShardedValueDownlinkView':
+        """
+        Create a Value Downlink.
+        """
+        return _ShardedValueDownlinkView(self)
+
+    def downlink_map(self) -> '_ShardedMapDownlinkView':
+        """
+        Create a Map Downlink.
+        """
+        return _ShardedMapDownlinkView(self)
+
+    def _open_downlink_view(self, downlink_view: '_ShardedDownlinkView') -> bool:
+        """
+        Open a downlink view on the worker of its route.
+
+        :param downlink_view:   - Downlink view to open.
+        :return:                - True if the downlink view has been opened.
+        """
+        shard = self._get_shard(downlink_view._host_uri, downlink_view._node_uri, downlink_view._lane_uri)
+
+        if shard is None:
+            return False
+
+        self.__next_id += 1
+        downlink_view._id = self.__next_id
+        downlink_view._shard = shard
+        self._views[downlink_view._id] = downlink_view
+
+        shard._send(('open', downlink_view._id, downlink_view._type, downlink_view._host_uri, downlink_view._node_uri,
+                     downlink_view._lane_uri, downlink_view._prio, downlink_view._rate))
+        return True
+
+    def _close_downlink_view(self, downlink_view: '_ShardedDownlinkView') -> None:
+        """
+        Close a downlink view on its worker.
+
+        :param downlink_view:   - Downlink view to close.
+        """
+        downlink_view._shard._send(('close', downlink_view._id))
+        self._views.pop(downlink_view._id, None)
+
+    def _get_shard(self, host_uri: str, node_uri: str, lane_uri: str) -> Optional['_Shard']:
+        """
+        Return the shard of a route. The hash of the route is stable across processes and runs, so that all downlinks
+        of the same route share the connection and the downlink model of the same worker.
+
+        :param host_uri:        - Host URI of the route.
+        :param node_uri:        - Node URI of the route.
+        :param lane_uri:        - Lane URI of the route.
+        :return:                - The shard of the route or None if the client has not been started.
+        """
+        if not self._has_started:
+            try:
+                raise Exception('Cannot send to a shard before the client has been started!')
+            except Exception:
+                exc_type, exc_value, exc_traceback = sys.exc_info()
+                self._handle_exception(exc_value, exc_traceback)
+                return None
+
+        route = f'{host_uri} {node_uri} {lane_uri}'.encode('utf-8')
+        return self.__shards[zlib.crc32(route) % len(self.__shards)]
+
+    def _handle_exception(self, exc_value: Optional[Exception], exc_traceback: Optional[TracebackException]) -> None:
+        """
+        Report exceptions.
+
+        :param exc_value:       - Exception value.
+        :param exc_traceback:   - Exception traceback.
+        """
+        warnings.warn(str(exc_value))
+
+        if self.debug:
+            traceback.print_tb(exc_traceback)
+
+    def __receive_events(self, shard: '_Shard') -> None:
+        """
+        Receive the batches of events of a worker and dispatch them to their downlink views, until the worker stops.
+
+        :param shard:           - Shard of the worker.
+        """
+        while True:
+            try:
+                batch = shard.events.recv()
+            except (EOFError, OSError):
+                return
+
+            if batch is None:
+                return
+
+            for view_id, events in batch:
+                if view_id is None:
+                    self._handle_exception(Exception(events), None)
+                    continue
+
+                downlink_view = self._views.get(view_id)
+
+                if downlink_view is None:
+                    continue
+
+                try:
+                    downlink_view._dispatch(events)
+                except Exception:
+                    exc_type, exc_value, exc_traceback = sys.exc_info()
+                    self._handle_exception(exc_value, exc_traceback)
+
+
+class _Shard:
+
+    def __init__(self, process: 'multiprocessing.Process', commands: 'Connection', events: 'Connection') -> None:
+        self.process = process
+        self.commands = commands
+        self.events = events
+        self.thread = None
+        self.__lock = Lock()
+
+    def _send(self, command: tuple) -> None:
+        """
+        Send a command to the worker of the shard. Commands can be sent from any thread.
+
+        :param command:         - Name of the command, followed by its arguments.
+        """
+        with self.__lock:
+            self.commands.send(command)
+
+
+class _ShardedDownlinkView(ABC):
+    _type = None
+
+    def __init__(self, client: 'ShardedSwimClient') -> None:
+        self._client = client
+        self._host_uri = None
+        self._node_uri = None
+        self._lane_uri = None
+        self._prio = 0.0
+        self._rate = 0.0
+        self._is_open = False
+        self._id = None
+        self._shard = None
+
+    def open(self) -> '_ShardedDownlinkView':
+        if not self._is_open:
+            self._is_open = self._client._open_downlink_view(self)
+
+        return self
+
+    def close(self) -> '_ShardedDownlinkView':
+        if self._is_open:
+            self._is_open = False
+            self._client._close_downlink_view(self)
+
+        return self
+
+    @before_open
+    def set_host_uri(self, host_uri: str) -> '_ShardedDownlinkView':
+        self._host_uri, _ = _URI._parse_uri(host_uri)
+        return self
+
+    @before_open
+    def set_node_uri(self, node_uri: str) -> '_ShardedDownlinkView':
+        self._node_uri = node_uri
+        return self
+
+    @before_open
+    def set_lane_uri(self, lane_uri: str) -> '_ShardedDownlinkView':
+        self._lane_uri = lane_uri
+        return self
+
+    @before_open
+    def set_prio(self, prio: float) -> '_ShardedDownlinkView':
+        self._prio = prio
+        return self
+
+    @before_open
+    def set_rate(self, rate: float) -> '_ShardedDownlinkView':
+        self._rate = rate
+        return self
+
+    @abstractmethod
+    def _dispatch(self, events: list) -> None:
+        """
+        Execute the callbacks of the downlink view for a batch of events received from its worker.
+
+        :param events:          - Events in the format of `_DownlinkView.events`.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _to_object(record: 'Value') -> Any:
+        """
+        Convert a Recon record received from the worker into a Python object. Absent values are returned as they are.
+
+        :param record:          - Recon record to convert.
+        :return:                - The object represented by the record.
+        """
+        if record is Value.absent():
+            return record
+
+        return RecordConverter.get_converter().record_to_object(record, {}, False)
+
+    @staticmethod
+    def _validate_callback(function: Callable) -> Callable:
+        """
+        Validate that a callback is a normal function, since callbacks are called on a receiver thread without a loop.
+
+        :param function:        - Callback to validate.
+        :return:                - The callback.
+        """
+        if not callable(function) or inspect.iscoroutinefunction(function):
+            raise TypeError('Callback must be a function!')
+
+        return function
+
+
+class _ShardedEventDownlinkView(_ShardedDownlinkView):
+    _type = 'event'
+
+    def __init__(self, client: 'ShardedSwimClient') -> None:
+        super().__init__(client)
+        self._on_event_callback = None
+
+    def on_event(self, function: Callable) -> '_ShardedEventDownlinkView':
+        """
+        Set the `on_event` callback of the current downlink view to a given function.
+
+        :param function:   - Function to be called on the receiver thread when an event is received by the downlink.
+        :return:           - The current downlink view.
+        """
+        self._on_event_callback = self._validate_callback(function)
+        return self
+
+    def _dispatch(self, events: list) -> None:
+        if self._on_event_callback:
+            for event in events:
+                self._on_event_callback(self._to_object(event))
+
+
+class _ShardedValueDownlinkView(_ShardedDownlinkView):
+    _type = 'value'
+
+    def __init__(self, client: 'ShardedSwimClient') -> None:
+        super().__init__(client)
+        self._did_set_callback = None
+        self._value = Value.absent()
+
+    @after_open
+    def get(self) -> Any:
+        """
+        Return the latest value of the downlink that has been received from its worker.
+
+        :return:                - The value of the downlink.
+        """
+        return self._value
+
+    @after_open
+    def set(self, value: Any) -> None:
+        """
+        Send a command message to set the value of the lane on the remote agent to the given value.
+
+        :param value:           - New value for the lane of the remote agent.
+        """
+        self._shard._send(('set', self._id, value))
+
+    def did_set(self, function: Callable) -> '_ShardedValueDownlinkView':
+        """
+        Set the `did_set` callback of the current downlink view to a given function.
+
+        :param function:   - Function to be called on the receiver thread when a value is received by the downlink.
+        :return:           - The current downlink view.
+        """
+        self._did_set_callback = self._validate_callback(function)
+        return self
+
+    def _dispatch(self, events: list) -> None:
+        for new_value, old_value in events:
+            self._value = self._to_object(new_value)
+
+            if self._did_set_callback:
+                self._did_set_callback(self._value, self._to_object(old_value))
+
+
+class _ShardedMapDownlinkView(_ShardedDownlinkView):
+    _type = 'map'
+
+    def __init__(self, client: 'ShardedSwimClient') -> None:
+        super().__init__(client)
+        self._did_update_callback = None
+        self._did_remove_callback = None
+
+    @after_open
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Send a command message to put the given key and value in the remote map lane.
+
+        :param key:             - Entry key.
+        :param value:           - Entry value.
+        """
+        self._shard._send(('put', self._id, key, value))
+
+    @after_open
+    def remove(self, key: Any) -> None:
+        """
+        Send a command message to remove the given key from the remote map lane.
+
+        :param key:             - Entry key.
+        """
+        self._shard._send(('remove', self._id, key))
+
+    def did_update(self, function: Callable) -> '_ShardedMapDownlinkView':
+        """
+        Set the `did_update` callback of the current downlink view to a given function.
+
+        :param function:   - Function to be called on the receiver thread when an entry is updated.
+        :return:           - The current downlink view.
+        """
+        self._did_update_callback = self._validate_callback(function)
+        return self
+
+    def did_remove(self, function: Callable) -> '_ShardedMapDownlinkView':
+        """
+        Set the `did_remove` callback of the current downlink view to a given function.
+
+        :param function:   - Function to be called on the receiver thread when an entry is removed.
+        :return:           - The current downlink view.
+        """
+        self._did_remove_callback = self._validate_callback(function)
+        return self
+
+    def _dispatch(self, events: list) -> None:
+        for key, new_value, old_value in events:
+            if isinstance(new_value, _Absent):
+                if self._did_remove_callback:
+                    self._did_remove_callback(self._to_object(key), self._to_object(old_value))
+            elif self._did_update_callback:
+                self._did_update_callback(self._to_object(key), self._to_object(new_value), self._to_object(old_value))
+
+
+def _run_shard(commands: 'Connection', events: 'Connection') -> None:
+    """
+    Run the `SwimClient` of a worker process. Commands from the parent client are executed until a `stop` command is
+    received, while the events of the downlinks are forwarded to the parent client in batches by a separate thread.
+    Commands that fail are reported to the parent client, without stopping the worker. Before the worker stops, the
+    remaining events of its downlinks are forwarded to the parent client.
+
+    :param commands:        - Connection that receives the commands of the parent client.
+    :param events:          - Connection that sends the batches of events to the parent client.
+    """
+    outbox = SimpleQueue()
+    sender = Thread(target=_send_events, args=(outbox, events))
+    sender.start()
+    views = dict()
+    forwarders = dict()
+
+    try:
+        with SwimClient() as client:
+            while True:
+                command = commands.recv()
+                name = command[0]
+
+                if name == 'stop':
+                    client._run_task(_close_events, list(views.values()))
+                    wait(forwarders.values(), timeout=_FLUSH_TIMEOUT)
+                    break
+
+                try:
+                    _execute_command(client, command, views, forwarders, outbox)
+                except Exception as exception:
+                    outbox.put((None, f'Command "{name}" failed in the worker: {exception}'))
+    finally:
+        outbox.put(None)
+        sender.join()
+
+
+def _execute_command(client: 'SwimClient', command: tuple, views: dict, forwarders: dict,
+                     outbox: 'SimpleQueue') -> None:
+    """
+    Execute a command of the parent client in a worker process.
+
+    :param client:          - Swim client of the worker.
+    :param command:         - Name of the command, followed by its arguments.
+    :param views:           - Downlink views of the worker, by their ID in the parent client.
+    :param forwarders:      - Futures of the tasks that forward the events of the downlink views, by the same IDs.
+    :param outbox:          - Queue of the events that are sent to the parent client.
+    """
+    name = command[0]
+
+    if name == 'open':
+        _, view_id, view_type, host_uri, node_uri, lane_uri, prio, rate = command
+        downlink_view = getattr(client, f'downlink_{view_type}')()
+        downlink_view.set_host_uri(host_uri).set_node_uri(node_uri).set_lane_uri(lane_uri)
+        downlink_view.set_prio(prio).set_rate(rate)
+        downlink_view.format = 'value'
+        forwarders[view_id] = client._schedule_task(_forward_events, view_id, downlink_view, outbox, drainable=False)
+        downlink_view.open()
+        views[view_id] = downlink_view
+    elif name == 'close':
+        forwarders.pop(command[1], None)
+        views.pop(command[1]).close()
+    elif name == 'set':
+        views[command[1]].set(command[2])
+    elif name == 'put':
+        views[command[1]].put(command[2], command[3])
+    elif name == 'remove':
+        views[command[1]].remove(command[2])
+    elif name == 'command':
+        client.command(*command[1:])
+
+
+async def _close_events(downlink_views: list) -> None:
+    """
+    Close the events of the downlink views of a worker, so that the tasks forwarding them end once the remaining
+    events have been put in the outbox.
+
+    :param downlink_views:  - Downlink views of the worker.
+    """
+    for downlink_view in downlink_views:
+        downlink_view._close_events()
+
+
+async def _forward_events(view_id: int, downlink_view: '_DownlinkView', outbox: 'SimpleQueue') -> None:
+    """
+    Forward the events of a downlink view of a worker to the outbox of the worker, until the downlink is closed.
+
+    :param view_id:         - ID of the downlink view in the parent client.
+    :param downlink_view:   - Downlink view of the worker.
+    :param outbox:          - Queue of the events that are sent to the parent client.
+    """
+    async for batch in downlink_view.events(max_batch=_BATCH_SIZE):
+        outbox.put((view_id, batch))
+
+
+def _send_events(outbox: 'SimpleQueue', events: 'Connection') -> None:
+    """
+    Send the events from the outbox of a worker to the parent client, combining the events that are ready into a
+    single message. A None item in the outbox is sent last and stops the sender.
+
+    :param outbox:          - Queue of the events that are sent to the parent client.
+    :param events:          - Connection that sends the batches of events to the parent client.
+    """
+    while True:
+        item = outbox.get()
+        batch = []
+
+        while item is not None:
+            batch.append(item)
+
+            if len(batch) >= _BATCH_SIZE or outbox.empty():
+                break
+
+            item = outbox.get_nowait()
+
+        if batch:
+            _send_batch(batch, events)
+
+        if item is None:
+            events.send(None)
+            events.close()
+            return
+
+
+def _send_batch(batch: list, events: 'Connection') -> None:
+    """
+    Send a batch of events to the parent client. If the batch cannot be sent, e.g. because an event cannot be
+    pickled, the events of each downlink are sent separately and the events that cannot be sent are reported to the
+    parent client instead, so that the events of the other downlinks are not lost.
+
+    :param batch:           - List of `(view_id, events)` tuples.
+    :param events:          - Connection that sends the batches of events to the parent client.
+    """
+    try:
+        events.send(batch)
+    except Exception:
+        for item in batch:
+            try:
+                events.send([item])
+            except Exception as exception:
+                events.send([(None, f'Events could not be sent by the worker: {exception}')])
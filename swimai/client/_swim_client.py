@@ -19,10 +19,10 @@ import traceback
 import warnings
 
 from asyncio import Future
-from concurrent.futures import CancelledError
+from concurrent.futures import CancelledError, Executor
 from threading import Thread
 from traceback import TracebackException
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, List
 from ._connections import _ConnectionPool, _WSConnection
 from ._downlinks._downlinks import _ValueDownlinkView, _EventDownlinkView, _DownlinkView, _MapDownlinkView
 from ._utils import _URI, after_started
@@ -33,15 +33,18 @@ from swimai.warp._warp import _CommandMessage
 class SwimClient:
 
     def __init__(self, terminate_on_exception: bool = False, execute_on_exception: Callable = None,
-                 debug: bool = False) -> None:
+                 debug: bool = False, loop_factory: Callable = None, decode_executor: 'Executor' = None) -> None:
         self.debug = debug
         self.execute_on_exception = execute_on_exception
         self.terminate_on_exception = terminate_on_exception
+        self.loop_factory = loop_factory
+        self.decode_executor = decode_executor
 
         self._loop = None
         self._loop_thread = None
         self._has_started = False
-        self.__connection_pool = _ConnectionPool()
+        self.__connection_pool = _ConnectionPool(decode_executor)
+        self.__pending = set()
 
     def __enter__(self) -> 'SwimClient':
         self.start()
@@ -60,8 +63,10 @@ class SwimClient:
         """
         Start the Swim client.
         Create a new thread and starts an asyncio loop inside it.
+        The loop is created with the loop factory of the client, e.g. `uvloop_factory`, or with
+        `asyncio.new_event_loop` if there is none.
         """
-        loop = asyncio.new_event_loop()
+        loop = self.loop_factory() if self.loop_factory else asyncio.new_event_loop()
         asyncio.get_event_loop_policy().set_event_loop(loop)
         self._loop = loop
         self._loop_thread = Thread(target=self.__start_event_loop)
@@ -70,12 +75,16 @@ class SwimClient:
 
         return self
 
-    def stop(self) -> 'SwimClient':
+    def stop(self, drain: bool = False, timeout: float = 5) -> 'SwimClient':
         """
         Stop the client.
         Schedule a task for stopping the event loop and its thread and afterwards close the loop.
+
+        :param drain:           - If True, wait for pending messages and callbacks and close the connections before
+                                  stopping the loop. If False, cancel them immediately.
+        :param timeout:         - Maximum time in seconds for draining the client, including closing the connections.
         """
-        self._schedule_task(self.__stop_event_loop)
+        self._schedule_task(self.__stop_event_loop, drain, timeout, drainable=False)
         self._loop_thread.join()
         self._loop.close()
         self._has_started = False
@@ -92,7 +101,7 @@ class SwimClient:
         :param body:            - The message body.
         """
 
-        return self._schedule_task(self.__send_command, host_uri, node_uri, lane_uri, body)
+        return self._schedule_task(self._send_command, host_uri, node_uri, lane_uri, body)
 
     def downlink_event(self) -> '_EventDownlinkView':
         """
@@ -113,6 +122,45 @@ class SwimClient:
         """
         return _MapDownlinkView(self)
 
+    def open_many(self, downlink_views: List['_DownlinkView'], timeout: float = None) -> 'Future':
+        """
+        Open multiple downlinks at once. The downlinks are grouped by host and the requests for establishing them are
+        sent in a single task for each host, instead of scheduling a separate task for every downlink.
+        Downlinks that are already open are skipped.
+
+        :param downlink_views:  - Downlink views to open.
+        :param timeout:         - Maximum time in seconds to wait for the downlinks to be established. If some of them
+                                  are not established in time, the future fails with the routes of those downlinks,
+                                  which stay open. If None, wait without a limit.
+        :return:                - Future that completes when all downlinks have been linked, or synced for value and
+                                  map downlinks.
+        """
+        downlink_views = [downlink_view for downlink_view in downlink_views if not downlink_view._is_open]
+        future = self._schedule_task(self._open_downlink_views, downlink_views, timeout)
+
+        if future is not None:
+            for downlink_view in downlink_views:
+                downlink_view._is_open = True
+
+        return future
+
+    def close_many(self, downlink_views: List['_DownlinkView']) -> 'Future':
+        """
+        Close multiple downlinks at once. The downlinks are grouped by host and removed from the connection of each
+        host in a single task. Downlinks that are not open are skipped.
+
+        :param downlink_views:  - Downlink views to close.
+        :return:                - Future that completes when all downlinks have been removed from their connections.
+        """
+        downlink_views = [downlink_view for downlink_view in downlink_views if downlink_view._is_open]
+        future = self._schedule_task(self._close_downlink_views, downlink_views)
+
+        if future is not None:
+            for downlink_view in downlink_views:
+                downlink_view._is_open = False
+
+        return future
+
     async def _add_downlink_view(self, downlink_view: '_DownlinkView') -> None:
         """
         Add a DownlinkView to the connection pool of the client.
@@ -129,6 +177,41 @@ class SwimClient:
         """
         await self.__connection_pool._remove_downlink_view(downlink_view)
 
+    async def _open_downlink_views(self, downlink_views: List['_DownlinkView'], timeout: float = None) -> None:
+        """
+        Add multiple DownlinkViews to the connection pool of the client and wait until all of them have been linked,
+        or synced for value and map downlinks.
+
+        :param downlink_views:  - DownlinkViews to add to the connection pool.
+        :param timeout:         - Maximum time in seconds to wait for the downlinks to be established. If None, wait
+                                  without a limit.
+        """
+        await self.__connection_pool._add_downlink_views(downlink_views)
+
+        if not downlink_views:
+            return
+
+        waiters = [asyncio.ensure_future(downlink_view._model._wait_established()) for downlink_view in downlink_views]
+        done, pending = await asyncio.wait(waiters, timeout=timeout)
+
+        for waiter in pending:
+            waiter.cancel()
+
+        if pending:
+            routes = [downlink_view.route for downlink_view, waiter in zip(downlink_views, waiters) if waiter in pending]
+            raise Exception(f'Downlinks {", ".join(routes)} were not established within {timeout} seconds!')
+
+        for waiter in done:
+            waiter.result()
+
+    async def _close_downlink_views(self, downlink_views: List['_DownlinkView']) -> None:
+        """
+        Remove multiple DownlinkViews from the connection pool of the client.
+
+        :param downlink_views:  - DownlinkViews to remove from the connection pool.
+        """
+        await self.__connection_pool._remove_downlink_views(downlink_views)
+
     async def _get_connection(self, host_uri: str, scheme: str) -> '_WSConnection':
         """
         Get a WebSocket connection to the specified host from the connection pool.
@@ -140,23 +223,56 @@ class SwimClient:
         connection = await self.__connection_pool._get_connection(host_uri, scheme)
         return connection
 
+    async def _close_connections(self, close_timeout: float = 0.1) -> None:
+        """
+        Close all connections of the connection pool of the client.
+
+        :param close_timeout:   - Maximum time in seconds to wait for the closing handshakes of the connections.
+        """
+        await self.__connection_pool._close_connections(close_timeout)
+
     @after_started
-    def _schedule_task(self, task: Callable, *args: Any) -> 'Future':
+    def _schedule_task(self, task: Callable, *args: Any, drainable: bool = True) -> 'Future':
         """
         Schedule a task for execution in the asyncio loop.
 
         :param task:            - Coroutine to be executed in the asyncio loop.
         :param args:            - Arguments to be passed to the coroutine.
+        :param drainable:       - If False, the task is not waited for when the client is drained, e.g. because it only
+                                  completes when the connections are closed.
         :return:                - Future object that holds information about the task execution and final result.
         """
         try:
             future = asyncio.run_coroutine_threadsafe(task(*args), loop=self._loop)
-            future.add_done_callback(self.__exception_handler)
+            future.add_done_callback(self._exception_handler)
+
+            if drainable:
+                self.__pending.add(future)
+                future.add_done_callback(self.__pending.discard)
+
             return future
         except Exception:
             exc_type, exc_value, exc_traceback = sys.exc_info()
             self._handle_exception(exc_value, exc_traceback)
 
+    def _run_task(self, task: Callable, *args: Any) -> Any:
+        """
+        Schedule a task for execution in the asyncio loop and wait for its result.
+
+        :param task:            - Coroutine to be executed in the asyncio loop.
+        :param args:            - Arguments to be passed to the coroutine.
+        :return:                - Result of the task.
+        """
+        return self._schedule_task(task, *args).result()
+
+    def _check_blocking(self, name: str) -> None:
+        """
+        Check that the client can block until a method of a downlink view has completed.
+
+        :param name:            - Name of the method.
+        """
+        pass
+
     def _handle_exception(self, exc_value: Optional[Exception], exc_traceback: Optional[TracebackException]) -> None:
         """
         Report exceptions and schedule custom callbacks or client termination, based on the
@@ -177,7 +293,7 @@ class SwimClient:
         if self.execute_on_exception is not None:
             self.execute_on_exception()
 
-    def __exception_handler(self, future: Future) -> None:
+    def _exception_handler(self, future: Future) -> None:
         """
         Check the result of execution of a future and report any exceptions.
 
@@ -185,13 +301,13 @@ class SwimClient:
         """
         try:
             future.result()
-        except CancelledError:
+        except (CancelledError, asyncio.CancelledError):
             pass
         except Exception:
             exc_type, exc_value, exc_traceback = sys.exc_info()
             self._handle_exception(exc_value, exc_traceback)
 
-    async def __send_command(self, host_uri: str, node_uri: str, lane_uri: str, body: Any) -> None:
+    async def _send_command(self, host_uri: str, node_uri: str, lane_uri: str, body: Any) -> None:
         """
         Send a command message to a given host.
 
@@ -210,7 +326,42 @@ class SwimClient:
         asyncio.set_event_loop(self._loop)
         asyncio.get_event_loop().run_forever()
 
-    async def __stop_event_loop(self) -> None:
+    async def _drain(self, timeout: float) -> None:
+        """
+        Stop receiving events from the remote agents, wait for the pending tasks of the client, such as messages that
+        are sent and callbacks that are executed, and then close all connections concurrently. Tasks that are not
+        drainable, such as the tasks that wait for messages from remote agents, are not waited for, since they only
+        complete when the connections are closed.
+
+        :param timeout:         - Maximum time in seconds for draining the client.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self.__connection_pool._stop_receiving()
+
+        while True:
+            tasks = self._pending_tasks()
+            remaining = deadline - loop.time()
+
+            if not tasks or remaining <= 0:
+                break
+
+            await asyncio.wait(tasks, timeout=remaining)
+
+        await self._close_connections(max(deadline - loop.time(), 0.1))
+
+    def _pending_tasks(self) -> set:
+        """
+        Return the drainable tasks scheduled by the client that have not yet completed.
+
+        :return:                - Set of pending tasks.
+        """
+        return {asyncio.wrap_future(future) for future in list(self.__pending)}
+
+    async def __stop_event_loop(self, drain: bool, timeout: float) -> None:
+        if drain:
+            await self._drain(timeout)
+
         tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
         [task.cancel() for task in tasks]
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import sys
 from typing import Callable, Optional, Tuple
 from urllib.parse import urlparse, ParseResult
@@ -39,6 +40,21 @@ def after_started(function: 'Callable') -> 'Callable':
     return wrapper
 
 
+def uvloop_factory() -> 'asyncio.AbstractEventLoop':
+    """
+    Loop factory for the Swim client, which creates a uvloop event loop if uvloop is installed and a default asyncio
+    event loop otherwise.
+
+    :return:                - New event loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+
+    return uvloop.new_event_loop()
+
+
 class _URI:
 
     @staticmethod
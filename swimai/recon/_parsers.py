@@ -33,7 +33,7 @@ class _ReconParser:
 
     @staticmethod
     def _create_attr(key: Any, value: Any = Value.extant()) -> 'Attr':
-        return Attr.create_attr(key, value)
+        return Attr.create_attr(_ReconParser._intern_key(key), value)
 
     @staticmethod
     def _create_record_builder() -> 'RecordMap':
@@ -45,7 +45,21 @@ class _ReconParser:
 
     @staticmethod
     def _create_slot(key: Any, value: Any = None) -> 'Slot':
-        return Slot.create_slot(key, value)
+        return Slot.create_slot(_ReconParser._intern_key(key), value)
+
+    @staticmethod
+    def _intern_key(key: Any) -> Any:
+        """
+        Replace a text key of a slot or a tag of an attribute with its interned Text object. Other identifiers are not
+        interned, as values such as IDs would fill the table.
+
+        :param key:             - Key of the slot or tag of the attribute.
+        :return:                - Interned Text object or the key if it is not a Text object.
+        """
+        if type(key) is Text:
+            return Text._intern(key.value)
+
+        return key
 
     @staticmethod
     def _create_number(value: Union[float, int]) -> 'Num':
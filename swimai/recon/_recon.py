@@ -12,8 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Any
+from swimai.structures import RecordConverter
 from swimai.structures._structs import Value
 from ._parsers import _ReconParser
+from ._transcoders import _JsonTranscoder
 from ._writers import _ReconWriter
 
 
@@ -21,6 +24,7 @@ class Recon:
     # Singletons
     _writer = None
     _parser = None
+    _transcoder = None
 
     @staticmethod
     def parse(recon_string: str) -> 'Value':
@@ -42,6 +46,40 @@ class Recon:
         """
         return Recon._get_writer()._write_item(item)
 
+    @staticmethod
+    def to_json(recon_string: str) -> Any:
+        """
+        Parse a Recon message in string format and return it as JSON-compatible Python structures.
+
+        :param recon_string:        - Recon message in string format.
+        :return:                    - Dictionaries, lists, strings, numbers, booleans or None representing the message.
+        """
+        return RecordConverter.get_converter().record_to_json(Recon.parse(recon_string))
+
+    @staticmethod
+    def transcode_to_json(recon_string: str, attr_prefix: str = '@', index_prefix: str = '$') -> str:
+        """
+        Transcode a Recon message in string format directly into a JSON string, without creating Swim structure objects.
+
+        :param recon_string:        - Recon message in string format.
+        :param attr_prefix:         - Prefix of the keys of attributes in JSON objects.
+        :param index_prefix:        - Prefix of the indexes of values without keys in JSON objects.
+        :return:                    - JSON document representing the Recon message.
+        """
+        return Recon._get_transcoder(attr_prefix, index_prefix)._recon_to_json(recon_string)
+
+    @staticmethod
+    def transcode_from_json(json_string: str, attr_prefix: str = '@', index_prefix: str = '$') -> str:
+        """
+        Transcode a JSON string directly into a Recon message, without creating Swim structure objects.
+
+        :param json_string:         - JSON document in string format.
+        :param attr_prefix:         - Prefix of the keys of attributes in JSON objects.
+        :param index_prefix:        - Prefix of the indexes of values without keys in JSON objects.
+        :return:                    - Recon message in string format representing the JSON document.
+        """
+        return Recon._get_transcoder(attr_prefix, index_prefix)._json_to_recon(json_string)
+
     @staticmethod
     def _get_writer() -> '_ReconWriter':
         """
@@ -67,3 +105,21 @@ class Recon:
             Recon._parser = _ReconParser()
 
         return Recon._parser
+
+    @staticmethod
+    def _get_transcoder(attr_prefix: str, index_prefix: str) -> '_JsonTranscoder':
+        """
+        Get a JSON transcoder if one already exists for the given prefixes.
+        Otherwise, instantiate a new one.
+
+        :param attr_prefix:     - Prefix of the keys of attributes in JSON objects.
+        :param index_prefix:    - Prefix of the indexes of values without keys in JSON objects.
+        :return:                - JSON transcoder.
+        """
+        transcoder = Recon._transcoder
+
+        if transcoder is None or transcoder._attr_prefix != attr_prefix or transcoder._index_prefix != index_prefix:
+            transcoder = _JsonTranscoder(attr_prefix, index_prefix)
+            Recon._transcoder = transcoder
+
+        return transcoder
@@ -0,0 +1,370 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import re
+
+from json.encoder import encode_basestring
+from typing import Any, List, Optional, Tuple
+
+
+class _JsonTranscoder:
+    """
+    Transcoder between Recon and JSON strings, which does not build structure objects.
+    The mapping follows `RecordConverter.record_to_json`. Records without fields are converted into JSON arrays and
+    records with fields into JSON objects, where the keys of attributes are prefixed with the attribute prefix and
+    values without keys are stored under their index, prefixed with the index prefix.
+    """
+    _IDENT = re.compile(r'[A-Za-z_][A-Za-z0-9_-]*')
+    _NUMBER = re.compile(r'-?[0-9]*(\.[0-9]*)?')
+    _SPACES = ' \t'
+    _SEPARATORS = ',;\r\n'
+    _CLOSERS = '}])'
+
+    def __init__(self, attr_prefix: str = '@', index_prefix: str = '$') -> None:
+        if not attr_prefix or not index_prefix or attr_prefix == index_prefix:
+            raise Exception('The attribute and index prefixes must be different and not empty!')
+
+        self._attr_prefix = attr_prefix
+        self._index_prefix = index_prefix
+        self._attr_key = encode_basestring(attr_prefix)[:-1]
+        self._index_key = encode_basestring(index_prefix)[:-1]
+        self._index_pattern = re.compile(re.escape(index_prefix) + r'[0-9]+')
+
+    def _recon_to_json(self, recon_string: str) -> str:
+        """
+        Transcode a Recon string into a JSON string in a single pass.
+
+        :param recon_string:    - Recon message in string format.
+        :return:                - JSON document representing the message.
+        """
+        index = self.__skip(recon_string, 0, ' \t\r\n')
+        json_string, _, index = self.__parse_block(recon_string, index)
+        index = self.__skip(recon_string, index, ' \t\r\n')
+
+        if index < len(recon_string):
+            raise TypeError(f'Unexpected character at position {index}!\nMessage: {recon_string}')
+
+        return json_string
+
+    def _json_to_recon(self, json_string: str) -> str:
+        """
+        Transcode a JSON string into a Recon string. The JSON document is decoded with the scanner of the `json`
+        module and written directly as Recon. JSON null values are written as absent values.
+
+        :param json_string:     - JSON document in string format.
+        :return:                - Recon message representing the document.
+        """
+        return self.__write_value(json.loads(json_string))
+
+    @staticmethod
+    def __skip(string: str, index: int, chars: str) -> int:
+        """
+        Move an index forward, past any of the given characters.
+
+        :param string:          - String to scan.
+        :param index:           - Current index in the string.
+        :param chars:           - Characters to skip.
+        :return:                - Index of the next character that is not skipped.
+        """
+        length = len(string)
+
+        while index < length and string[index] in chars:
+            index += 1
+
+        return index
+
+    def __parse_block(self, string: str, index: int) -> Tuple[str, bool, int]:
+        """
+        Transcode a sequence of attributes and values, e.g. `@event(node:a)@update{x:1}`. A single value is returned
+        as it is and multiple items are combined into an array or an object. The items of a record that follows other
+        items are added to them and end the sequence.
+
+        :param string:          - Recon message.
+        :param index:           - Index of the first character of the sequence.
+        :return:                - JSON text, True if it is a single string, and the index after the sequence.
+        """
+        items = None
+        value = None
+        is_text = False
+        length = len(string)
+
+        while True:
+            index = self.__skip(string, index, self._SPACES)
+
+            if index >= length:
+                break
+
+            char = string[index]
+
+            if char == '@':
+                key, attr_value, index = self.__parse_attr(string, index)
+
+                if items is None:
+                    items = [] if value is None else [(None, value)]
+
+                items.append((key, attr_value))
+
+            elif char == '{' or char == '[':
+                record_items, index = self.__parse_record(string, index + 1)
+
+                if items is None and value is None:
+                    return self.__bind(record_items), False, index
+
+                if items is None:
+                    items = [(None, value)]
+
+                items.extend(record_items)
+                break
+
+            else:
+                literal, literal_is_text, next_index = self.__parse_literal(string, index)
+
+                if literal is None:
+                    break
+
+                index = next_index
+
+                if items is not None:
+                    items.append((None, literal))
+                elif value is None:
+                    value = literal
+                    is_text = literal_is_text
+                else:
+                    items = [(None, value), (None, literal)]
+
+        if items is not None:
+            return self.__bind(items), False, index
+        elif value is not None:
+            return value, is_text, index
+        else:
+            return 'null', False, index
+
+    def __parse_record(self, string: str, index: int) -> Tuple[List[Tuple[Optional[str], str]], int]:
+        """
+        Transcode the items of a record or of an attribute value, up to and including the closing bracket.
+
+        :param string:          - Recon message.
+        :param index:           - Index after the opening bracket.
+        :return:                - List of JSON keys (None for values without keys) and values, and the index after
+                                  the closing bracket.
+        """
+        items = []
+        length = len(string)
+
+        while True:
+            index = self.__skip(string, index, ' \t\r\n')
+
+            if index >= length:
+                raise TypeError(f'Record is not closed!\nMessage: {string}')
+
+            char = string[index]
+
+            if char in self._CLOSERS:
+                return items, index + 1
+            elif char == ',' or char == ';':
+                index += 1
+                continue
+
+            start = index
+            key, key_is_text, index = self.__parse_block(string, index)
+
+            if index == start:
+                raise TypeError(f'Unexpected character at position {index}!\nMessage: {string}')
+
+            index = self.__skip(string, index, self._SPACES)
+
+            if index < length and string[index] == ':':
+                value, _, index = self.__parse_block(string, index + 1)
+                items.append((key if key_is_text else encode_basestring(key), value))
+                index = self.__skip(string, index, self._SPACES)
+            else:
+                items.append((None, key))
+
+            if index < length and string[index] in self._SEPARATORS:
+                index += 1
+
+    def __parse_attr(self, string: str, index: int) -> Tuple[str, str, int]:
+        """
+        Transcode an attribute. Attribute values with a single value without a key, e.g. `@attr(value)`, are unwrapped.
+
+        :param string:          - Recon message.
+        :param index:           - Index of the `@` character.
+        :return:                - JSON key and value of the attribute and the index after it.
+        """
+        match = self._IDENT.match(string, index + 1)
+
+        if match is None:
+            raise TypeError(f'Attribute starting at position {index} is invalid!\nMessage: {string}')
+
+        key = self._attr_key + match.group() + '"'
+        index = match.end()
+
+        if index < len(string) and string[index] == '(':
+            items, index = self.__parse_record(string, index + 1)
+
+            if len(items) == 1 and items[0][0] is None:
+                return key, items[0][1], index
+            elif items:
+                return key, self.__bind(items), index
+
+        return key, 'null', index
+
+    def __parse_literal(self, string: str, index: int) -> Tuple[Optional[str], bool, int]:
+        """
+        Transcode a string, an identifier or a number.
+
+        :param string:          - Recon message.
+        :param index:           - Index of the first character of the literal.
+        :return:                - JSON text (None if there is no literal), True if it is a string, and the index
+                                  after the literal.
+        """
+        char = string[index]
+
+        if char == '"':
+            end = string.find('"', index + 1)
+
+            if end < 0:
+                raise TypeError(f'String starting at position {index} is not closed!\nMessage: {string}')
+
+            return encode_basestring(string[index + 1:end]), True, end + 1
+
+        elif char == '-' or '0' <= char <= '9' or char == '.':
+            match = self._NUMBER.match(string, index)
+            number = match.group()
+
+            if not number.strip('-.'):
+                raise TypeError(f'Number starting at position {index} is invalid!\nMessage: {string}')
+            elif match.group(1) is None:
+                return str(int(number)), False, match.end()
+            else:
+                return repr(float(number)), False, match.end()
+
+        match = self._IDENT.match(string, index)
+
+        if match is None:
+            return None, False, index
+
+        ident = match.group()
+
+        if ident == 'true' or ident == 'false':
+            return ident, False, match.end()
+        else:
+            return '"' + ident + '"', True, match.end()
+
+    def __bind(self, items: List[Tuple[Optional[str], str]]) -> str:
+        """
+        Combine transcoded items into a JSON array if none of them have keys, or into a JSON object otherwise.
+
+        :param items:           - List of JSON keys (None for values without keys) and values.
+        :return:                - JSON array or object.
+        """
+        for key, _ in items:
+            if key is not None:
+                index_key = self._index_key
+                return '{' + ','.join([(f'{index_key}{position}"' if key is None else key) + ':' + value
+                                       for position, (key, value) in enumerate(items)]) + '}'
+
+        return '[' + ','.join([value for _, value in items]) + ']'
+
+    def __write_value(self, value: Any) -> str:
+        """
+        Write a decoded JSON value as Recon.
+
+        :param value:           - Decoded JSON value.
+        :return:                - Recon text of the value.
+        """
+        value_type = type(value)
+
+        if value_type is str:
+            return self.__write_text(value)
+        elif value_type is dict:
+            attrs, fields, _ = self.__write_fields(value)
+
+            if fields or not attrs:
+                attrs.append('{' + ','.join(fields) + '}')
+
+            return ''.join(attrs)
+        elif value_type is list:
+            return '{' + ','.join([self.__write_value(item) for item in value]) + '}'
+        elif value is None:
+            return ''
+        elif value is True:
+            return 'true'
+        elif value is False:
+            return 'false'
+        else:
+            return repr(value)
+
+    def __write_text(self, value: str) -> str:
+        """
+        Write a string as a Recon identifier if possible, or as a quoted string otherwise.
+
+        :param value:           - String to write.
+        :return:                - Recon text of the string.
+        """
+        if value != 'true' and value != 'false' and self._IDENT.fullmatch(value):
+            return value
+        else:
+            return '"' + value + '"'
+
+    def __write_fields(self, value: dict) -> Tuple[List[str], List[str], bool]:
+        """
+        Write the entries of a decoded JSON object as Recon. Entries with attribute keys at the start of the object are
+        written as attributes and entries with index keys are written as values without keys.
+
+        :param value:           - Decoded JSON object.
+        :return:                - List of attributes, list of the remaining items and True if any of them has a key.
+        """
+        attrs = []
+        fields = []
+        has_slots = False
+        attr_prefix = self._attr_prefix
+        prefix_length = len(attr_prefix)
+
+        for key, item in value.items():
+            if not fields and key.startswith(attr_prefix) and self._IDENT.fullmatch(key, prefix_length):
+                attrs.append(self.__write_attr(key[prefix_length:], item))
+            elif self._index_pattern.fullmatch(key):
+                fields.append(self.__write_value(item))
+            else:
+                fields.append(self.__write_text(key) + ':' + self.__write_value(item))
+                has_slots = True
+
+        return attrs, fields, has_slots
+
+    def __write_attr(self, name: str, value: Any) -> str:
+        """
+        Write an attribute as Recon. Values are wrapped in a record where necessary, so that they are not unwrapped
+        when transcoded back into JSON.
+
+        :param name:            - Name of the attribute.
+        :param value:           - Decoded JSON value of the attribute.
+        :return:                - Recon text of the attribute.
+        """
+        if value is None:
+            return '@' + name
+
+        value_type = type(value)
+
+        if value_type is list and len(value) > 1:
+            return '@' + name + '(' + ','.join([self.__write_value(item) for item in value]) + ')'
+
+        if value_type is dict:
+            attrs, fields, has_slots = self.__write_fields(value)
+
+            if not attrs and has_slots:
+                return '@' + name + '(' + ','.join(fields) + ')'
+
+        return '@' + name + '(' + self.__write_value(value) + ')'
@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Union, List, Optional
+from typing import Union, Iterable, Optional
 
 from ._utils import _ReconUtils, _OutputMessage
 from swimai.structures import Attr, Slot, Value, Text, Num, Bool
@@ -75,7 +75,7 @@ class _ReconWriter:
 
     def _write_record(self, record: '_Record') -> Optional['_OutputMessage']:
         if record.size > 0:
-            message = _BlockWriter._write(items=record.get_items(), writer=self, first=True)
+            message = _BlockWriter._write(items=record._iter_items(), writer=self, first=True)
             return message
 
 
@@ -94,7 +94,7 @@ class _AbstractWriter(ABC):
 class _BlockWriter(_AbstractWriter):
 
     @staticmethod
-    def _write(items: List[_Item] = None, writer: '_ReconWriter' = None, first: 'bool' = False,
+    def _write(items: Iterable[_Item] = None, writer: '_ReconWriter' = None, first: 'bool' = False,
                in_braces: bool = False) -> '_OutputMessage':
         output = _OutputMessage._create()
 
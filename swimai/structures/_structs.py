@@ -12,12 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import dataclasses
+import inspect
+import json
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, List, Optional, Dict, Union
+from itertools import islice
+from typing import Any, Iterator, List, Optional, Dict, Union
 
 
 class _Item(ABC):
+    __slots__ = ()
 
     def _concat(self, new_item: '_Item') -> '_Record':
         """
@@ -30,7 +36,7 @@ class _Item(ABC):
         record.add(self)
 
         if isinstance(new_item, _Record):
-            record._add_all(new_item.get_items())
+            record._add_all(new_item._iter_items())
         else:
             record.add(new_item)
 
@@ -70,6 +76,14 @@ class _Item(ABC):
         """
         return _Absent._get_absent()
 
+    def commit(self) -> '_Item':
+        """
+        Make the Item read-only and return it. Items other than records are always read-only.
+
+        :return:                - Read-only Item.
+        """
+        return self
+
     @property
     @abstractmethod
     def key(self) -> 'Any':
@@ -82,6 +96,21 @@ class _Item(ABC):
 
 
 class _Field(_Item):
+    __slots__ = ()
+
+    def commit(self) -> '_Field':
+        """
+        Make the key and the value of the Field read-only and return the Field.
+
+        :return:                - Read-only Field.
+        """
+        if isinstance(self.key, _Item):
+            self.key.commit()
+
+        if isinstance(self.value, _Item):
+            self.value.commit()
+
+        return self
 
     @property
     @abstractmethod
@@ -95,6 +124,7 @@ class _Field(_Item):
 
 
 class Attr(_Field):
+    __slots__ = ('__key', '__value')
 
     def __init__(self, key: 'Value', value: Any) -> None:
         self.__key = key
@@ -106,6 +136,14 @@ class Attr(_Field):
         else:
             return f'Attr({self.key}, {self.value})'
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Attr):
+            return self.key == other.key and self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Attr, self.key, self.value))
+
     @property
     def key(self) -> 'Value':
         return self.__key
@@ -132,7 +170,7 @@ class Attr(_Field):
         if isinstance(key, Text):
             return Attr(key, value)
         elif isinstance(key, str):
-            return Attr(Text.create_from(key), value)
+            return Attr(Text._intern(key), value)
         else:
             raise TypeError(f'Invalid key: {key}')
 
@@ -152,6 +190,7 @@ class Attr(_Field):
 
 
 class Value(_Item):
+    __slots__ = ()
 
     @property
     def key(self) -> 'Value':
@@ -189,7 +228,11 @@ class Value(_Item):
 
 
 class Text(Value):
+    __slots__ = ('__value',)
     empty = None
+    _interned = OrderedDict()
+    _INTERN_MAX_LENGTH = 64
+    _INTERN_MAX_SIZE = 4096
 
     def __init__(self, value: str) -> None:
         self.__value = value
@@ -197,6 +240,14 @@ class Text(Value):
     def __str__(self) -> str:
         return f'"{self.value}"'
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Text):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     @property
     def value(self) -> str:
         return self.__value
@@ -228,6 +279,42 @@ class Text(Value):
 
         return Text.empty
 
+    @staticmethod
+    def _intern(string: str) -> 'Text':
+        """
+        Create Text object from a string that is used as a key or a tag.
+        Short strings are interned in a bounded table, so that repeated keys share a single object. When the table is
+        full, the least recently used string is evicted. The table is used from several threads without a lock, so a
+        string that another thread evicts in the meantime is not an error.
+
+        :param string:          - String value.
+        :return:                - Converted string as a Text object.
+        """
+        if not isinstance(string, str):
+            return Text.create_from(string)
+
+        interned = Text._interned
+        text = interned.get(string)
+
+        if text is None:
+            text = Text.create_from(string)
+
+            if len(string) <= Text._INTERN_MAX_LENGTH:
+                interned[string] = text
+
+                if len(interned) > Text._INTERN_MAX_SIZE:
+                    try:
+                        interned.popitem(last=False)
+                    except KeyError:
+                        pass
+        else:
+            try:
+                interned.move_to_end(string)
+            except KeyError:
+                pass
+
+        return text
+
     def get_string_value(self) -> str:
         """
         Return the value of the Text object as string.
@@ -238,6 +325,10 @@ class Text(Value):
 
 
 class Num(Value):
+    __slots__ = ('__value',)
+    _small = None
+    _SMALL_MIN = -128
+    _SMALL_MAX = 1024
 
     def __init__(self, value: Union[int, float]) -> None:
         self.__value = value
@@ -245,6 +336,14 @@ class Num(Value):
     def __str__(self) -> str:
         return str(self.value)
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Num):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     @property
     def value(self) -> Union[int, float]:
         return self.__value
@@ -261,6 +360,12 @@ class Num(Value):
         if not isinstance(obj, (float, int)):
             raise Exception('Cannot create a Num object with non numeric value!')
 
+        if type(obj) is int and Num._SMALL_MIN <= obj <= Num._SMALL_MAX:
+            if Num._small is None:
+                Num._small = [Num(value) for value in range(Num._SMALL_MIN, Num._SMALL_MAX + 1)]
+
+            return Num._small[obj - Num._SMALL_MIN]
+
         return Num(obj)
 
     def get_num_value(self) -> Union[int, float]:
@@ -273,6 +378,7 @@ class Num(Value):
 
 
 class Bool(Value):
+    __slots__ = ('__value',)
     _TRUE = None
     _FALSE = None
 
@@ -285,6 +391,14 @@ class Bool(Value):
     def __bool__(self) -> bool:
         return self.value
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Bool):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Bool, self.value))
+
     @property
     def value(self) -> bool:
         return self.__value
@@ -319,6 +433,7 @@ class Bool(Value):
 
 
 class _Absent(Value):
+    __slots__ = ()
     _absent = None
 
     def __str__(self) -> str:
@@ -327,6 +442,9 @@ class _Absent(Value):
     def __bool__(self) -> bool:
         return False
 
+    def __reduce__(self) -> tuple:
+        return _Absent._get_absent, ()
+
     @staticmethod
     def _get_absent() -> '_Absent':
         """
@@ -341,6 +459,7 @@ class _Absent(Value):
 
 
 class _Extant(Value):
+    __slots__ = ()
     extant = None
 
     def __str__(self) -> str:
@@ -349,6 +468,9 @@ class _Extant(Value):
     def __bool__(self) -> bool:
         return False
 
+    def __reduce__(self) -> tuple:
+        return _Extant._get_extant, ()
+
     @staticmethod
     def _get_extant() -> '_Extant':
         """
@@ -363,6 +485,7 @@ class _Extant(Value):
 
 
 class Slot(_Field):
+    __slots__ = ('__key', '__value')
 
     def __init__(self, key: Any, value: Any = Value.extant()) -> None:
         self.__key = key
@@ -371,6 +494,14 @@ class Slot(_Field):
     def __str__(self) -> str:
         return f'Slot({self.key}, {self.value})'
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Slot):
+            return self.key == other.key and self.value == other.value
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Slot, self.key, self.value))
+
     @property
     def key(self) -> Any:
         return self.__key
@@ -407,12 +538,25 @@ class _RecordFlags(Enum):
 
 
 class _Record(Value):
+    __slots__ = ()
 
     def __str__(self) -> str:
 
-        string = f'Record({", ".join([str(item) for item in self.get_items()])})'
+        string = f'Record({", ".join([str(item) for item in self._iter_items()])})'
         return string
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _Record):
+            return self.size == other.size and all(
+                item == other_item for item, other_item in zip(self._iter_items(), other._iter_items()))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if not self._is_immutable():
+            raise TypeError(f'Cannot hash mutable record {self}!')
+
+        return hash(tuple(self._iter_items()))
+
     @staticmethod
     def create() -> 'RecordMap':
         """
@@ -425,6 +569,15 @@ class _Record(Value):
     def add(self, item) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def _is_immutable(self) -> bool:
+        """
+        Check if the Record has been made read-only. Only read-only Records can be hashed.
+
+        :return:                - True if the Record is read-only. False otherwise.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_item(self, index: int) -> 'Value':
         """
@@ -444,6 +597,77 @@ class _Record(Value):
         """
         raise NotImplementedError
 
+    def _iter_items(self) -> Iterator['_Item']:
+        """
+        Iterate over the items of the Record, without copying them.
+
+        :return:                - Iterator over the items of the Record.
+        """
+        return (self.get_item(index) for index in range(0, self.size))
+
+    def get(self, key: Any) -> 'Value':
+        """
+        Return the value of the field with a given key.
+
+        :param key:             - Key of the field.
+        :return:                - Value of the field or Absent if the Record has no field with the key.
+        """
+        field = self._get_field(key)
+
+        if field is not None:
+            return field.value
+        else:
+            return Value.absent()
+
+    def get_slot(self, key: Any) -> 'Value':
+        """
+        Return the value of the slot with a given key.
+
+        :param key:             - Key of the slot.
+        :return:                - Value of the slot or Absent if the Record has no slot with the key.
+        """
+        field = self._get_field(key)
+
+        if isinstance(field, Slot):
+            return field.value
+        else:
+            return Value.absent()
+
+    def _get_field(self, key: Any) -> Optional['_Field']:
+        """
+        Return the last field with a given key.
+
+        :param key:             - Key of the field.
+        :return:                - The field or None if the Record has no field with the key.
+        """
+        key = _Record._get_field_key(Value.create_from(key))
+
+        for index in range(self.size - 1, -1, -1):
+            item = self.get_item(index)
+
+            if isinstance(item, _Field) and _Record._get_field_key(item.key) == key:
+                return item
+
+        return None
+
+    @staticmethod
+    def _get_field_key(key: 'Value') -> Any:
+        """
+        Return the key under which a field is indexed. Text keys are indexed by their string. Numeric and boolean keys
+        are indexed by their Python value together with its type, so that e.g. `1`, `1.0` and `true` are different
+        keys.
+
+        :param key:             - Key of the field.
+        :return:                - Index key of the field.
+        """
+        if isinstance(key, Text):
+            return key.value
+        elif isinstance(key, (Num, Bool)):
+            value = key.value
+            return type(value), value
+        else:
+            return key
+
     def _add_all(self, items: List['Value']) -> bool:
         """
         Add a list of items to the Record.
@@ -468,7 +692,7 @@ class _Record(Value):
         :return:                - The current Record with the added Slot.
         """
         if isinstance(key, str):
-            key = Text.create_from(key)
+            key = Text._intern(key)
 
         if isinstance(value, str):
             value = Text.create_from(value)
@@ -513,6 +737,7 @@ class _Record(Value):
 
 
 class RecordMap(_Record):
+    __slots__ = ('_items', '_fields', '_item_count', '_field_count', '_flags', '_hash')
 
     def __init__(self, items: List[_Item] = None, fields: Dict[str, _Item] = None, item_count: int = 0,
                  field_count: int = 0, flags: int = 0) -> None:
@@ -521,6 +746,24 @@ class RecordMap(_Record):
         self._item_count = item_count
         self._field_count = field_count
         self._flags = flags
+        self._hash = None
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, RecordMap) and self._hash is not None and other._hash is not None \
+                and self._hash != other._hash:
+            return False
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = super().__hash__()
+
+        return self._hash
+
+    def _is_immutable(self) -> bool:
+        return bool(self._flags & _RecordFlags.IMMUTABLE.value)
 
     @property
     def size(self) -> int:
@@ -572,6 +815,9 @@ class RecordMap(_Record):
         """
         return self._items
 
+    def _iter_items(self) -> Iterator[_Item]:
+        return iter(self._items)
+
     def get_body(self) -> _Item:
         """
         Return the body of the RecordMap.
@@ -581,9 +827,11 @@ class RecordMap(_Record):
         n = self._item_count
 
         if n > 2:
-            return _RecordMapView(self, 1, n)._branch()
+            head = self.get_item(0)
+            field_count = self._field_count - 1 if isinstance(head, _Field) else self._field_count
+            return self._slice(1, n, field_count)
         elif n == 2:
-            item = self._items[1]
+            item = self.get_item(1)
 
             if isinstance(item, Value):
                 return item
@@ -609,11 +857,17 @@ class RecordMap(_Record):
 
     def commit(self) -> 'RecordMap':
         """
-        Make the RecordMap read-only and return it.
+        Make the RecordMap and all of its items read-only and return it.
+        The hash of a read-only RecordMap is computed once and cached.
 
         :return:                - Read-only RecordMap.
         """
-        self._flags |= _RecordFlags.IMMUTABLE.value
+        if not self._flags & _RecordFlags.IMMUTABLE.value:
+            self._flags |= _RecordFlags.IMMUTABLE.value
+
+            for index in range(0, self._item_count):
+                self.get_item(index).commit()
+
         return self
 
     def contains_key(self, key: Any) -> bool:
@@ -623,14 +877,27 @@ class RecordMap(_Record):
         :param key:             - Key to check.
         :return:                - True if the key exists, False otherwise.
         """
-        key = Value.create_from(key).value
+        return self._get_field(key) is not None
+
+    def _get_field(self, key: Any) -> Optional['_Field']:
+        """
+        Return the last field with a given key, using the hash table of the fields.
+
+        :param key:             - Key of the field.
+        :return:                - The field or None if the RecordMap has no field with the key.
+        """
+        key = Value.create_from(key)
+
+        if isinstance(key, _Record):
+            return super()._get_field(key)
 
         if self._field_count != 0:
-            self.__init_hash_table()
+            if self._fields is None:
+                self.__init_hash_table()
 
-            return key in self._fields
+            return self._fields.get(_Record._get_field_key(key))
 
-        return False
+        return None
 
     @property
     def _tag(self) -> Optional[str]:
@@ -640,12 +907,23 @@ class RecordMap(_Record):
         :return:                - The tag of the RecordMap or None.
         """
         if self._field_count > 0:
-            item = self._items[0]
+            item = self.get_item(0)
             if isinstance(item, Attr):
                 return str(item.key.value)
 
         return None
 
+    def _slice(self, lower: int, upper: int, field_count: int) -> '_RecordMapSlice':
+        """
+        Create a RecordMap with a range of the items of the current RecordMap, which shares the items with it.
+
+        :param lower:           - Index of the first item of the range.
+        :param upper:           - Index after the last item of the range.
+        :param field_count:     - Number of fields in the range.
+        :return:                - RecordMapSlice with the range of the items.
+        """
+        return _RecordMapSlice(self._items, lower, upper, field_count)
+
     def _branch(self) -> 'RecordMap':
         """
         Create a copy of the current RecordMap. The copies reference a shared object
@@ -663,7 +941,6 @@ class RecordMap(_Record):
         :param item:            - Item to add to the RecordMap.
         :return:                - True if the item was successfully added.
         """
-        self._items = self._items[:]
         self._items.append(item)
         self._item_count = self._item_count + 1
 
@@ -671,9 +948,7 @@ class RecordMap(_Record):
             self._field_count += 1
 
             if self._fields is not None:
-                self._fields[item.key.value] = item
-            else:
-                self._fields = None
+                RecordMap.__index_field(self._fields, item)
 
         return True
 
@@ -688,23 +963,42 @@ class RecordMap(_Record):
         self._items.append(item)
         self._item_count = self._item_count + 1
 
+        if self._fields is not None:
+            self._fields = dict(self._fields)
+
         if isinstance(item, _Field):
             self._field_count += 1
 
-        self._fields = None
+            if self._fields is not None:
+                RecordMap.__index_field(self._fields, item)
+
         self._flags &= ~_RecordFlags.ALIASED.value
         return True
 
     def __init_hash_table(self) -> None:
         """
-        Create a hashtable and all items from the RecordMap.
+        Create a hashtable with all fields from the RecordMap.
         """
         self._fields = dict()
-        for item in self._items:
-            self._fields[item.key.value] = item
+        for item in self._iter_items():
+            if isinstance(item, _Field):
+                RecordMap.__index_field(self._fields, item)
+
+    @staticmethod
+    def __index_field(fields: Dict[Any, _Item], field: _Field) -> None:
+        """
+        Add a field to the hashtable of the fields. Fields with record keys are not added, as records can be mutated
+        and are only hashable when read-only. They are found by scanning the items instead.
+
+        :param fields:          - Hashtable of the fields.
+        :param field:           - Field to add to the hashtable.
+        """
+        if not isinstance(field.key, _Record):
+            fields[_Record._get_field_key(field.key)] = field
 
 
 class _RecordMapView(_Record):
+    __slots__ = ('_record', '_lower', '_upper')
 
     def __init__(self, record: RecordMap, lower: int, upper: int) -> None:
         self._record = record
@@ -715,6 +1009,9 @@ class _RecordMapView(_Record):
     def size(self) -> int:
         return self._upper - self._lower
 
+    def _is_immutable(self) -> bool:
+        return bool(self._record._flags & _RecordFlags.IMMUTABLE.value)
+
     def get_item(self, index: int) -> _Item:
         """
         Return an item with a given index from the RecordMapView.
@@ -723,7 +1020,7 @@ class _RecordMapView(_Record):
         :return:                - The item with the given index or Absent if the index is out of bounds.
         """
         if 0 <= index < self.size:
-            return self._record._items[self._lower + index]
+            return self._record.get_item(self._lower + index)
         else:
             return _Item.absent()
 
@@ -733,7 +1030,19 @@ class _RecordMapView(_Record):
 
         :return:                - List of all items from the RecordMapView.
         """
-        return self._record._items[self._lower: self._upper]
+        return list(self._iter_items())
+
+    def _iter_items(self) -> Iterator[_Item]:
+        return islice(self._record._iter_items(), self._lower, self._upper)
+
+    def commit(self) -> '_RecordMapView':
+        """
+        Make the underlying RecordMap read-only and return the RecordMapView.
+
+        :return:                - Read-only RecordMapView.
+        """
+        self._record.commit()
+        return self
 
     def add(self, item: _Item, index: int = None) -> bool:
         """
@@ -768,7 +1077,7 @@ class _RecordMapView(_Record):
 
         for _ in range(0, size):
 
-            item = self._record._items[copy_index]
+            item = self._record.get_item(copy_index)
             new_array.append(item)
 
             if isinstance(item, _Field):
@@ -786,8 +1095,8 @@ class _RecordMapView(_Record):
         :param item:            - Item to add to the RecordMapView.
         """
         lower = self._lower + index
-        self._record._items = self._record._items[0: lower] + [item] + self._record._items[
-                                                                       lower: self._record.size - lower]
+        items = self._record.get_items()
+        self._record._items = items[0: lower] + [item] + items[lower: self._record.size - lower]
         self._record._fields = None
         self._record._item_count += 1
 
@@ -798,7 +1107,90 @@ class _RecordMapView(_Record):
         self._upper += 1
 
 
+class _RecordMapSlice(RecordMap):
+    """
+    RecordMap with a range of the items of another RecordMap. The slice shares the list of items of the other RecordMap
+    and reads its items by offset. The range is copied into a list owned by the slice only when the list of items is
+    requested or the slice is mutated.
+    """
+    __slots__ = ('_source', '_lower')
+
+    def __init__(self, source: List[_Item], lower: int, upper: int, field_count: int) -> None:
+        super().__init__(None, None, upper - lower, field_count, 0)
+        self._source = source
+        self._lower = lower
+
+    def get_item(self, index: int) -> _Item:
+        """
+        Return an item with a given index from the RecordMapSlice, without copying the items.
+
+        :param index:           - The index of the item.
+        :return:                - The item with the given index or Absent if the index is out of bounds.
+        """
+        if self._source is None:
+            return super().get_item(index)
+
+        if 0 <= index < self._item_count:
+            return self._source[self._lower + index]
+        else:
+            return _Item.absent()
+
+    def get_items(self) -> List[_Item]:
+        """
+        Return all items from the RecordMapSlice. The range of the shared items is copied on the first call.
+
+        :return:                - List of all items from the RecordMapSlice.
+        """
+        if self._source is not None:
+            self.__materialise()
+
+        return super().get_items()
+
+    def _iter_items(self) -> Iterator[_Item]:
+        if self._source is None:
+            return super()._iter_items()
+
+        return islice(self._source, self._lower, self._lower + self._item_count)
+
+    def add(self, item: _Item) -> bool:
+        """
+        Add an item to the RecordMapSlice, after copying the range of the shared items.
+
+        :param item:            - Item to add to the RecordMapSlice.
+        :return:                - True if the item was successfully added.
+        """
+        if self._source is not None and not self._flags & _RecordFlags.IMMUTABLE.value:
+            self.__materialise()
+
+        return super().add(item)
+
+    def _slice(self, lower: int, upper: int, field_count: int) -> '_RecordMapSlice':
+        if self._source is None:
+            return super()._slice(lower, upper, field_count)
+
+        return _RecordMapSlice(self._source, self._lower + lower, self._lower + upper, field_count)
+
+    def _branch(self) -> 'RecordMap':
+        """
+        Create a copy of the current RecordMapSlice. The copy shares the items until one of them is mutated.
+
+        :return:                - Copy of the RecordMapSlice.
+        """
+        if self._source is None:
+            return super()._branch()
+
+        return self._slice(0, self._item_count, self._field_count)
+
+    def __materialise(self) -> None:
+        """
+        Copy the range of the shared items into a list owned by the RecordMapSlice.
+        """
+        self._items = self._source[self._lower: self._lower + self._item_count]
+        self._source = None
+
+
 class _ValueBuilder:
+    __slots__ = ('_record', '_value')
 
     def __init__(self) -> None:
         self._record = None
@@ -868,8 +1260,158 @@ class _ValueBuilder:
         return True
 
 
+class _ClassCodec:
+    """
+    Converter between Recon records and the instances of a Python class. The class is inspected once, when the codec
+    is created. Regular classes, dataclasses, classes with __slots__ and NamedTuples are supported.
+    """
+    __slots__ = ('_class', '_tag', '_slots', '_arguments', '_attributes')
+
+    def __init__(self, custom_class: type) -> None:
+        self._class = custom_class
+        self._tag = Text._intern(custom_class.__name__)
+        self._slots = _ClassCodec.__get_slots(custom_class)
+
+        if issubclass(custom_class, tuple) and hasattr(custom_class, '_fields'):
+            self._slots = list(custom_class._fields)
+            self._arguments = frozenset(custom_class._fields)
+        elif dataclasses.is_dataclass(custom_class) and custom_class.__dataclass_params__.frozen:
+            self._arguments = frozenset(field.name for field in dataclasses.fields(custom_class) if field.init)
+        else:
+            self._arguments = None
+
+        self._attributes = frozenset(self._slots).union(self._arguments or ()).union(
+            _ClassCodec.__get_declared_attributes(custom_class))
+
+    def _get_entries(self, obj: Any) -> dict:
+        """
+        Return the attributes of an instance of the class.
+
+        :param obj:             - Instance of the class.
+        :return:                - Dictionary with the names and the values of the attributes.
+        """
+        if not self._slots:
+            return obj.__dict__
+
+        entries = {name: getattr(obj, name) for name in self._slots if hasattr(obj, name)}
+        entries.update(getattr(obj, '__dict__', ()))
+
+        return entries
+
+    def _has_attribute(self, name: str, obj: Any = None) -> bool:
+        """
+        Check if the instances of the class have an attribute with a given name. Attributes that are only set by the
+        constructor, without being declared, are looked up on the given instance.
+
+        :param name:            - Name of the attribute.
+        :param obj:             - Instance of the class, if one has been created.
+        :return:                - True if the attribute exists, False otherwise.
+        """
+        return name in self._attributes or hasattr(self._class if obj is None else obj, name)
+
+    def _can_create_objects(self) -> bool:
+        """
+        Check if instances of the class can be created from Recon records, without instantiating the class. Immutable
+        classes receive their attributes as arguments of the constructor, while mutable classes must be constructible
+        without arguments.
+
+        :return:                - True if instances of the class can be created, False otherwise.
+        """
+        if self._arguments is not None:
+            return True
+
+        try:
+            parameters = list(inspect.signature(self._class.__init__).parameters.values())[1:]
+        except (TypeError, ValueError):
+            return True
+
+        return all(parameter.default is not inspect.Parameter.empty or
+                   parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+                   for parameter in parameters)
+
+    def _create_object(self, entries: dict) -> Any:
+        """
+        Create an instance of an immutable class, i.e. a NamedTuple or a frozen dataclass, with the given attributes.
+        Attributes that are not arguments of the constructor are ignored.
+
+        :param entries:         - Dictionary with the names and the values of the attributes.
+        :return:                - The newly created object.
+        """
+        return self._class(**{name: value for name, value in entries.items() if name in self._arguments})
+
+    @staticmethod
+    def _set_attribute(new_object: Any, name: str, value: Any) -> None:
+        """
+        Set an attribute of an instance of a mutable class.
+
+        :param new_object:      - Instance of the class.
+        :param name:            - Name of the attribute.
+        :param value:           - Value of the attribute.
+        """
+        try:
+            setattr(new_object, name, value)
+        except AttributeError:
+            raise Exception(f'Cannot set attribute {name} for class {type(new_object).__name__}.')
+
+    @staticmethod
+    def __get_slots(custom_class: type) -> list:
+        """
+        Return the names of all slots of a class, including the slots of its base classes.
+
+        :param custom_class:    - Python class.
+        :return:                - List with the names of the slots.
+        """
+        slots = list()
+
+        for klass in reversed(custom_class.__mro__):
+            klass_slots = klass.__dict__.get('__slots__', ())
+
+            if isinstance(klass_slots, str):
+                klass_slots = (klass_slots,)
+
+            for name in klass_slots:
+                if name.startswith('__') and not name.endswith('__'):
+                    name = f'_{klass.__name__.lstrip("_")}{name}'
+
+                if name not in ('__dict__', '__weakref__') and name not in slots:
+                    slots.append(name)
+
+        return slots
+
+    @staticmethod
+    def __get_declared_attributes(custom_class: type) -> list:
+        """
+        Return the names of the attributes that a class declares as dataclass fields or as parameters of its
+        constructor. The class is not instantiated.
+
+        :param custom_class:    - Python class.
+        :return:                - List with the names of the attributes.
+        """
+        attributes = list()
+
+        if dataclasses.is_dataclass(custom_class):
+            attributes.extend(field.name for field in dataclasses.fields(custom_class))
+
+        try:
+            parameters = list(inspect.signature(custom_class.__init__).parameters.values())[1:]
+        except (TypeError, ValueError):
+            parameters = list()
+
+        for parameter in parameters:
+            if parameter.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+                attributes.append(parameter.name)
+
+        return attributes
+
+
 class RecordConverter:
     _converter = None
+    _PRIMITIVE_TYPES = frozenset((Text, Num, Bool))
+    _JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+    def __init__(self) -> None:
+        self._codecs = dict()
+        self._dynamic_types = dict()
 
     @staticmethod
     def get_converter() -> 'RecordConverter':
@@ -905,10 +1447,10 @@ class RecordConverter:
             self.__process_entries(obj, record)
 
         else:
+            codec = self._get_codec(type(obj))
             record = RecordMap.create()
-            attr_value = Text.create_from(obj.__class__.__name__)
-            record.add(Attr.create_attr(attr_value, _Extant._get_extant()))
-            self.__process_entries(obj.__dict__, record)
+            record.add(Attr.create_attr(codec._tag, _Extant._get_extant()))
+            self.__process_entries(codec._get_entries(obj), record)
 
         return record
 
@@ -933,6 +1475,138 @@ class RecordConverter:
 
         return new_object
 
+    def record_to_json(self, record: '_Item') -> Any:
+        """
+        Convert a Recon record into JSON-compatible Python structures.
+        Records without fields are converted into lists and records with fields into dictionaries. The keys of
+        attributes are prefixed with `@` and values without keys in records with fields are stored under their
+        index, prefixed with `$`.
+
+        :param record:          - Recon record to convert.
+        :return:                - Dictionaries, lists, strings, numbers, booleans or None representing the record.
+        """
+        record_type = type(record)
+
+        if record_type in RecordConverter._PRIMITIVE_TYPES or isinstance(record, (Text, Num, Bool)):
+            return record.value
+        elif record_type is RecordMap or isinstance(record, _Record):
+            return self.__record_to_json(record)
+        elif isinstance(record, Attr):
+            return {self.__key_to_json(record): self.__attr_value_to_json(record.value)}
+        elif isinstance(record, Slot):
+            return {self.__key_to_json(record): self.record_to_json(record.value)}
+        else:
+            return None
+
+    def record_to_json_bytes(self, record: '_Item') -> bytes:
+        """
+        Convert a Recon record into a UTF-8 encoded JSON document.
+
+        :param record:          - Recon record to convert.
+        :return:                - JSON document representing the record.
+        """
+        return RecordConverter._JSON_ENCODER.encode(self.record_to_json(record)).encode('utf-8')
+
+    def __record_to_json(self, record: '_Record') -> Union[dict, list]:
+        """
+        Convert a Recon record into a JSON-compatible dictionary or list, in a single pass over its items.
+        The values are collected into a list until the first field is found, at which point the list is moved into a
+        dictionary. Exact types are checked before instances of subclasses, as checks against abstract classes are slow.
+
+        :param record:          - Recon record to convert.
+        :return:                - List if the record has no fields, dictionary otherwise.
+        """
+        primitive_types = RecordConverter._PRIMITIVE_TYPES
+        json_list = []
+        json_object = None
+
+        for index, item in enumerate(record._iter_items()):
+            item_type = type(item)
+
+            if item_type in primitive_types:
+                json_key = None
+                json_value = item.value
+            elif item_type is Slot:
+                key = item.key
+                value = item.value
+                value_type = type(value)
+                json_key = key.value if type(key) is Text else self.__key_to_json(item)
+
+                if value_type in primitive_types:
+                    json_value = value.value
+                elif value_type is RecordMap:
+                    json_value = self.__record_to_json(value)
+                else:
+                    json_value = self.record_to_json(value)
+            elif item_type is Attr:
+                json_key = self.__key_to_json(item)
+                json_value = self.__attr_value_to_json(item.value)
+            elif isinstance(item, _Field):
+                json_key = self.__key_to_json(item)
+                json_value = self.__attr_value_to_json(item.value) if isinstance(item, Attr) else self.record_to_json(
+                    item.value)
+            else:
+                json_key = None
+                json_value = self.record_to_json(item)
+
+            if json_object is not None:
+                json_object[f'${index}' if json_key is None else json_key] = json_value
+            elif json_key is None:
+                json_list.append(json_value)
+            else:
+                json_object = {f'${list_index}': list_value for list_index, list_value in enumerate(json_list)}
+                json_object[json_key] = json_value
+
+        return json_list if json_object is None else json_object
+
+    def __attr_value_to_json(self, value: '_Item') -> Any:
+        """
+        Convert the value of an attribute into JSON-compatible Python structures. Attribute values with a single value
+        without a key, e.g. `@attr(value)`, are unwrapped.
+
+        :param value:           - Value of the attribute to convert.
+        :return:                - JSON-compatible Python structures representing the attribute value.
+        """
+        if isinstance(value, _Record) and value.size == 1 and not isinstance(value.get_item(0), _Field):
+            value = value.get_item(0)
+
+        return self.record_to_json(value)
+
+    def __key_to_json(self, field: '_Field') -> str:
+        """
+        Convert the key of a field into a JSON object key.
+
+        :param field:           - Field with the key to convert.
+        :return:                - Key of the field as string.
+        """
+        key = field.key
+
+        if isinstance(key, Text):
+            json_key = key.value
+        else:
+            json_key = RecordConverter._JSON_ENCODER.encode(self.record_to_json(key))
+
+        if isinstance(field, Attr):
+            return f'@{json_key}'
+        else:
+            return json_key
+
+    def _get_codec(self, custom_class: type) -> '_ClassCodec':
+        """
+        Get the codec of a class if one already exists.
+        Otherwise, create a new one.
+
+        :param custom_class:    - Python class.
+        :return:                - Codec of the class.
+        """
+        codec = self._codecs.get(custom_class)
+
+        if codec is None:
+            codec = _ClassCodec(custom_class)
+            self._codecs[custom_class] = codec
+
+        return codec
+
     def __process_entries(self, entries: dict, record: '_Record') -> None:
         """
         Convert entries to Recon and add them to the main record.
@@ -944,29 +1618,33 @@ class RecordConverter:
 
             if value is not None:
                 slot_value = self.object_to_record(value)
-                key_value = Text.create_from(key)
+                key_value = Text._intern(key)
                 record.add(Slot.create_slot(key_value, slot_value))
 
-    @staticmethod
-    def __attr_to_object(attribute: _Item, classes: dict, strict: bool) -> Any:
+    def __get_class_codec(self, attribute: _Item, classes: dict, strict: bool) -> '_ClassCodec':
         """
-        Convert a Recon attribute item to a Python object.
+        Return the codec of the class for a Recon attribute item. Types created for unknown classes are cached per tag.
 
-        :param attribute:       - Recon attribute item to convert.
+        :param attribute:       - Recon attribute item with the name of the class.
         :param classes:         - Specific Python classes to use in the conversion.
         :param strict:          - Boolean flag indicating if the conversion should fail if a needed class is not
                                   explicitly provided.
-        :return:                - The newly created object.
+        :return:                - Codec of the class.
         """
 
         class_name = attribute.key.value
         class_object = classes.get(class_name)
 
         if class_object is not None:
-            return class_object()
+            return self._get_codec(class_object)
         elif not strict:
-            dynamic_type = type(str(class_name), (object,), {})
-            return dynamic_type()
+            dynamic_type = self._dynamic_types.get(class_name)
+
+            if dynamic_type is None:
+                dynamic_type = type(str(class_name), (object,), {})
+                self._dynamic_types[class_name] = dynamic_type
+
+            return self._get_codec(dynamic_type)
         else:
             raise Exception(f'Missing class for {class_name}.')
 
@@ -981,9 +1659,16 @@ class RecordConverter:
         :return:                - The newly created object.
         """
 
-        new_object = self.__attr_to_object(record._get_head(), classes, strict)
+        codec = self.__get_class_codec(record._get_head(), classes, strict)
+
+        if codec._arguments is None:
+            new_object = codec._class()
+            entries = None
+        else:
+            new_object = None
+            entries = dict()
 
-        items_iter = iter(record.get_items())
+        items_iter = record._iter_items()
         next(items_iter)
 
         for item in items_iter:
@@ -991,13 +1676,21 @@ class RecordConverter:
             attribute = str(item.key.value)
 
             if strict:
-                if not hasattr(new_object, attribute):
-                    raise Exception(f'Missing attribute {attribute} for class {type(new_object).__name__}.')
+                if attribute not in codec._attributes and not codec._has_attribute(attribute, new_object):
+                    raise Exception(f'Missing attribute {attribute} for class {codec._class.__name__}.')
 
             if isinstance(record, RecordMap):
-                setattr(new_object, attribute, self.record_to_object(record, classes, strict))
+                value = self.record_to_object(record, classes, strict)
+            else:
+                value = item.value.value
+
+            if entries is None:
+                codec._set_attribute(new_object, attribute, value)
             else:
-                setattr(new_object, attribute, item.value.value)
+                entries[attribute] = value
+
+        if entries is not None:
+            new_object = codec._create_object(entries)
 
         return new_object
 
@@ -1013,7 +1706,7 @@ class RecordConverter:
         """
         new_object = dict()
 
-        for item in record.get_items():
+        for item in record._iter_items():
             value = item.key.value
             if isinstance(value, RecordMap):
                 new_object[item.key.key.value] = self.record_to_object(value, classes, strict)
@@ -16,7 +16,7 @@ import math
 from abc import ABC, abstractmethod
 from typing import Optional
 from swimai.recon import Recon
-from swimai.structures import Attr, Value, Num, RecordMap
+from swimai.structures import Attr, Value, Num, RecordMap, Text
 from swimai.structures._structs import _Record, _Item
 
 
@@ -193,6 +193,22 @@ class _Form(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _get_string_header(headers: '_Record', key: str) -> Optional[str]:
+        """
+        Return the value of a header with a given key as string.
+
+        :param headers:         - Record of all headers.
+        :param key:             - Key of the header.
+        :return:                - Value of the header or None if the header is missing or is not a string.
+        """
+        header = headers.get(key)
+
+        if isinstance(header, Text):
+            return header.get_string_value()
+        else:
+            return None
+
 
 class _LinkAddressedForm(_Form):
 
@@ -232,25 +248,12 @@ class _LinkAddressedForm(_Form):
 
     def _cast(self, value: RecordMap) -> Optional['_Envelope']:
         headers = value._get_headers(self._tag)
-        node_uri = None
-        lane_uri = None
-        prio = 0.0
-        rate = 0.0
-
-        for index in range(0, headers.size):
-            header = headers.get_item(index)
-            key = header.key.get_string_value()
-
-            if key is not None:
-
-                if key == 'node':
-                    node_uri = header.value.get_string_value()
-                elif key == 'lane':
-                    lane_uri = header.value.get_string_value()
-                elif key == 'prio':
-                    prio = header.value.get_num_value()
-                elif key == 'rate':
-                    rate = header.value.get_num_value()
+        node_uri = _Form._get_string_header(headers, 'node')
+        lane_uri = _Form._get_string_header(headers, 'lane')
+        prio = headers.get('prio')
+        rate = headers.get('rate')
+        prio = prio.get_num_value() if isinstance(prio, Num) else 0.0
+        rate = rate.get_num_value() if isinstance(rate, Num) else 0.0
 
         if node_uri is not None and lane_uri is not None:
             body = value.get_body()
@@ -280,19 +283,8 @@ class _LaneAddressedForm(_Form):
     def _cast(self, item: 'RecordMap') -> Optional['_Envelope']:
         value = item
         headers = value._get_headers(self._tag)
-        node_uri = None
-        lane_uri = None
-
-        for index in range(0, headers.size):
-            header = headers.get_item(index)
-            key = header.key.get_string_value()
-
-            if key is not None:
-
-                if key == 'node':
-                    node_uri = header.value.get_string_value()
-                elif key == 'lane':
-                    lane_uri = header.value.get_string_value()
+        node_uri = _Form._get_string_header(headers, 'node')
+        lane_uri = _Form._get_string_header(headers, 'lane')
 
         if node_uri is not None and lane_uri is not None:
             body = value.get_body()
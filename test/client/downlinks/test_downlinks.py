@@ -11,25 +11,29 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import aiounittest
 
 from concurrent.futures import Future
+from threading import Timer, current_thread
 from unittest.mock import patch
 
-from swimai import SwimClient
+from swimai import SwimClient, AsyncSwimClient
 from swimai.client._connections import _DownlinkManager, _DownlinkManagerStatus
 from swimai.client._downlinks._downlinks import _EventDownlinkModel, _DownlinkModel, _ValueDownlinkModel, \
     _EventDownlinkView, \
     _DownlinkView, _ValueDownlinkView, _MapDownlinkModel, _MapDownlinkView
 from swimai.client._downlinks._utils import UpdateRequest, RemoveRequest
-from swimai.structures import Text, Attr, RecordMap, Num, Bool, Slot, Value
+from swimai.structures import Text, Attr, RecordMap, Num, Bool, Slot, Value, RecordConverter
 from swimai.structures._structs import _Absent, _Record
 from swimai.warp._warp import _LinkedResponse, _SyncedResponse, _EventMessage, _UnlinkedResponse
 from test.utils import MockConnection, MockExecuteOnException, MockWebsocketConnect, MockWebsocket, \
     mock_did_set_confirmation, ReceiveLoop, MockPerson, MockPet, NewScope, MockNoDefaultConstructor, MockCar, \
+    MockRequiredNamedTuple, MockRequiredFrozenDataclass, \
     MockModel, MockDownlinkManager, mock_on_event_callback, MockEventCallback, \
     MockDidSetCallback, mock_did_set_callback, MockDidUpdateCallback, mock_did_update_callback, \
-    mock_did_remove_callback, MockDidRemoveCallback
+    mock_did_remove_callback, MockDidRemoveCallback, mock_did_update_batch_callback, MockDidUpdateBatchCallback, \
+    create_map_entries
 
 
 class TestDownlinks(aiounittest.AsyncTestCase):
@@ -65,15 +69,12 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual(downlink, actual)
         self.assertIsInstance(actual.task, Future)
 
-    @patch('swimai.client._connections._DownlinkManager._close_views')
-    async def test_close_downlink_model_with_manager(self, mock_close_views):
+    async def test_close_downlink_model(self):
         # Given
         with SwimClient() as client:
             downlink = _EventDownlinkModel(client)
             downlink.connection = MockConnection.get_mock_connection()
             downlink = downlink._open()
-            manager = _DownlinkManager(MockConnection.get_mock_connection())
-            downlink.downlink_manager = manager
 
             # When
             actual = downlink._close()
@@ -85,27 +86,70 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertIsInstance(actual.task, Future)
         self.assertTrue(actual.task.done())
         self.assertTrue(actual.task.cancelled())
-        self.assertTrue(mock_close_views.called)
 
-    @patch('swimai.client._connections._DownlinkManager._close_views')
-    async def test_close_downlink_model_without_manager(self, mock_close_views):
+    async def test_close_map_downlink_model_discards_batch(self):
         # Given
         with SwimClient() as client:
-            downlink = _EventDownlinkModel(client)
+            downlink = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            mock_manager = MockDownlinkManager()
+            downlink.downlink_manager = mock_manager
             downlink.connection = MockConnection.get_mock_connection()
+            downlink._batch_window = 10
             downlink = downlink._open()
+            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=UpdateRequest('a', 1).to_record())
+            client._schedule_task(downlink._receive_synced).result()
+            client._schedule_task(downlink._receive_event, event_message).result()
+            handle = downlink._batch_handle
+
+            async def close():
+                return downlink._close()
 
             # When
-            actual = downlink._close()
+            actual = client._run_task(close)
             while not actual.task.done():
                 pass
 
         # Then
-        self.assertEqual(downlink, actual)
-        self.assertIsInstance(actual.task, Future)
-        self.assertTrue(actual.task.done())
-        self.assertTrue(actual.task.cancelled())
-        self.assertFalse(mock_close_views.called)
+        self.assertTrue(handle.cancelled())
+        self.assertIsNone(actual._batch_handle)
+        self.assertEqual({}, actual._batch)
+        self.assertIsNone(mock_manager.update_batch)
+
+    async def test_map_downlink_model_flush_pending(self):
+        # Given
+        with SwimClient() as client:
+            downlink = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            mock_manager = MockDownlinkManager()
+            downlink.downlink_manager = mock_manager
+            downlink._batch_window = 10
+            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=UpdateRequest('a', 1).to_record())
+            client._schedule_task(downlink._receive_synced).result()
+            client._schedule_task(downlink._receive_event, event_message).result()
+            # When
+            downlink._flush_pending()
+            while mock_manager.update_batch is None:
+                pass
+
+        # Then
+        self.assertEqual([(Text.create_from('a'), Num.create_from(1), Value.absent())], mock_manager.update_batch)
+        self.assertIsNone(downlink._batch_handle)
+
+    async def test_map_downlink_view_execute_did_update_batch_only(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view.did_update_batch(MockDidUpdateBatchCallback().execute)
+            model = _MapDownlinkModel(client)
+            model.downlink_manager = MockDownlinkManager()
+            downlink_view._model = model
+            # When
+            await downlink_view._execute_did_update(Text.create_from('a'), Num.create_from(1), Value.absent())
+            await downlink_view._execute_did_remove(Text.create_from('a'), Num.create_from(1))
+
+        # Then
+        self.assertEqual({}, model._conversions)
 
     async def test_downlink_model_receive_message_linked(self):
         # Given
@@ -162,7 +206,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(downlink, actual)
-        self.assertEqual('event_body', actual._value)
+        self.assertEqual(_Record.create_from(Text.create_from('event_body')), actual._value)
 
     @patch('warnings.warn')
     async def test_downlink_model_receive_message_unlinked(self, mock_warn):
@@ -287,6 +331,35 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual('Cannot execute "set_lane_uri" after the downlink has been opened!',
                          mock_warn.mock_calls[0][1][0])
 
+    async def test_downlink_view_set_prio_rate(self):
+        # Given
+        with SwimClient() as client:
+            downlink = _ValueDownlinkView(client)
+            # When
+            actual = downlink.set_prio(2.5).set_rate(10)
+
+        # Then
+        self.assertEqual(downlink, actual)
+        self.assertEqual(2.5, actual._prio)
+        self.assertEqual(10, actual._rate)
+
+    @patch('warnings.warn')
+    async def test_downlink_view_set_prio_rate_after_open(self, mock_warn):
+        # Given
+        with SwimClient() as client:
+            downlink = _EventDownlinkView(client)
+            downlink._is_open = True
+            # When
+            downlink.set_prio(1)
+            downlink.set_rate(5)
+        # Then
+        self.assertEqual(0.0, downlink._prio)
+        self.assertEqual(0.0, downlink._rate)
+        self.assertEqual('Cannot execute "set_prio" after the downlink has been opened!',
+                         mock_warn.mock_calls[0][1][0])
+        self.assertEqual('Cannot execute "set_rate" after the downlink has been opened!',
+                         mock_warn.mock_calls[1][1][0])
+
     async def test_downlink_view_route(self):
         # Given
         with SwimClient() as client:
@@ -433,6 +506,60 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         # Then
         self.assertTrue(downlink.strict)
 
+    async def test_downlink_view_get_format_from_self(self):
+        # Given
+        with SwimClient() as client:
+            # When
+            downlink = _ValueDownlinkView(client)
+
+        # Then
+        self.assertEqual('object', downlink.format)
+
+    async def test_downlink_view_set_format_to_self(self):
+        # Given
+        with SwimClient() as client:
+            downlink = _ValueDownlinkView(client)
+            # When
+            downlink.format = 'recon'
+
+        # Then
+        self.assertEqual('recon', downlink.format)
+
+    async def test_downlink_view_set_format_invalid(self):
+        # Given
+        with SwimClient() as client:
+            downlink = _ValueDownlinkView(client)
+            # When
+            with self.assertRaises(Exception) as error:
+                downlink.format = 'json'
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Format "json" is not supported!', message)
+        self.assertEqual('object', downlink.format)
+
+    async def test_downlink_view_format_per_view(self):
+        # Given
+        with SwimClient() as client:
+            model = _ValueDownlinkModel(client)
+            model._value = Num.create_from(5)
+            manager = _DownlinkManager(MockConnection.get_mock_connection())
+            manager.downlink_model = model
+            views = [_ValueDownlinkView(client), _ValueDownlinkView(client), _ValueDownlinkView(client)]
+            views[1].format = 'recon'
+
+            for view in views:
+                await view._register_manager(manager)
+
+            # When
+            views[2].format = 'value'
+            actual = [view._value for view in views]
+
+        # Then
+        self.assertEqual([5, '5', Num.create_from(5)], actual)
+        self.assertEqual(['object', 'recon', 'value'], [view.format for view in views])
+        self.assertEqual(Num.create_from(5), model._value)
+
     @patch('websockets.connect', new_callable=MockWebsocketConnect)
     async def test_downlink_view_set_strict_to_manager(self, mock_websocket_connect):
         # Given
@@ -471,6 +598,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual(2, len(downlink.registered_classes))
         self.assertEqual(mock_person_class, downlink.registered_classes.get('MockPerson'))
         self.assertEqual(mock_pet_class, downlink.registered_classes.get('MockPet'))
+        self.assertIn(mock_pet_class, RecordConverter.get_converter()._codecs)
 
     async def test_downlink_view_register_class_self(self):
         # Given
@@ -583,6 +711,31 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             mock_warn.mock_calls[0][1][0])
         self.assertEqual(0, len(downlink.registered_classes))
 
+    async def test_downlink_view_register_class_named_tuple_required_field(self):
+        # Given
+        with SwimClient() as client:
+            downlink = _ValueDownlinkView(client)
+            # When
+            downlink.register_class(MockRequiredNamedTuple)
+            actual = downlink._to_object(RecordConverter.get_converter().object_to_record(MockRequiredNamedTuple(7)))
+
+        # Then
+        self.assertEqual(MockRequiredNamedTuple, downlink.registered_classes.get('MockRequiredNamedTuple'))
+        self.assertEqual(MockRequiredNamedTuple(7), actual)
+
+    async def test_downlink_view_register_class_frozen_dataclass_required_field(self):
+        # Given
+        with SwimClient() as client:
+            downlink = _ValueDownlinkView(client)
+            # When
+            downlink.register_class(MockRequiredFrozenDataclass)
+            actual = downlink._to_object(
+                RecordConverter.get_converter().object_to_record(MockRequiredFrozenDataclass(3)))
+
+        # Then
+        self.assertEqual(MockRequiredFrozenDataclass, downlink.registered_classes.get('MockRequiredFrozenDataclass'))
+        self.assertEqual(MockRequiredFrozenDataclass(3), actual)
+
     async def test_downlink_view_deregister_all_classes_self(self):
         # Given
         with SwimClient() as client:
@@ -814,6 +967,19 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual(mock_person_class, manager.registered_classes.get('MockPerson'))
         self.assertEqual(mock_car_class, manager.registered_classes.get('MockCar'))
 
+    async def test_downlink_view_initialise_model_prio_rate(self):
+        # Given
+        manager = _DownlinkManager(MockWebsocketConnect())
+        with SwimClient() as client:
+            model = _EventDownlinkModel(client)
+            downlink = _EventDownlinkView(client).set_prio(3).set_rate(0.5)
+            # When
+            await downlink._initalise_model(manager, model)
+
+        # Then
+        self.assertEqual(3, model.prio)
+        self.assertEqual(0.5, model.rate)
+
     @patch('websockets.connect', new_callable=MockWebsocketConnect)
     async def test_downlink_view_register_and_deregister_classes(self, mock_websocket_connect):
         # Given
@@ -911,6 +1077,22 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual(1, len(downlink_model.connection.messages_sent))
         self.assertEqual('@link(node:foo,lane:bar)', downlink_model.connection.messages_sent[0])
 
+    async def test_event_downlink_model_establish_downlink_prio_rate(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _EventDownlinkModel(client)
+            downlink_model.node_uri = 'foo'
+            downlink_model.lane_uri = 'bar'
+            downlink_model.prio = 2
+            downlink_model.rate = 10
+            downlink_model.connection = MockConnection()
+
+            # When
+            await downlink_model._establish_downlink()
+
+        # Then
+        self.assertEqual('@link(node:foo,lane:bar,prio:2,rate:10)', downlink_model.connection.messages_sent[0])
+
     async def test_event_downlink_model_received_synced(self):
         # Given
         client = SwimClient()
@@ -949,7 +1131,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         await downlink_model._receive_event(event_message)
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual('message', mock_manager.event)
+        self.assertEqual(Text.create_from('message'), mock_manager.event)
 
     async def test_event_downlink_receive_event_num(self):
         # Given
@@ -963,7 +1145,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         await downlink_model._receive_event(event_message)
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual(21, mock_manager.event)
+        self.assertEqual(Num.create_from(21), mock_manager.event)
 
     async def test_event_downlink_receive_event_bool(self):
         # Given
@@ -977,7 +1159,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         await downlink_model._receive_event(event_message)
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual(True, mock_manager.event)
+        self.assertEqual(Bool.create_from(True), mock_manager.event)
 
     async def test_event_downlink_receive_event_object(self):
         # Given
@@ -995,8 +1177,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         await downlink_model._receive_event(event_message)
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual(25, mock_manager.event.age)
-        self.assertEqual('George', mock_manager.event.name)
+        self.assertEqual(recon_person, mock_manager.event)
 
     async def test_event_downlink_view_register_manager(self):
         # Given
@@ -1046,7 +1227,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view = _EventDownlinkView(client)
             mock_on_event = MockEventCallback()
             downlink_view._on_event_callback = mock_on_event.execute
-            event = 20
+            event = Num.create_from(20)
             # When
             await downlink_view._execute_on_event(event)
             while not mock_on_event.called:
@@ -1120,6 +1301,21 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual(1, len(downlink_model.connection.messages_sent))
         self.assertEqual('@sync(node:foo,lane:bar)', downlink_model.connection.messages_sent[0])
 
+    async def test_value_downlink_model_establish_downlink_prio_rate(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _ValueDownlinkModel(client)
+            downlink_model.node_uri = 'foo'
+            downlink_model.lane_uri = 'bar'
+            downlink_model.rate = 0.5
+            downlink_model.connection = MockConnection()
+
+            # When
+            await downlink_model._establish_downlink()
+
+        # Then
+        self.assertEqual('@sync(node:foo,lane:bar,rate:0.5)', downlink_model.connection.messages_sent[0])
+
     async def test_value_downlink_model_receive_synced(self):
         # Given
         with SwimClient() as client:
@@ -1156,9 +1352,9 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=Text.create_from('value_text'))
             await downlink_model._receive_event(event_message)
         # Then
-        self.assertEqual('value_text', downlink_model._value)
+        self.assertEqual(Text.create_from('value_text'), downlink_model._value)
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual('value_text', mock_manager.did_set_new)
+        self.assertEqual(Text.create_from('value_text'), mock_manager.did_set_new)
         self.assertEqual(Value.absent(), mock_manager.did_set_old)
 
     async def test_value_downlink_model_receive_event_num(self):
@@ -1174,10 +1370,10 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=Num.create_from(50))
             await downlink_model._receive_event(event_message)
         # Then
-        self.assertEqual(50, downlink_model._value)
+        self.assertEqual(Num.create_from(50), downlink_model._value)
         self.assertEqual(2, mock_manager.called)
-        self.assertEqual(50, mock_manager.did_set_new)
-        self.assertEqual(11, mock_manager.did_set_old)
+        self.assertEqual(Num.create_from(50), mock_manager.did_set_new)
+        self.assertEqual(Num.create_from(11), mock_manager.did_set_old)
 
     async def test_value_downlink_model_receive_event_bool(self):
         # Given
@@ -1190,9 +1386,9 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=Bool.create_from(True))
             await downlink_model._receive_event(event_message)
         # Then
-        self.assertEqual(True, downlink_model._value)
+        self.assertEqual(Bool.create_from(True), downlink_model._value)
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual(True, mock_manager.did_set_new)
+        self.assertEqual(Bool.create_from(True), mock_manager.did_set_new)
         self.assertEqual(Value.absent(), mock_manager.did_set_old)
 
     async def test_value_downlink_model_receive_event_object(self):
@@ -1210,13 +1406,66 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             # When
             await downlink_model._receive_event(event_message)
         # Then
-        self.assertEqual('Peter', downlink_model._value.name)
-        self.assertEqual(90, downlink_model._value.age)
+        self.assertIs(recon_person, downlink_model._value)
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual('Peter', mock_manager.did_set_new.name)
-        self.assertEqual(90, mock_manager.did_set_new.age)
+        self.assertIs(recon_person, mock_manager.did_set_new)
         self.assertEqual(Value.absent(), mock_manager.did_set_old)
 
+    async def test_value_downlink_view_execute_did_set_format_value(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            downlink_view.format = 'value'
+            mock_did_set = MockDidSetCallback()
+            downlink_view._did_set_callback = mock_did_set.execute
+            recon_person = RecordMap.create()
+            recon_person.add(Attr.create_attr('MockPerson', Value.extant()))
+            recon_person.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Peter')))
+            # When
+            await downlink_view._execute_did_set(recon_person, Value.absent())
+            while not mock_did_set.called:
+                pass
+        # Then
+        self.assertIs(recon_person, mock_did_set.new_value)
+        self.assertEqual(Value.absent(), mock_did_set.old_value)
+
+    async def test_value_downlink_view_execute_did_set_format_recon(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            downlink_view.format = 'recon'
+            mock_did_set = MockDidSetCallback()
+            downlink_view._did_set_callback = mock_did_set.execute
+            recon_person = RecordMap.create()
+            recon_person.add(Attr.create_attr('MockPerson', Value.extant()))
+            recon_person.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Peter')))
+            # When
+            await downlink_view._execute_did_set(recon_person, Value.absent())
+            while not mock_did_set.called:
+                pass
+        # Then
+        self.assertEqual('@MockPerson{name:Peter}', mock_did_set.new_value)
+        self.assertEqual(Value.absent(), mock_did_set.old_value)
+
+    async def test_value_downlink_view_execute_did_set_object(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            mock_did_set = MockDidSetCallback()
+            downlink_view._did_set_callback = mock_did_set.execute
+            recon_person = RecordMap.create()
+            recon_person.add(Attr.create_attr('MockPerson', Value.extant()))
+            recon_person.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Peter')))
+            recon_person.add(Slot.create_slot(Text.create_from('age'), Num.create_from(90)))
+            # When
+            await downlink_view._execute_did_set(recon_person, Value.absent())
+            while not mock_did_set.called:
+                pass
+        # Then
+        self.assertEqual('Peter', mock_did_set.new_value.name)
+        self.assertEqual(90, mock_did_set.new_value.age)
+        self.assertEqual(Value.absent(), mock_did_set.old_value)
+
     async def test_value_downlink_model_send_message(self):
         # Given
         with SwimClient() as client:
@@ -1287,7 +1536,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             mock_did_set = MockDidSetCallback()
             downlink_view.did_set(mock_did_set.execute)
             downlink_model = _ValueDownlinkModel(client)
-            downlink_model._value = 'Foo'
+            downlink_model._value = Text.create_from('Foo')
             connection = MockConnection()
             # noinspection PyTypeChecker
             manager = _DownlinkManager(connection)
@@ -1370,19 +1619,21 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         with SwimClient() as client:
             downlink_view = _ValueDownlinkView(client)
             downlink_view._model = _ValueDownlinkModel(client)
-            downlink_view._model._value = 50
+            downlink_view._model._value = Num.create_from(50)
             # When
             actual = downlink_view._value
+            cached = downlink_view._value
 
         # Then
         self.assertEqual(50, actual)
+        self.assertIs(actual, cached)
 
     async def test_value_downlink_view_get_immediate(self):
         # Given
         client = SwimClient()
         downlink_view = _ValueDownlinkView(client)
         downlink_model = _ValueDownlinkModel(client)
-        downlink_model._value = 41
+        downlink_model._value = Num.create_from(41)
         downlink_view._model = downlink_model
         downlink_view._is_open = True
         # When
@@ -1395,7 +1646,24 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         with SwimClient() as client:
             downlink_view = _ValueDownlinkView(client)
             downlink_model = _ValueDownlinkModel(client)
-            downlink_model._value = 'Some text'
+            downlink_model._value = Text.create_from('Some text')
+            downlink_model._synced.set()
+            downlink_view._model = downlink_model
+            downlink_view._initialised.set()
+            downlink_view._is_open = True
+            # When
+            actual = downlink_view.get(wait_sync=True)
+
+        # Then
+        self.assertEqual('Some text', actual)
+
+    @patch('swimai.client._swim_client.SwimClient._run_task')
+    async def test_value_downlink_view_get_with_wait_synced(self, mock_run_task):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            downlink_model = _ValueDownlinkModel(client)
+            downlink_model._value = Text.create_from('Some text')
             downlink_model._synced.set()
             downlink_view._model = downlink_model
             downlink_view._initialised.set()
@@ -1405,6 +1673,39 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual('Some text', actual)
+        mock_run_task.assert_not_called()
+
+    @patch('swimai.client._swim_client.SwimClient._run_task')
+    async def test_value_downlink_view_get_with_wait_initialised_not_synced(self, mock_run_task):
+        # Given
+        mock_run_task.return_value = 'Some text'
+
+        with SwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            downlink_view._model = _ValueDownlinkModel(client)
+            downlink_view._initialised.set()
+            downlink_view._is_open = True
+            # When
+            actual = downlink_view.get(wait_sync=True)
+
+        # Then
+        self.assertEqual('Some text', actual)
+        mock_run_task.assert_called_once_with(downlink_view._get_value)
+
+    @patch('swimai.client._swim_client.SwimClient._run_task')
+    async def test_value_downlink_view_get_with_wait_not_initialised(self, mock_run_task):
+        # Given
+        mock_run_task.return_value = 'Some text'
+
+        with SwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            downlink_view._is_open = True
+            # When
+            actual = downlink_view.get(wait_sync=True)
+
+        # Then
+        self.assertEqual('Some text', actual)
+        mock_run_task.assert_called_once_with(downlink_view._get_value)
 
     @patch('warnings.warn')
     async def test_value_downlink_view_get_before_open(self, mock_warn):
@@ -1443,8 +1744,9 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual('@command(node:bar_node,lane:foo_lane)66', mock_connection.messages_sent[0])
         self.assertTrue(mock_result.called)
 
+    @patch('swimai.client._swim_client.SwimClient._exception_handler')
     @patch('concurrent.futures._base.Future.result')
-    async def test_value_downlink_view_set_non_blocking(self, mock_result):
+    async def test_value_downlink_view_set_non_blocking(self, mock_result, mock_exception_handler):
         # Given
         with SwimClient() as client:
             node_uri = 'bar_node'
@@ -1486,15 +1788,15 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view = _ValueDownlinkView(client)
             mock_did_set = MockDidSetCallback()
             downlink_view._did_set_callback = mock_did_set.execute
-            new_value = 'Test_new_value'
-            old_value = 'Test_old_value'
+            new_value = Text.create_from('Test_new_value')
+            old_value = Text.create_from('Test_old_value')
             # When
             await downlink_view._execute_did_set(new_value, old_value)
             while not mock_did_set.called:
                 pass
         # Then
-        self.assertEqual(new_value, mock_did_set.new_value)
-        self.assertEqual(old_value, mock_did_set.old_value)
+        self.assertEqual('Test_new_value', mock_did_set.new_value)
+        self.assertEqual('Test_old_value', mock_did_set.old_value)
 
     async def test_value_downlink_view_execute_did_set_no_callback(self):
         # Given
@@ -1556,6 +1858,21 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual(1, len(downlink_model.connection.messages_sent))
         self.assertEqual('@sync(node:dog,lane:bark)', downlink_model.connection.messages_sent[0])
 
+    async def test_map_downlink_model_establish_downlink_prio_rate(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _MapDownlinkModel(client)
+            downlink_model.node_uri = 'dog'
+            downlink_model.lane_uri = 'bark'
+            downlink_model.prio = 1.5
+            downlink_model.connection = MockConnection()
+
+            # When
+            await downlink_model._establish_downlink()
+
+        # Then
+        self.assertEqual('@sync(node:dog,lane:bark,prio:1.5)', downlink_model.connection.messages_sent[0])
+
     async def test_map_downlink_model_receive_synced(self):
         # Given
         with SwimClient() as client:
@@ -1580,8 +1897,8 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual('Elliot', mock_manager.update_key)
-        self.assertEqual(29, mock_manager.update_value_new)
+        self.assertEqual(Text.create_from('Elliot'), mock_manager.update_key)
+        self.assertEqual(Num.create_from(29), mock_manager.update_value_new)
         self.assertEqual(Value.absent(), mock_manager.update_value_old)
 
     async def test_map_downlink_model_receive_event_update_object(self):
@@ -1601,11 +1918,46 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual(person.name, mock_manager.update_key.name)
-        self.assertEqual(person.age, mock_manager.update_key.age)
-        self.assertEqual('Hello', mock_manager.update_value_new)
+        self.assertEqual(RecordConverter.get_converter().object_to_record(person), mock_manager.update_key)
+        self.assertEqual(Text.create_from('Hello'), mock_manager.update_value_new)
         self.assertEqual(Value.absent(), mock_manager.update_value_old)
 
+    async def test_map_downlink_view_execute_did_update_format_value(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view.format = 'value'
+            mock_did_update = MockDidUpdateCallback()
+            downlink_view._did_update_callback = mock_did_update.execute
+            key = RecordConverter.get_converter().object_to_record(MockPerson(name='Elliot', age=29))
+            # When
+            await downlink_view._execute_did_update(key, Text.create_from('Hello'), Value.absent())
+            while not mock_did_update.called:
+                pass
+
+        # Then
+        self.assertIs(key, mock_did_update.key)
+        self.assertEqual(Text.create_from('Hello'), mock_did_update.new_value)
+        self.assertEqual(Value.absent(), mock_did_update.old_value)
+
+    async def test_map_downlink_view_execute_did_update_format_recon(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view.format = 'recon'
+            mock_did_update = MockDidUpdateCallback()
+            downlink_view._did_update_callback = mock_did_update.execute
+            key = RecordConverter.get_converter().object_to_record(MockPerson(name='Elliot', age=29))
+            # When
+            await downlink_view._execute_did_update(key, Text.create_from('Hello'), Value.absent())
+            while not mock_did_update.called:
+                pass
+
+        # Then
+        self.assertEqual('@MockPerson{name:Elliot,age:29}', mock_did_update.key)
+        self.assertEqual('Hello', mock_did_update.new_value)
+        self.assertEqual(Value.absent(), mock_did_update.old_value)
+
     async def test_map_downlink_model_receive_event_update_primitive_existing(self):
         # Given
         with SwimClient() as client:
@@ -1614,7 +1966,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             mock_manager = MockDownlinkManager()
             downlink_model.downlink_manager = mock_manager
             downlink_model._synced.set()
-            downlink_model._map['Elliot'] = ('Elliot', 11)
+            downlink_model._map.update(create_map_entries(('Elliot', 11)))
             update_request = UpdateRequest('Elliot', 29)
             event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=update_request.to_record())
             # When
@@ -1622,9 +1974,9 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual('Elliot', mock_manager.update_key)
-        self.assertEqual(29, mock_manager.update_value_new)
-        self.assertEqual(11, mock_manager.update_value_old)
+        self.assertEqual(Text.create_from('Elliot'), mock_manager.update_key)
+        self.assertEqual(Num.create_from(29), mock_manager.update_value_new)
+        self.assertEqual(Num.create_from(11), mock_manager.update_value_old)
 
     async def test_map_downlink_model_receive_event_update_object_existing(self):
         # Given
@@ -1636,7 +1988,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_model.downlink_manager = mock_manager
             downlink_model._synced.set()
             person = MockPerson(name='Elliot', age=29)
-            downlink_model._map['@MockPerson{name:Elliot,age:29}'] = (person, 'bar')
+            downlink_model._map.update(create_map_entries((person, 'bar')))
             update_request = UpdateRequest(person, 'Hello')
             event_message = _EventMessage(node_uri='baz', lane_uri='qux', body=update_request.to_record())
             # When
@@ -1644,10 +1996,9 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual(person.name, mock_manager.update_key.name)
-        self.assertEqual(person.age, mock_manager.update_key.age)
-        self.assertEqual('Hello', mock_manager.update_value_new)
-        self.assertEqual('bar', mock_manager.update_value_old)
+        self.assertEqual(RecordConverter.get_converter().object_to_record(person), mock_manager.update_key)
+        self.assertEqual(Text.create_from('Hello'), mock_manager.update_value_new)
+        self.assertEqual(Text.create_from('bar'), mock_manager.update_value_old)
 
     async def test_map_downlink_model_receive_event_remove_primitive(self):
         # Given
@@ -1657,7 +2008,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             mock_manager = MockDownlinkManager()
             downlink_model.downlink_manager = mock_manager
             downlink_model._synced.set()
-            downlink_model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            downlink_model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             remove_request = RemoveRequest('b')
             event_message = _EventMessage(node_uri='baz', lane_uri='qux', body=remove_request.to_record())
             # When
@@ -1665,8 +2016,8 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual('b', mock_manager.remove_key)
-        self.assertEqual(2, mock_manager.remove_old_value)
+        self.assertEqual(Text.create_from('b'), mock_manager.remove_key)
+        self.assertEqual(Num.create_from(2), mock_manager.remove_old_value)
 
     async def test_map_downlink_model_receive_event_remove_object(self):
         # Given
@@ -1680,8 +2031,8 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             first_person = MockPerson(name='Foo', age=1)
             second_person = MockPerson(name='Bar', age=2)
 
-            downlink_model._map = {'@MockPerson{name:Foo,age:1}': (first_person, 'a'),
-                                   '@MockPerson{name:Bar,age:2}': (second_person, 'b')}
+            converter = RecordConverter.get_converter()
+            downlink_model._map = create_map_entries((first_person, 'a'), (second_person, 'b'))
 
             remove_request = RemoveRequest(first_person)
             event_message = _EventMessage(node_uri='baz', lane_uri='qux', body=remove_request.to_record())
@@ -1690,9 +2041,8 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual(first_person.name, mock_manager.remove_key.name)
-        self.assertEqual(first_person.age, mock_manager.remove_key.age)
-        self.assertEqual('a', mock_manager.remove_old_value)
+        self.assertEqual(converter.object_to_record(first_person), mock_manager.remove_key)
+        self.assertEqual(Text.create_from('a'), mock_manager.remove_old_value)
 
     async def test_map_downlink_model_receive_event_remove_missing(self):
         # Given
@@ -1709,45 +2059,166 @@ class TestDownlinks(aiounittest.AsyncTestCase):
 
         # Then
         self.assertEqual(1, mock_manager.called)
-        self.assertEqual('b', mock_manager.remove_key)
+        self.assertEqual(Text.create_from('b'), mock_manager.remove_key)
         self.assertEqual(Value.absent(), mock_manager.remove_old_value)
 
-    async def test_map_downlink_model_send_message(self):
+    async def test_map_downlink_model_receive_event_update_numeric_key(self):
         # Given
         with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
             downlink_model = _MapDownlinkModel(client)
-            downlink_model.connection = MockConnection.get_mock_connection()
-            downlink_model.connection.owner = downlink_model
-            downlink_model.linked.set()
-            update_request = UpdateRequest('Elliot', 29)
-            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=update_request.to_record())
+            # noinspection PyTypeChecker
+            downlink_model.downlink_manager = MockDownlinkManager()
+            downlink_view._model = downlink_model
+            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=UpdateRequest(1, 'Foo').to_record())
             # When
-            await downlink_model._send_message(event_message)
+            await downlink_model._receive_event(event_message)
+            actual = downlink_view.get(1)
 
         # Then
-        self.assertEqual('@event(node:foo,lane:bar)@update(key:Elliot)29',
-                         MockConnection.get_mock_connection().messages_sent[0])
+        self.assertEqual('Foo', actual)
+        self.assertEqual((Text.create_from('Foo'), Value.absent()),
+                         (downlink_model._map[Num.create_from(1)][1], downlink_view.get('1')))
 
-    async def test_map_downlink_model_get_value_with_key(self):
+    async def test_map_downlink_model_receive_event_batch_conflate_updates(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            mock_manager = MockDownlinkManager()
+            downlink_model.downlink_manager = mock_manager
+            downlink_model._batch_window = 0.1
+            downlink_model._map.update(create_map_entries(('Elliot', 11)))
+            first_message = _EventMessage(node_uri='foo', lane_uri='bar', body=UpdateRequest('Elliot', 29).to_record())
+            second_message = _EventMessage(node_uri='foo', lane_uri='bar', body=UpdateRequest('Elliot', 30).to_record())
+            # When
+            await downlink_model._receive_event(first_message)
+            await downlink_model._receive_event(second_message)
+
+        # Then
+        self.assertEqual(2, mock_manager.called)
+        self.assertIsNone(mock_manager.update_batch)
+        self.assertEqual(1, len(downlink_model._batch))
+        self.assertEqual((Text.create_from('Elliot'), Num.create_from(30), Num.create_from(11)),
+                         downlink_model._batch[Text.create_from('Elliot')])
+        self.assertIsNone(downlink_model._batch_handle)
+
+    async def test_map_downlink_model_receive_event_batch_update_remove(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            mock_manager = MockDownlinkManager()
+            downlink_model.downlink_manager = mock_manager
+            downlink_model._batch_window = 0.1
+            downlink_model._map.update(create_map_entries(('Bar', 1)))
+            messages = [UpdateRequest('Foo', 1), RemoveRequest('Foo'), UpdateRequest('Bar', 2), RemoveRequest('Bar')]
+            # When
+            for request in messages:
+                await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                                  body=request.to_record()))
+
+        # Then
+        self.assertEqual(4, mock_manager.called)
+        self.assertEqual(1, len(downlink_model._batch))
+        self.assertEqual((Text.create_from('Bar'), Value.absent(), Num.create_from(1)),
+                         downlink_model._batch[Text.create_from('Bar')])
+
+    async def test_map_downlink_model_receive_event_batch_disabled(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            mock_manager = MockDownlinkManager()
+            downlink_model.downlink_manager = mock_manager
+            update_request = UpdateRequest('Elliot', 29)
+            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=update_request.to_record())
+            # When
+            await downlink_model._receive_event(event_message)
+            await downlink_model._receive_synced()
+
+        # Then
+        self.assertEqual(1, mock_manager.called)
+        self.assertEqual({}, downlink_model._batch)
+        self.assertIsNone(mock_manager.update_batch)
+
+    async def test_map_downlink_model_receive_synced_flush_batch(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            mock_manager = MockDownlinkManager()
+            downlink_model.downlink_manager = mock_manager
+            downlink_model._batch_window = 0.1
+            update_request = UpdateRequest('Elliot', 29)
+            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=update_request.to_record())
+            await downlink_model._receive_event(event_message)
+            # When
+            await downlink_model._receive_synced()
+
+        # Then
+        self.assertEqual(2, mock_manager.called)
+        self.assertEqual([(Text.create_from('Elliot'), Num.create_from(29), Value.absent())], mock_manager.update_batch)
+        self.assertEqual({}, downlink_model._batch)
+
+    async def test_map_downlink_model_flush_batch_after_window(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            mock_manager = MockDownlinkManager()
+            downlink_model.downlink_manager = mock_manager
+            downlink_model._batch_window = 0.01
+            update_request = UpdateRequest('Elliot', 29)
+            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=update_request.to_record())
+            client._schedule_task(downlink_model._receive_synced).result()
+            # When
+            client._schedule_task(downlink_model._receive_event, event_message).result()
+            while mock_manager.update_batch is None:
+                pass
+
+        # Then
+        self.assertEqual(2, mock_manager.called)
+        self.assertEqual([(Text.create_from('Elliot'), Num.create_from(29), Value.absent())], mock_manager.update_batch)
+        self.assertIsNone(downlink_model._batch_handle)
+
+    async def test_map_downlink_model_send_message(self):
+        # Given
+        with SwimClient() as client:
+            downlink_model = _MapDownlinkModel(client)
+            downlink_model.connection = MockConnection.get_mock_connection()
+            downlink_model.connection.owner = downlink_model
+            downlink_model.linked.set()
+            update_request = UpdateRequest('Elliot', 29)
+            event_message = _EventMessage(node_uri='foo', lane_uri='bar', body=update_request.to_record())
+            # When
+            await downlink_model._send_message(event_message)
+
+        # Then
+        self.assertEqual('@event(node:foo,lane:bar)@update(key:Elliot)29',
+                         MockConnection.get_mock_connection().messages_sent[0])
+
+    async def test_map_downlink_model_get_value_with_key(self):
         # Given
         with SwimClient() as client:
             downlink_model = _MapDownlinkModel(client)
             downlink_model._synced.set()
-            downlink_model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            downlink_model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             # When
-            actual = await downlink_model._get_value('b')
+            actual = await downlink_model._get_value(Text.create_from('b'))
 
         # Then
-        self.assertEqual(2, actual)
+        self.assertEqual(Num.create_from(2), actual)
 
     async def test_map_downlink_model_get_value_with_key_missing(self):
         # Given
         with SwimClient() as client:
             downlink_model = _MapDownlinkModel(client)
             downlink_model._synced.set()
-            downlink_model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            downlink_model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             # When
-            actual = await downlink_model._get_value('f')
+            actual = await downlink_model._get_value(Text.create_from('f'))
 
         # Then
         self.assertEqual(Value.absent(), actual)
@@ -1757,23 +2228,14 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         with SwimClient() as client:
             downlink_model = _MapDownlinkModel(client)
             downlink_model._synced.set()
-            downlink_model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            downlink_model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             # When
             actual = await downlink_model._get_values()
 
         # Then
         self.assertIsInstance(actual, list)
         self.assertEqual(5, len(actual))
-        self.assertEqual('a', actual[0][0])
-        self.assertEqual(1, actual[0][1])
-        self.assertEqual('b', actual[1][0])
-        self.assertEqual(2, actual[1][1])
-        self.assertEqual('c', actual[2][0])
-        self.assertEqual(3, actual[2][1])
-        self.assertEqual('d', actual[3][0])
-        self.assertEqual(4, actual[3][1])
-        self.assertEqual('e', actual[4][0])
-        self.assertEqual(5, actual[4][1])
+        self.assertEqual(list(create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5)).values()), actual)
 
     async def test_map_downlink_model_get_values_objects(self):
         # Given
@@ -1782,18 +2244,18 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_model._synced.set()
             first_person = MockPerson(name='Foo', age=1)
             second_person = MockPerson(name='Bar', age=2)
-            downlink_model._map = {'@MockPerson{name:Foo,age:1}': (first_person, 'a'),
-                                   '@MockPerson{name:Bar,age:2}': (second_person, 'b')}
+            converter = RecordConverter.get_converter()
+            downlink_model._map = create_map_entries((first_person, 'a'), (second_person, 'b'))
             # When
             actual = await downlink_model._get_values()
 
         # Then
         self.assertIsInstance(actual, list)
         self.assertEqual(2, len(actual))
-        self.assertEqual(first_person, actual[0][0])
-        self.assertEqual('a', actual[0][1])
-        self.assertEqual(second_person, actual[1][0])
-        self.assertEqual('b', actual[1][1])
+        self.assertEqual(converter.object_to_record(first_person), actual[0][0])
+        self.assertEqual(Text.create_from('a'), actual[0][1])
+        self.assertEqual(converter.object_to_record(second_person), actual[1][0])
+        self.assertEqual(Text.create_from('b'), actual[1][1])
 
     async def test_map_downlink_model_get_values_empty(self):
         # Given
@@ -1821,6 +2283,8 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertFalse(actual.strict)
         self.assertIsNone(actual._did_update_callback)
         self.assertIsNone(actual._did_remove_callback)
+        self.assertIsNone(actual._did_update_batch_callback)
+        self.assertIsNone(actual._batch_window)
         self.assertFalse(actual._initialised.is_set())
 
     async def test_map_downlink_view_register_manager_first_time(self):
@@ -1846,7 +2310,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             mock_did_update = MockDidUpdateCallback()
             downlink_view.did_update(mock_did_update.execute)
             downlink_model = _MapDownlinkModel(client)
-            downlink_model._map = {'a': ('a', 1)}
+            downlink_model._map = create_map_entries(('a', 1))
             connection = MockConnection()
             # noinspection PyTypeChecker
             manager = _DownlinkManager(connection)
@@ -1907,7 +2371,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         with SwimClient() as client:
             downlink_view = _MapDownlinkView(client)
             model = _MapDownlinkModel(client)
-            model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             key = 'c'
             downlink_view._model = model
             # When
@@ -1921,7 +2385,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         with SwimClient() as client:
             downlink_view = _MapDownlinkView(client)
             model = _MapDownlinkModel(client)
-            model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             key = 'n'
             downlink_view._model = model
             # When
@@ -1935,7 +2399,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         with SwimClient() as client:
             downlink_view = _MapDownlinkView(client)
             model = _MapDownlinkModel(client)
-            model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             downlink_view._model = model
             # When
             actual = downlink_view._map(None)
@@ -1959,7 +2423,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view = _MapDownlinkView(client)
             downlink_view._is_open = True
             model = _MapDownlinkModel(client)
-            model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             downlink_view._model = model
             # When
             actual = downlink_view.get('a')
@@ -1967,6 +2431,21 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         # Then
         self.assertEqual(1, actual)
 
+    async def test_map_downlink_view_get_immediate_record_key(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_view.register_class(MockPerson)
+            model = _MapDownlinkModel(client)
+            model._map = create_map_entries((MockPerson('Foo', 1), 'a'), (MockPerson('Bar', 2), 'b'))
+            downlink_view._model = model
+            # When
+            actual = downlink_view.get(MockPerson('Bar', 2))
+
+        # Then
+        self.assertEqual('b', actual)
+
     async def test_map_downlink_view_get_with_wait(self):
         # Given
         with SwimClient() as client:
@@ -1975,7 +2454,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view._initialised.set()
             model = _MapDownlinkModel(client)
             model._synced.set()
-            model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             downlink_view._model = model
             # When
             actual = downlink_view.get('d', wait_sync=True)
@@ -2011,6 +2490,58 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         # Then
         self.assertEqual(Value.absent(), actual)
 
+    @patch('swimai.client._swim_client.SwimClient._run_task')
+    async def test_map_downlink_view_get_with_wait_synced(self, mock_run_task):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_view._initialised.set()
+            model = _MapDownlinkModel(client)
+            model._synced.set()
+            model._map = create_map_entries(('a', 1), ('b', 2))
+            downlink_view._model = model
+            # When
+            actual = downlink_view.get('b', wait_sync=True)
+            actual_all = downlink_view.get_all(wait_sync=True)
+
+        # Then
+        self.assertEqual(2, actual)
+        self.assertEqual([('a', 1), ('b', 2)], actual_all)
+        mock_run_task.assert_not_called()
+
+    @patch('swimai.client._swim_client.SwimClient._run_task')
+    async def test_map_downlink_view_get_with_wait_initialised_not_synced(self, mock_run_task):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_view._initialised.set()
+            downlink_view._model = _MapDownlinkModel(client)
+            # When
+            downlink_view.get('b', wait_sync=True)
+            downlink_view.get_all(wait_sync=True)
+
+        # Then
+        self.assertEqual(2, mock_run_task.call_count)
+        self.assertEqual((downlink_view._get_value, 'b'), mock_run_task.call_args_list[0][0])
+        self.assertEqual((downlink_view._get_all_values,), mock_run_task.call_args_list[1][0])
+
+    @patch('swimai.client._swim_client.SwimClient._run_task')
+    async def test_map_downlink_view_get_with_wait_not_initialised(self, mock_run_task):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            # When
+            downlink_view.get('b', wait_sync=True)
+            downlink_view.get_all(wait_sync=True)
+
+        # Then
+        self.assertEqual(2, mock_run_task.call_count)
+        self.assertEqual((downlink_view._get_value, 'b'), mock_run_task.call_args_list[0][0])
+        self.assertEqual((downlink_view._get_all_values,), mock_run_task.call_args_list[1][0])
+
     @patch('warnings.warn')
     async def test_map_downlink_view_get_before_open(self, mock_warn):
         # Given
@@ -2028,7 +2559,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view = _MapDownlinkView(client)
             downlink_view._is_open = True
             model = _MapDownlinkModel(client)
-            model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             downlink_view._model = model
             # When
             actual = downlink_view.get_all()
@@ -2045,6 +2576,111 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual('e', actual[4][0])
         self.assertEqual(5, actual[4][1])
 
+    async def test_map_downlink_view_get_all_cached(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            model = _MapDownlinkModel(client)
+            model.downlink_manager = MockDownlinkManager()
+            model._map = create_map_entries(('a', 1), ('b', 2))
+            downlink_view._model = model
+            # When
+            first = downlink_view.get_all()
+            actual = downlink_view.get_all()
+
+        # Then
+        self.assertEqual([('a', 1), ('b', 2)], actual)
+        self.assertIs(first[0], actual[0])
+        self.assertIs(first[1], actual[1])
+        self.assertIn('object', model._conversions)
+
+    async def test_map_downlink_view_get_all_cached_update(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            model = _MapDownlinkModel(client)
+            model.downlink_manager = MockDownlinkManager()
+            model._synced.set()
+            model._map = create_map_entries(('a', 1), ('b', 2))
+            downlink_view._model = model
+            first = downlink_view.get_all()
+            update_message = _EventMessage(node_uri='foo', lane_uri='bar', body=UpdateRequest('b', 3).to_record())
+            remove_message = _EventMessage(node_uri='foo', lane_uri='bar', body=RemoveRequest('a').to_record())
+            # When
+            await model._receive_event(update_message)
+            updated = downlink_view.get_all()
+            await model._receive_event(remove_message)
+            actual = downlink_view.get_all()
+
+        # Then
+        self.assertEqual([('a', 1), ('b', 3)], updated)
+        self.assertIs(first[0], updated[0])
+        self.assertIs(first[1][0], updated[1][0])
+        self.assertEqual([('b', 3)], actual)
+        self.assertIs(updated[1], actual[0])
+
+    async def test_map_downlink_view_get_all_cached_register_class(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            manager = MockDownlinkManager()
+            downlink_view._downlink_manager = manager
+            model = _MapDownlinkModel(client)
+            model.downlink_manager = manager
+            model._map = create_map_entries(('a', MockPerson(name='Elliot', age=29)))
+            downlink_view._model = model
+            downlink_view.get_all()
+            # When
+            downlink_view.register_class(MockPerson)
+            cleared = dict(model._conversions)
+            actual = downlink_view.get_all()
+
+        # Then
+        self.assertEqual({}, cleared)
+        self.assertIsInstance(actual[0][1], MockPerson)
+        self.assertEqual('Elliot', actual[0][1].name)
+
+    async def test_map_downlink_view_execute_did_update_no_consumers(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            model = _MapDownlinkModel(client)
+            model.downlink_manager = MockDownlinkManager()
+            downlink_view._model = model
+            # When
+            await downlink_view._execute_did_update(Text.create_from('a'), Num.create_from(1), Value.absent())
+
+        # Then
+        self.assertEqual({}, model._conversions)
+
+    async def test_map_downlink_view_execute_did_remove_cached(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            mock_did_remove = MockDidRemoveCallback()
+            downlink_view._did_remove_callback = mock_did_remove.execute
+            mock_manager = MockDownlinkManager()
+            model = _MapDownlinkModel(client)
+            model.downlink_manager = mock_manager
+            model._synced.set()
+            model._map = create_map_entries(('a', MockPerson(name='Elliot', age=29)))
+            downlink_view._model = model
+            first = downlink_view.get_all()
+            remove_message = _EventMessage(node_uri='foo', lane_uri='bar', body=RemoveRequest('a').to_record())
+            await model._receive_event(remove_message)
+            # When
+            await downlink_view._execute_did_remove(mock_manager.remove_key, mock_manager.remove_old_value)
+            while not mock_did_remove.called:
+                pass
+
+        # Then
+        self.assertIs(first[0][0], mock_did_remove.key)
+        self.assertIs(first[0][1], mock_did_remove.value)
+
     async def test_map_downlink_view_get_all_with_wait(self):
         # Given
         with SwimClient() as client:
@@ -2053,7 +2689,7 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view._initialised.set()
             model = _MapDownlinkModel(client)
             model._synced.set()
-            model._map = {'a': ('a', 1), 'b': ('b', 2), 'c': ('c', 3), 'd': ('d', 4), 'e': ('e', 5)}
+            model._map = create_map_entries(('a', 1), ('b', 2), ('c', 3), ('d', 4), ('e', 5))
             downlink_view._model = model
             # When
             actual = downlink_view.get_all(wait_sync=True)
@@ -2110,92 +2746,385 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         self.assertEqual('Cannot execute "get_all" before the downlink has been opened!',
                          mock_warn.call_args_list[0][0][0])
 
-    @patch('concurrent.futures._base.Future.result')
-    async def test_map_downlink_view_put_blocking(self, mock_result):
+    async def test_map_downlink_view_to_columns(self):
         # Given
         with SwimClient() as client:
-            node_uri = 'map_node_uri'
-            lane_uri = 'map_lane_uri'
-            model = _MapDownlinkModel(client)
-            mock_connection = MockConnection()
-            model.connection = mock_connection
-            model.linked.set()
             downlink_view = _MapDownlinkView(client)
-            downlink_view._node_uri = node_uri
-            downlink_view._lane_uri = lane_uri
             downlink_view._is_open = True
-            downlink_view._initialised.set()
-            downlink_view._model = model
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            downlink_model.downlink_manager = MockDownlinkManager()
+            downlink_model._map = create_map_entries(('a', {'x': 1}), ('b', {'x': 2}))
+            downlink_view._model = downlink_model
             # When
-            downlink_view.put('map_key', 'map_value', blocking=True)
+            first = downlink_view.to_columns(['x'])
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=UpdateRequest('c', {'x': 3}).to_record()))
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=RemoveRequest('a').to_record()))
+            actual = downlink_view.to_columns(['x'])
 
         # Then
-        self.assertEqual('@command(node:map_node_uri,lane:map_lane_uri)@update(key:map_key)map_value',
-                         mock_connection.messages_sent[0])
-        self.assertTrue(mock_result.called)
+        self.assertEqual((('a', 'b'), [1.0, 2.0]), (first[0], first[1]['x'].tolist()))
+        self.assertEqual((('c', 'b'), [3.0, 2.0]), (actual[0], actual[1]['x'].tolist()))
+        self.assertNotEqual(id(first[1]['x'].obj), id(actual[1]['x'].obj))
 
-    @patch('concurrent.futures._base.Future.result')
-    async def test_map_downlink_view_put_non_blocking(self, mock_result):
+    async def test_map_downlink_view_to_columns_keys_converted_once(self):
         # Given
         with SwimClient() as client:
-            node_uri = 'node_map'
-            lane_uri = 'lane_map'
-            model = _MapDownlinkModel(client)
-            mock_connection = MockConnection()
-            model.connection = mock_connection
-            model.linked.set()
             downlink_view = _MapDownlinkView(client)
-            downlink_view._node_uri = node_uri
-            downlink_view._lane_uri = lane_uri
             downlink_view._is_open = True
-            downlink_view._initialised.set()
-            downlink_view._model = model
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            downlink_model.downlink_manager = MockDownlinkManager()
+            downlink_model._map = create_map_entries(('a', {'x': 1}), ('b', {'x': 2}))
+            downlink_view._model = downlink_model
+            first = downlink_view.to_columns(['x'])
             # When
-            downlink_view.put('key_map', 'value_map')
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=UpdateRequest('b', {'x': 5}).to_record()))
+            updated = downlink_view.to_columns(['x'])
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=UpdateRequest('c', {'x': 3}).to_record()))
+            actual = downlink_view.to_columns(['x'])
 
         # Then
-        self.assertEqual('@command(node:node_map,lane:lane_map)@update(key:key_map)value_map',
-                         mock_connection.messages_sent[0])
-        self.assertFalse(mock_result.called)
+        self.assertIs(first[0], updated[0])
+        self.assertEqual([1.0, 5.0], updated[1]['x'].tolist())
+        self.assertEqual(('a', 'b', 'c'), actual[0])
+        self.assertIs(first[0][0], actual[0][0])
 
-    @patch('warnings.warn')
-    async def test_map_downlink_view_put_before_open(self, mock_warn):
+    async def test_map_downlink_view_to_columns_on_loop(self):
         # Given
         with SwimClient() as client:
             downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_model = _MapDownlinkModel(client)
+            downlink_model._map = create_map_entries(('a', {'x': 1}), ('b', {'x': 2}))
+            downlink_view._model = downlink_model
+
+            async def did_update():
+                return downlink_view.to_columns(['x'])
+
             # When
-            downlink_view.put('key_map', 'value_map')
+            keys, columns = client._run_task(did_update)
 
         # Then
-        self.assertEqual('Cannot execute "put" before the downlink has been opened!',
-                         mock_warn.call_args_list[0][0][0])
+        self.assertEqual(('a', 'b'), keys)
+        self.assertEqual([1.0, 2.0], columns['x'].tolist())
 
-    @patch('concurrent.futures._base.Future.result')
-    async def test_map_downlink_view_remove_blocking(self, mock_result):
+    async def test_map_downlink_view_sorted_queries(self):
         # Given
         with SwimClient() as client:
-            node_uri = 'map_remove_node_uri'
-            lane_uri = 'map_remove_lane_uri'
-            model = _MapDownlinkModel(client)
-            mock_connection = MockConnection()
-            model.connection = mock_connection
-            model.linked.set()
             downlink_view = _MapDownlinkView(client)
-            downlink_view._node_uri = node_uri
-            downlink_view._lane_uri = lane_uri
             downlink_view._is_open = True
-            downlink_view._initialised.set()
-            downlink_view._model = model
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            downlink_model.downlink_manager = MockDownlinkManager()
+            downlink_model._map = create_map_entries(('b', 2), ('a', 1))
+            downlink_view._model = downlink_model
             # When
-            downlink_view.remove('map_remove_key', blocking=True)
+            first = downlink_view.first()
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=UpdateRequest('ab', 3).to_record()))
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=RemoveRequest('b').to_record()))
+            actual = downlink_view.range('a', 'b')
+            prefix = downlink_view.prefix('a')
+            last = downlink_view.last()
+            top = downlink_view.top_k(2, by=lambda key, value: value)
+
+        # Then
+        self.assertEqual(('a', 1), first)
+        self.assertEqual([('a', 1), ('ab', 3)], actual)
+        self.assertEqual([('a', 1), ('ab', 3)], prefix)
+        self.assertEqual(('ab', 3), last)
+        self.assertEqual([('ab', 3), ('a', 1)], top)
+
+    async def test_map_downlink_view_sorted_queries_on_loop(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_model = _MapDownlinkModel(client)
+            downlink_model._map = create_map_entries(('b', 2), ('a', 1))
+            downlink_view._model = downlink_model
+
+            async def did_update():
+                return downlink_view.range('a', 'c')
+
+            # When
+            actual = client._run_task(did_update)
+
+        # Then
+        self.assertEqual([('a', 1), ('b', 2)], actual)
+        self.assertIsNotNone(downlink_model._sorted)
+
+    async def test_map_downlink_view_sorted_queries_run_on_loop(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_model = _MapDownlinkModel(client)
+            downlink_model._map = create_map_entries(('b', 2), ('a', 1))
+            downlink_view._model = downlink_model
+            threads = []
+
+            def query(keys):
+                threads.append(current_thread())
+                return keys._prefix('a')
+
+            # When
+            actual = downlink_view._MapDownlinkView__get_entries(query)
+
+        # Then
+        self.assertEqual([('a', 1)], actual)
+        self.assertEqual([client._loop_thread], threads)
+
+    async def test_map_downlink_view_sorted_queries_empty(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_view._model = _MapDownlinkModel(client)
+            # When
+            first = downlink_view.first()
+            top = downlink_view.top_k(3)
+
+        # Then
+        self.assertEqual(Value.absent(), first)
+        self.assertEqual([], top)
+
+    async def test_map_downlink_view_index_lookup(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view.add_index('status', 'status')
+            downlink_view._is_open = True
+            downlink_model = await downlink_view._create_downlink_model(MockDownlinkManager())
+            downlink_model._map.update(create_map_entries(('a', {'status': 'alarm'})))
+            downlink_view._model = downlink_model
+            downlink_view.add_index('parity', lambda value: value.get('id', 0) % 2)
+            # When
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=UpdateRequest('b', {'status': 'alarm',
+                                                                                       'id': 1}).to_record()))
+            actual = downlink_view.lookup('status', 'alarm')
+            parity = downlink_view.lookup('parity', 1)
+            memory = downlink_view.index_memory('status')
+
+        # Then
+        self.assertEqual([('b', {'status': 'alarm', 'id': 1})], actual)
+        self.assertEqual([('b', {'status': 'alarm', 'id': 1})], parity)
+        self.assertGreater(memory, 0)
+
+    async def test_map_downlink_view_add_index_on_loop(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_model = _MapDownlinkModel(client)
+            downlink_model._map = create_map_entries(('a', {'status': 'alarm'}))
+            downlink_view._model = downlink_model
+
+            async def did_update():
+                return downlink_view.add_index('status', 'status').lookup('status', 'alarm')
+
+            # When
+            actual = client._run_task(did_update)
+
+        # Then
+        self.assertEqual([('a', {'status': 'alarm'})], actual)
+        self.assertIn('status', downlink_model._indexes)
+
+    async def test_map_downlink_view_add_index_lookup_waits(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_model = _MapDownlinkModel(client)
+            downlink_model._map = create_map_entries(('a', {'status': 'alarm'}))
+            downlink_view._model = downlink_model
+            downlink_view.add_index('status', 'status')
+            downlink_model._indexes.clear()
+            # When
+            actual = downlink_view.lookup('status', 'alarm')
+
+        # Then
+        self.assertEqual([('a', {'status': 'alarm'})], actual)
+
+    async def test_map_downlink_view_index_lookup_remove(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_model = _MapDownlinkModel(client)
+            # noinspection PyTypeChecker
+            downlink_model.downlink_manager = MockDownlinkManager()
+            downlink_model._map = create_map_entries(('a', {'status': 'alarm'}), ('b', {'status': 'alarm'}))
+            downlink_view._model = downlink_model
+            downlink_view.add_index('status', 'status')
+            # When
+            await downlink_model._receive_event(_EventMessage(node_uri='foo', lane_uri='bar',
+                                                              body=RemoveRequest('a').to_record()))
+            actual = downlink_view.lookup('status', 'alarm')
+
+        # Then
+        self.assertEqual([('b', {'status': 'alarm'})], actual)
+
+    async def test_map_downlink_view_index_missing(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            downlink_view._model = _MapDownlinkModel(client)
+            # When
+            with self.assertRaises(KeyError) as error:
+                downlink_view.lookup('status', 'alarm')
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Index "status" does not exist!', message)
+
+    async def test_map_downlink_view_to_columns_default(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            model = _MapDownlinkModel(client)
+            model._map = create_map_entries(('a', 1), ('b', 2))
+            downlink_view._model = model
+            # When
+            keys, actual = downlink_view.to_columns()
+
+        # Then
+        self.assertEqual(('a', 'b'), keys)
+        self.assertEqual(['value'], list(actual.keys()))
+        self.assertEqual([1.0, 2.0], actual['value'].tolist())
+
+    async def test_map_downlink_view_to_columns_no_model(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._is_open = True
+            # When
+            keys, actual = downlink_view.to_columns(['x'])
+
+        # Then
+        self.assertEqual({}, actual)
+        self.assertEqual((), keys)
+
+    @patch('concurrent.futures._base.Future.result')
+    async def test_map_downlink_view_put_blocking(self, mock_result):
+        # Given
+        with SwimClient() as client:
+            node_uri = 'map_node_uri'
+            lane_uri = 'map_lane_uri'
+            model = _MapDownlinkModel(client)
+            mock_connection = MockConnection()
+            model.connection = mock_connection
+            model.linked.set()
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._node_uri = node_uri
+            downlink_view._lane_uri = lane_uri
+            downlink_view._is_open = True
+            downlink_view._initialised.set()
+            downlink_view._model = model
+            # When
+            downlink_view.put('map_key', 'map_value', blocking=True)
+
+        # Then
+        self.assertEqual('@command(node:map_node_uri,lane:map_lane_uri)@update(key:map_key)map_value',
+                         mock_connection.messages_sent[0])
+        self.assertTrue(mock_result.called)
+
+    @patch('concurrent.futures._base.Future.result')
+    async def test_map_downlink_view_put_format_recon(self, mock_result):
+        # Given
+        with SwimClient() as client:
+            model = _MapDownlinkModel(client)
+            mock_connection = MockConnection()
+            model.connection = mock_connection
+            model.linked.set()
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._node_uri = 'map_node_uri'
+            downlink_view._lane_uri = 'map_lane_uri'
+            downlink_view.format = 'recon'
+            downlink_view._is_open = True
+            downlink_view._initialised.set()
+            downlink_view._model = model
+            # When
+            downlink_view.put('@id(1)', '{count:2}', blocking=True)
+
+        # Then
+        self.assertEqual('@command(node:map_node_uri,lane:map_lane_uri)@update(key:@id(1))count:2',
+                         mock_connection.messages_sent[0])
+        self.assertTrue(mock_result.called)
+
+    @patch('swimai.client._swim_client.SwimClient._exception_handler')
+    @patch('concurrent.futures._base.Future.result')
+    async def test_map_downlink_view_put_non_blocking(self, mock_result, mock_exception_handler):
+        # Given
+        with SwimClient() as client:
+            node_uri = 'node_map'
+            lane_uri = 'lane_map'
+            model = _MapDownlinkModel(client)
+            mock_connection = MockConnection()
+            model.connection = mock_connection
+            model.linked.set()
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._node_uri = node_uri
+            downlink_view._lane_uri = lane_uri
+            downlink_view._is_open = True
+            downlink_view._initialised.set()
+            downlink_view._model = model
+            # When
+            downlink_view.put('key_map', 'value_map')
+
+        # Then
+        self.assertEqual('@command(node:node_map,lane:lane_map)@update(key:key_map)value_map',
+                         mock_connection.messages_sent[0])
+        self.assertFalse(mock_result.called)
+
+    @patch('warnings.warn')
+    async def test_map_downlink_view_put_before_open(self, mock_warn):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            # When
+            downlink_view.put('key_map', 'value_map')
+
+        # Then
+        self.assertEqual('Cannot execute "put" before the downlink has been opened!',
+                         mock_warn.call_args_list[0][0][0])
+
+    @patch('concurrent.futures._base.Future.result')
+    async def test_map_downlink_view_remove_blocking(self, mock_result):
+        # Given
+        with SwimClient() as client:
+            node_uri = 'map_remove_node_uri'
+            lane_uri = 'map_remove_lane_uri'
+            model = _MapDownlinkModel(client)
+            mock_connection = MockConnection()
+            model.connection = mock_connection
+            model.linked.set()
+            downlink_view = _MapDownlinkView(client)
+            downlink_view._node_uri = node_uri
+            downlink_view._lane_uri = lane_uri
+            downlink_view._is_open = True
+            downlink_view._initialised.set()
+            downlink_view._model = model
+            # When
+            downlink_view.remove('map_remove_key', blocking=True)
 
         # Then
         self.assertEqual('@command(node:map_remove_node_uri,lane:map_remove_lane_uri)@remove(key:map_remove_key)',
                          mock_connection.messages_sent[0])
         self.assertTrue(mock_result.called)
 
+    @patch('swimai.client._swim_client.SwimClient._exception_handler')
     @patch('concurrent.futures._base.Future.result')
-    async def test_map_downlink_view_remove_non_blocking(self, mock_result):
+    async def test_map_downlink_view_remove_non_blocking(self, mock_result, mock_exception_handler):
         # Given
         with SwimClient() as client:
             node_uri = 'node_uri_remove_map'
@@ -2236,17 +3165,17 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view = _MapDownlinkView(client)
             mock_did_update = MockDidUpdateCallback()
             downlink_view._did_update_callback = mock_did_update.execute
-            key = 'Test_update_key'
-            new_value = 'Test_update_new_value'
-            old_value = 'Test_update_old_value'
+            key = Text.create_from('Test_update_key')
+            new_value = Text.create_from('Test_update_new_value')
+            old_value = Text.create_from('Test_update_old_value')
             # When
             await downlink_view._execute_did_update(key, new_value, old_value)
             while not mock_did_update.called:
                 pass
         # Then
-        self.assertEqual(key, mock_did_update.key)
-        self.assertEqual(new_value, mock_did_update.new_value)
-        self.assertEqual(old_value, mock_did_update.old_value)
+        self.assertEqual('Test_update_key', mock_did_update.key)
+        self.assertEqual('Test_update_new_value', mock_did_update.new_value)
+        self.assertEqual('Test_update_old_value', mock_did_update.old_value)
 
     async def test_map_downlink_view_execute_did_update_no_callback(self):
         # Given
@@ -2268,15 +3197,15 @@ class TestDownlinks(aiounittest.AsyncTestCase):
             downlink_view = _MapDownlinkView(client)
             mock_did_remove = MockDidRemoveCallback()
             downlink_view._did_remove_callback = mock_did_remove.execute
-            key = 'Test_remove_key'
-            value = 'Test_remove_value'
+            key = Text.create_from('Test_remove_key')
+            value = Text.create_from('Test_remove_value')
             # When
             await downlink_view._execute_did_remove(key, value)
             while not mock_did_remove.called:
                 pass
         # Then
-        self.assertEqual(key, mock_did_remove.key)
-        self.assertEqual(value, mock_did_remove.value)
+        self.assertEqual('Test_remove_key', mock_did_remove.key)
+        self.assertEqual('Test_remove_value', mock_did_remove.value)
 
     async def test_map_downlink_view_execute_did_remove_no_callback(self):
         # Given
@@ -2291,6 +3220,69 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         # Then
         self.assertFalse(mock_schedule_task.called)
 
+    async def test_map_downlink_view_execute_did_update_batch(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            mock_did_update_batch = MockDidUpdateBatchCallback()
+            downlink_view._did_update_batch_callback = mock_did_update_batch.execute
+            changes = [(Text.create_from('Test_update_key'), Num.create_from(2), Value.absent())]
+            # When
+            await downlink_view._execute_did_update_batch(changes)
+            while not mock_did_update_batch.called:
+                pass
+        # Then
+        self.assertEqual([('Test_update_key', 2, Value.absent())], mock_did_update_batch.changes)
+
+    async def test_map_downlink_view_execute_did_update_batch_no_callback(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            changes = [('Test_update_key', 'Test_update_new_value', 'Test_update_old_value')]
+            # When
+            with patch('swimai.SwimClient._schedule_task') as mock_schedule_task:
+                await downlink_view._execute_did_update_batch(changes)
+
+        # Then
+        self.assertFalse(mock_schedule_task.called)
+
+    async def test_map_downlink_view_did_update_batch_valid(self):
+        # Given
+        client = SwimClient()
+        downlink_view = _MapDownlinkView(client)
+        function = mock_did_update_batch_callback
+        # When
+        downlink_view.did_update_batch(function, window=0.5)
+        # Then
+        self.assertTrue(function, downlink_view._did_update_batch_callback)
+        self.assertEqual(0.5, downlink_view._batch_window)
+
+    async def test_map_downlink_view_did_update_batch_with_model(self):
+        # Given
+        client = SwimClient()
+        downlink_view = _MapDownlinkView(client)
+        downlink_view._model = _MapDownlinkModel(client)
+        downlink_view._model._batch_window = 1
+        # When
+        downlink_view.did_update_batch(mock_did_update_batch_callback, window=0.5)
+        # Then
+        self.assertEqual(0.5, downlink_view._model._batch_window)
+
+    async def test_map_downlink_view_did_update_batch_invalid(self):
+        # Given
+        client = SwimClient()
+        downlink_view = _MapDownlinkView(client)
+        function = 111
+        # When
+        with self.assertRaises(TypeError) as error:
+            # noinspection PyTypeChecker
+            downlink_view.did_update_batch(function)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual(message, 'Callback must be a coroutine or a function!')
+        self.assertIsNone(downlink_view._batch_window)
+
     async def test_map_downlink_view_did_update_valid(self):
         # Given
         client = SwimClient()
@@ -2338,3 +3330,311 @@ class TestDownlinks(aiounittest.AsyncTestCase):
         # Then
         message = error.exception.args[0]
         self.assertEqual(message, 'Callback must be a coroutine or a function!')
+
+    async def test_downlink_view_events(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events()
+            # When
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+            await downlink_view._execute_on_event(Text.create_from('bar'))
+            downlink_view._close_events()
+            actual = [event async for event in events]
+
+        # Then
+        self.assertEqual(['foo', 'bar'], actual)
+
+    async def test_downlink_view_events_batch(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events(max_batch=2)
+            # When
+            for event in [Text.create_from('foo'), Text.create_from('bar'), Text.create_from('baz')]:
+                await downlink_view._execute_on_event(event)
+
+            downlink_view._close_events()
+            actual = [batch async for batch in events]
+
+        # Then
+        self.assertEqual([['foo', 'bar'], ['baz']], actual)
+
+    async def test_downlink_view_events_backpressure(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events(max_size=1)
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+            # When
+            blocked = asyncio.ensure_future(downlink_view._execute_on_event(Text.create_from('bar')))
+            await asyncio.sleep(0)
+            blocked_before = not blocked.done()
+            first = await events.__anext__()
+            await blocked
+            second = await events.__anext__()
+
+        # Then
+        self.assertTrue(blocked_before)
+        self.assertEqual('foo', first)
+        self.assertEqual('bar', second)
+
+    async def test_downlink_view_events_wait(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events()
+            # When
+            waiting = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0)
+            waiting_before = not waiting.done()
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+            actual = await waiting
+
+        # Then
+        self.assertTrue(waiting_before)
+        self.assertEqual('foo', actual)
+
+    async def test_downlink_view_events_not_consumed(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            # When
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+            downlink_view._close_events()
+
+        # Then
+        self.assertIsNone(downlink_view._events)
+        self.assertTrue(downlink_view._events_closed)
+
+    async def test_downlink_view_events_closed_full(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events(max_size=1)
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+            # When
+            downlink_view._close_events()
+            actual = [event async for event in events]
+
+        # Then
+        self.assertEqual(['foo'], actual)
+
+    async def test_downlink_view_events_abandoned(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events(max_size=2)
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+
+            async for event in events:
+                break
+
+            # When
+            del events
+
+            for index in range(0, 5):
+                await asyncio.wait_for(downlink_view._execute_on_event(Num.create_from(index)), 1)
+
+        # Then
+        self.assertEqual(0, downlink_view._events_consumers)
+        self.assertIsNone(downlink_view._events)
+
+    async def test_downlink_view_events_not_iterated(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events(max_size=1)
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+            # When
+            del events
+            await asyncio.wait_for(downlink_view._execute_on_event(Text.create_from('bar')), 1)
+
+        # Then
+        self.assertIsNone(downlink_view._events)
+
+    async def test_downlink_view_events_cancelled(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events(max_size=1)
+            waiting = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0)
+            # When
+            waiting.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await waiting
+
+            await asyncio.wait_for(downlink_view._execute_on_event(Text.create_from('foo')), 1)
+            await asyncio.wait_for(downlink_view._execute_on_event(Text.create_from('bar')), 1)
+            actual = [event async for event in events]
+
+        # Then
+        self.assertEqual([], actual)
+        self.assertIsNone(downlink_view._events)
+
+    async def test_downlink_view_events_aclose_shared(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            first_events = downlink_view.events()
+            second_events = downlink_view.events()
+            # When
+            await first_events.aclose()
+            await downlink_view._execute_on_event(Text.create_from('foo'))
+            downlink_view._close_events()
+            first_actual = [event async for event in first_events]
+            second_actual = [event async for event in second_events]
+
+        # Then
+        self.assertEqual([], first_actual)
+        self.assertEqual(['foo'], second_actual)
+        self.assertIsNone(downlink_view._events)
+
+    async def test_downlink_view_events_threaded_client(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            events = downlink_view.events()
+            # When
+            client._schedule_task(downlink_view._execute_on_event, Text.create_from('foo')).result()
+            first = await events.__anext__()
+            client._schedule_task(downlink_view._execute_on_event, Text.create_from('bar')).result()
+            client._loop.call_soon_threadsafe(downlink_view._close_events)
+            rest = [event async for event in events]
+
+        # Then
+        self.assertEqual('foo', first)
+        self.assertEqual(['bar'], rest)
+
+    async def test_value_downlink_view_events(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            events = downlink_view.events()
+            # When
+            await downlink_view._execute_did_set(Num.create_from(2), Num.create_from(1))
+            downlink_view._close_events()
+            actual = [event async for event in events]
+
+        # Then
+        self.assertEqual([(2, 1)], actual)
+
+    async def test_map_downlink_view_events(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _MapDownlinkView(client)
+            events = downlink_view.events(max_batch=10)
+            # When
+            await downlink_view._execute_did_update(Text.create_from('foo'), Num.create_from(2), Num.create_from(1))
+            await downlink_view._execute_did_remove(Text.create_from('foo'), Num.create_from(2))
+            downlink_view._close_events()
+            actual = [batch async for batch in events]
+
+        # Then
+        self.assertEqual([[('foo', 2, 1), ('foo', Value.absent(), 2)]], actual)
+
+    def test_downlink_view_poll(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            downlink_view.poll(timeout=0)
+            # When
+            for event in [Text.create_from('foo'), Text.create_from('bar'), Text.create_from('baz')]:
+                client._schedule_task(downlink_view._execute_on_event, event).result()
+
+            first = downlink_view.poll(max_events=2)
+            second = downlink_view.poll(max_events=2)
+
+        # Then
+        self.assertEqual(['foo', 'bar'], first)
+        self.assertEqual(['baz'], second)
+
+    def test_downlink_view_poll_timeout(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            # When
+            actual = downlink_view.poll(timeout=0.01)
+
+        # Then
+        self.assertEqual([], actual)
+        self.assertIsNotNone(downlink_view._polled_events)
+
+    def test_downlink_view_poll_wait(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            downlink_view.poll(timeout=0)
+            # When
+            timer = Timer(0.01, client._schedule_task, [downlink_view._execute_on_event, Text.create_from('foo')])
+            timer.start()
+            actual = downlink_view.poll(timeout=1)
+            timer.join()
+
+        # Then
+        self.assertEqual(['foo'], actual)
+
+    def test_downlink_view_poll_closed(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            downlink_view.poll(timeout=0)
+            client._schedule_task(downlink_view._execute_on_event, Text.create_from('foo')).result()
+            # When
+            client._loop.call_soon_threadsafe(downlink_view._close_events)
+            first = downlink_view.poll()
+            second = downlink_view.poll()
+
+        # Then
+        self.assertEqual(['foo'], first)
+        self.assertEqual([], second)
+
+    @patch('warnings.warn')
+    def test_downlink_view_poll_on_loop(self, mock_warn):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+
+            async def did_update():
+                downlink_view.poll(timeout=0)
+
+            # When
+            with self.assertRaises(Exception) as error:
+                client._run_task(did_update)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot poll the events of a downlink on the loop of the client! Use "events" instead.', message)
+        self.assertIsNone(downlink_view._polled_events)
+
+    async def test_downlink_view_poll_async_client(self):
+        # Given
+        async with AsyncSwimClient() as client:
+            downlink_view = _EventDownlinkView(client)
+            # When
+            with self.assertRaises(Exception) as error:
+                downlink_view.poll(timeout=0)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot block on "poll" with the asynchronous client! Use "async for event in '
+                         'downlink.events()" instead.', message)
+        self.assertIsNone(downlink_view._polled_events)
+
+    async def test_downlink_view_poll_and_events(self):
+        # Given
+        with SwimClient() as client:
+            downlink_view = _ValueDownlinkView(client)
+            events = downlink_view.events()
+            downlink_view.poll(timeout=0)
+            # When
+            client._schedule_task(downlink_view._execute_did_set, Num.create_from(2), Num.create_from(1)).result()
+            client._loop.call_soon_threadsafe(downlink_view._close_events)
+            actual_events = [event async for event in events]
+            actual_poll = downlink_view.poll()
+
+        # Then
+        self.assertEqual([(2, 1)], actual_events)
+        self.assertEqual([(2, 1)], actual_poll)
@@ -0,0 +1,299 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import math
+import unittest
+
+from swimai.client._downlinks._indexes import _MapColumns, _to_float, _sort_key, _SortedKeys, _get_field, _ValueIndex
+from swimai.recon import Recon
+from swimai.structures import Text, Num, Bool, RecordMap, Attr, Value
+from test.utils import MockPerson
+
+
+class TestIndexes(unittest.TestCase):
+
+    def test_to_float_number(self):
+        # When
+        actual = _to_float(5, 'age')
+        # Then
+        self.assertEqual(5.0, actual)
+
+    def test_to_float_dict(self):
+        # When
+        actual = _to_float({'age': 3}, 'age')
+        # Then
+        self.assertEqual(3.0, actual)
+
+    def test_to_float_object(self):
+        # When
+        actual = _to_float(MockPerson('Foo', 12), 'age')
+        # Then
+        self.assertEqual(12.0, actual)
+
+    def test_to_float_value(self):
+        # When
+        actual = [_to_float(Num(5), 'age'), _to_float(Bool(True), 'age'), _to_float(Recon.parse('{age:3}'), 'age')]
+        # Then
+        self.assertEqual([5.0, 1.0, 3.0], actual)
+
+    def test_to_float_missing(self):
+        # When
+        actual = [_to_float({'name': 'Foo'}, 'age'), _to_float(MockPerson('Foo'), 'name'), _to_float('Foo', 'age')]
+        # Then
+        self.assertTrue(all(math.isnan(value) for value in actual))
+
+    def test_map_columns_create(self):
+        # Given
+        entries = {Text('a'): ('a', {'x': 1, 'y': 2}), Text('b'): ('b', {'x': 3})}
+        # When
+        actual = _MapColumns(['x', 'y'], entries)
+        # Then
+        keys, columns = actual._snapshot(['x', 'y'])
+        self.assertEqual(2, actual._size)
+        self.assertEqual((Text('a'), Text('b')), keys)
+        self.assertEqual([1.0, 3.0], columns['x'].tolist())
+        self.assertEqual(2.0, columns['y'][0])
+        self.assertTrue(math.isnan(columns['y'][1]))
+        self.assertTrue(columns['x'].readonly)
+
+    def test_map_columns_update_existing(self):
+        # Given
+        columns = _MapColumns(['x'], {Text('a'): ('a', {'x': 1}), Text('b'): ('b', {'x': 3})})
+        # When
+        columns._update(Text('a'), {'x': 10})
+        # Then
+        self.assertEqual(2, columns._size)
+        self.assertEqual([10.0, 3.0], columns._snapshot(['x'])[1]['x'].tolist())
+
+    def test_map_columns_update_grow(self):
+        # Given
+        columns = _MapColumns(['x'], {})
+        first = columns._snapshot(['x'])[1]['x']
+        # When
+        for index in range(0, 100):
+            columns._update(Text(str(index)), {'x': index})
+        # Then
+        actual = columns._snapshot(['x'])[1]['x']
+        self.assertEqual(0, len(first))
+        self.assertEqual(100, len(actual))
+        self.assertEqual(128, columns._capacity)
+        self.assertEqual([float(index) for index in range(0, 100)], actual.tolist())
+
+    def test_map_columns_snapshot_copy_on_write(self):
+        # Given
+        columns = _MapColumns(['x'], {Text('a'): ('a', {'x': 1}), Text('b'): ('b', {'x': 2})})
+        keys, snapshot = columns._snapshot(['x'])
+        # When
+        columns._update(Text('a'), {'x': 10})
+        columns._remove(Text('b'))
+        # Then
+        self.assertEqual((Text('a'), Text('b')), keys)
+        self.assertEqual([1.0, 2.0], snapshot['x'].tolist())
+        self.assertEqual(((Text('a'),), [10.0]), (columns._snapshot(['x'])[0], columns._snapshot(['x'])[1]['x'].tolist()))
+        self.assertIsNot(snapshot['x'].obj, columns._columns['x'])
+
+    def test_map_columns_converted_keys(self):
+        # Given
+        entries = {Text('a'): ('a', 1), Text('b'): ('b', 2), Text('c'): ('c', 3)}
+        columns = _MapColumns(['value'], entries)
+        converted = []
+
+        def convert(key_value):
+            converted.append(key_value)
+            return key_value.value
+
+        first = columns._snapshot(['value'], 'object', convert)[0]
+        # When
+        columns._update(Text('b'), 5)
+        unchanged = columns._snapshot(['value'], 'object', convert)[0]
+        columns._remove(Text('a'))
+        columns._update(Text('d'), 4)
+        actual = columns._snapshot(['value'], 'object', convert)[0]
+        # Then
+        self.assertEqual(('a', 'b', 'c'), first)
+        self.assertIs(first, unchanged)
+        self.assertEqual(('c', 'b', 'd'), actual)
+        self.assertEqual([Text('a'), Text('b'), Text('c'), Text('d')], converted)
+        self.assertEqual((Text('c'), Text('b'), Text('d')), columns._snapshot(['value'])[0])
+
+    def test_map_columns_clear_converted_keys(self):
+        # Given
+        columns = _MapColumns(['value'], {Text('a'): ('a', 1)})
+        columns._snapshot(['value'], 'object', lambda key_value: key_value.value)
+        # When
+        columns._clear_converted_keys()
+        actual = columns._snapshot(['value'], 'object', lambda key_value: key_value.value.upper())[0]
+        # Then
+        self.assertEqual(('A',), actual)
+
+    def test_map_columns_remove_moves_last_row(self):
+        # Given
+        entries = {Text('a'): ('a', 1), Text('b'): ('b', 2), Text('c'): ('c', 3)}
+        columns = _MapColumns(['value'], entries)
+        # When
+        columns._remove(Text('a'))
+        # Then
+        self.assertEqual(2, columns._size)
+        self.assertEqual([Text('c'), Text('b')], columns._key_values)
+        self.assertEqual({Text('c'): 0, Text('b'): 1}, columns._rows)
+        self.assertEqual([3.0, 2.0], columns._snapshot(['value'])[1]['value'].tolist())
+
+    def test_map_columns_remove_last_and_missing(self):
+        # Given
+        columns = _MapColumns(['value'], {Text('a'): ('a', 1), Text('b'): ('b', 2)})
+        # When
+        columns._remove(Text('b'))
+        columns._remove(Text('z'))
+        # Then
+        self.assertEqual([Text('a')], columns._key_values)
+        self.assertEqual([1.0], columns._snapshot(['value'])[1]['value'].tolist())
+
+    def test_map_columns_add_fields(self):
+        # Given
+        entries = {Text('a'): ('a', {'x': 1, 'y': 5}), Text('b'): ('b', {'x': 2, 'y': 6})}
+        columns = _MapColumns(['x'], entries)
+        # When
+        columns._add_fields(['x', 'y'], entries)
+        # Then
+        self.assertTrue(columns._has_fields(['x', 'y']))
+        self.assertFalse(columns._has_fields(['z']))
+        self.assertEqual([5.0, 6.0], columns._snapshot(['y'])[1]['y'].tolist())
+
+    def test_sort_key_order(self):
+        # Given
+        record = RecordMap.create()
+        record.add(Attr.create_attr('Foo', Value.extant()))
+        record._add_slot('name', 'Bar')
+        values = [record, Text('b'), Bool(True), Num(2.5), Text('a'), Num(-1), Bool(False)]
+        # When
+        actual = sorted(values, key=_sort_key)
+        # Then
+        self.assertEqual([Num(-1), Num(2.5), Bool(False), Bool(True), Text('a'), Text('b'), record], actual)
+
+    def test_sorted_keys_insert_remove(self):
+        # Given
+        keys = _SortedKeys([Text('b'), Text('d')])
+        # When
+        keys._insert(Text('c'))
+        keys._insert(Text('a'))
+        keys._insert(Text('c'))
+        keys._remove(Text('d'))
+        keys._remove(Text('z'))
+        # Then
+        self.assertEqual(3, keys._size)
+        self.assertEqual([Text('a'), Text('b'), Text('c')], keys._range(None, None))
+
+    def test_sorted_keys_range(self):
+        # Given
+        keys = _SortedKeys([Num(index) for index in range(0, 10)])
+        # When
+        actual = keys._range(Num(3), Num(6))
+        # Then
+        self.assertEqual([Num(3), Num(4), Num(5)], actual)
+        self.assertEqual([Num(8), Num(9)], keys._range(Num(7.5), None))
+        self.assertEqual([Num(0)], keys._range(None, Num(1)))
+
+    def test_sorted_keys_prefix(self):
+        # Given
+        keys = _SortedKeys([Text('foo'), Text('bar'), Text('foobar'), Text('fo'), Text('fop'), Num(1)])
+        # When
+        actual = keys._prefix('foo')
+        # Then
+        self.assertEqual([Text('foo'), Text('foobar')], actual)
+        self.assertEqual([], keys._prefix('x'))
+
+    def test_sorted_keys_first_last(self):
+        # Given
+        keys = _SortedKeys([Num(3), Num(1), Num(2)])
+        # Then
+        self.assertEqual([Num(1)], keys._first())
+        self.assertEqual([Num(3)], keys._last())
+        self.assertEqual([Num(3), Num(2)], keys._last(2))
+        self.assertEqual([], keys._last(0))
+        self.assertEqual([], _SortedKeys([])._first())
+
+    def test_get_field(self):
+        # When
+        actual = [_get_field({'status': 'ok'}, 'status'), _get_field(MockPerson('Foo'), 'name'),
+                  _get_field(MockPerson('Foo'), 'status'), _get_field(1, 'status')]
+        # Then
+        self.assertEqual(['ok', 'Foo', None, None], actual)
+
+    def test_get_field_record(self):
+        # Given
+        record = Recon.parse('{status:ok,count:2,nested:{a:1}}')
+        # When
+        actual = [_get_field(record, 'status'), _get_field(record, 'count'), _get_field(record, 'missing'),
+                  _get_field(record, 'nested')]
+        # Then
+        self.assertEqual(['ok', 2, None, Recon.parse('{a:1}')], actual)
+
+    def test_value_index_create_field(self):
+        # Given
+        entries = {Text('a'): ('a', {'status': 'alarm'}), Text('b'): ('b', {'status': 'ok'}),
+                   Text('c'): ('c', {'status': 'alarm'})}
+        # When
+        actual = _ValueIndex('status', entries)
+        # Then
+        self.assertEqual([Text('a'), Text('c')], actual._lookup('alarm'))
+        self.assertEqual([Text('b')], actual._lookup('ok'))
+        self.assertEqual([], actual._lookup('missing'))
+
+    def test_value_index_create_function(self):
+        # Given
+        entries = {Text('a'): ('a', 1), Text('b'): ('b', 2), Text('c'): ('c', 3)}
+        # When
+        actual = _ValueIndex(lambda value: value % 2 == 0, entries)
+        # Then
+        self.assertEqual([Text('b')], actual._lookup(True))
+        self.assertEqual([Text('a'), Text('c')], actual._lookup(False))
+
+    def test_value_index_update(self):
+        # Given
+        index = _ValueIndex('status', {Text('a'): ('a', {'status': 'alarm'})})
+        # When
+        index._update(Text('a'), {'status': 'ok'})
+        index._update(Text('b'), {'status': 'ok'})
+        index._update(Text('b'), {'status': 'ok'})
+        # Then
+        self.assertEqual([], index._lookup('alarm'))
+        self.assertEqual([Text('a'), Text('b')], index._lookup('ok'))
+        self.assertNotIn('alarm', index._keys)
+
+    def test_value_index_update_unhashable(self):
+        # Given
+        index = _ValueIndex('tags', {Text('a'): ('a', {'tags': 'foo'})})
+        # When
+        index._update(Text('a'), {'tags': ['foo', 'bar']})
+        # Then
+        self.assertEqual([], index._lookup('foo'))
+        self.assertEqual({}, index._values)
+
+    def test_value_index_remove(self):
+        # Given
+        index = _ValueIndex('status', {Text('a'): ('a', {'status': 'ok'}), Text('b'): ('b', {'status': 'ok'})})
+        # When
+        index._remove(Text('a'))
+        index._remove(Text('z'))
+        # Then
+        self.assertEqual([Text('b')], index._lookup('ok'))
+
+    def test_value_index_memory(self):
+        # Given
+        empty = _ValueIndex('status', {})
+        index = _ValueIndex('status', {Text(str(key)): (key, {'status': key % 10}) for key in range(0, 1000)})
+        # When
+        actual = index._memory()
+        # Then
+        self.assertGreater(actual, empty._memory())
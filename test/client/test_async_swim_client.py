@@ -0,0 +1,388 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import aiounittest
+from unittest.mock import patch
+
+from swimai import AsyncSwimClient, SwimClient
+from swimai.client._downlinks._downlinks import _ValueDownlinkView, _ValueDownlinkModel, _MapDownlinkView, \
+    _MapDownlinkModel
+from swimai.structures import Text, Value, Num
+from test.utils import MockWebsocketConnect, MockWebsocket, MockAsyncFunction, MockScheduleTask, MockConnection
+
+
+class TestAsyncSwimClient(aiounittest.AsyncTestCase):
+
+    def setUp(self):
+        MockWebsocket.clear()
+        MockScheduleTask.clear()
+
+    async def test_async_swim_client_start(self):
+        # Given
+        client = AsyncSwimClient()
+        # When
+        actual = await client.start()
+        # Then
+        self.assertEqual(client, actual)
+        self.assertIsInstance(actual, SwimClient)
+        self.assertEqual(asyncio.get_running_loop(), actual._loop)
+        self.assertIsNone(actual._loop_thread)
+        self.assertTrue(actual._has_started)
+        await client.stop()
+
+    async def test_async_swim_client_stop(self):
+        # Given
+        client = AsyncSwimClient()
+        await client.start()
+        # When
+        actual = await client.stop()
+        # Then
+        self.assertEqual(client, actual)
+        self.assertFalse(actual._has_started)
+        self.assertFalse(actual._loop.is_closed())
+
+    async def test_async_swim_client_stop_drain(self):
+        # Given
+        completed = []
+
+        async def task():
+            await asyncio.sleep(0.05)
+            completed.append(True)
+
+        async def other_task():
+            await asyncio.sleep(10)
+
+        client = AsyncSwimClient()
+        await client.start()
+        tracked = client._schedule_task(task)
+        other = asyncio.ensure_future(other_task())
+        # When
+        await client.stop(drain=True, timeout=1)
+        # Then
+        self.assertEqual([True], completed)
+        self.assertTrue(tracked.done())
+        self.assertFalse(other.done())
+        other.cancel()
+
+    async def test_async_swim_client_stop_drain_not_drainable(self):
+        # Given
+        mock_task = MockScheduleTask.get_mock_schedule_task()
+        client = AsyncSwimClient()
+        await client.start()
+        tracked = client._schedule_task(mock_task.async_infinite_cancel_execute, drainable=False)
+        start = asyncio.get_running_loop().time()
+        # When
+        pending = client._pending_tasks()
+        await client.stop(drain=True, timeout=2)
+        # Then
+        self.assertEqual(set(), pending)
+        self.assertLess(asyncio.get_running_loop().time() - start, 1)
+        self.assertTrue(tracked.cancelled())
+
+    async def test_async_swim_client_stop_drain_timeout(self):
+        # Given
+        mock_task = MockScheduleTask.get_mock_schedule_task()
+        client = AsyncSwimClient()
+        await client.start()
+        tracked = client._schedule_task(mock_task.async_infinite_cancel_execute)
+        # When
+        await client.stop(drain=True, timeout=0.05)
+        # Then
+        self.assertTrue(tracked.cancelled())
+
+    async def test_async_swim_client_with_statement(self):
+        # When
+        async with AsyncSwimClient() as swim_client:
+            # Then
+            self.assertIsInstance(swim_client, AsyncSwimClient)
+            self.assertTrue(swim_client._has_started)
+
+        self.assertFalse(swim_client._has_started)
+
+    def test_async_swim_client_sync_with_statement(self):
+        # When
+        with self.assertRaises(Exception) as error:
+            with AsyncSwimClient():
+                pass
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('The asynchronous client must be used with "async with"!', message)
+
+    @patch('warnings.warn')
+    async def test_async_swim_client_with_statement_exception(self, mock_warn):
+        # When
+        async with AsyncSwimClient() as swim_client:
+            raise Exception('Mock exception in task')
+        # Then
+        mock_warn.assert_called_once()
+        self.assertEqual('Mock exception in task', mock_warn.call_args_list[0][0][0])
+        self.assertFalse(swim_client._has_started)
+
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    async def test_async_swim_client_command(self, mock_websocket_connect):
+        # Given
+        host_uri = 'ws://localhost:9001'
+        expected = '@command(node:moo,lane:cow)"Hello, World!"'
+
+        async with AsyncSwimClient() as swim_client:
+            # When
+            actual = await swim_client.command(host_uri, 'moo', 'cow', Text.create_from('Hello, World!'))
+            # Then
+            self.assertIsNone(actual)
+            mock_websocket_connect.assert_called_once_with(host_uri)
+            self.assertEqual(expected, MockWebsocket.get_mock_websocket().sent_messages[0])
+
+        self.assertTrue(MockWebsocket.get_mock_websocket().closed)
+
+    async def test_async_swim_client_schedule_task(self):
+        # Given
+        mock_task = MockScheduleTask.get_mock_schedule_task()
+
+        async with AsyncSwimClient() as swim_client:
+            # When
+            actual = swim_client._schedule_task(mock_task.async_execute, 'foo')
+            await actual
+
+        # Then
+        self.assertIsInstance(actual, asyncio.Task)
+        self.assertEqual(1, mock_task.call_count)
+        self.assertEqual('foo', mock_task.message)
+
+    async def test_async_swim_client_stop_cancels_tasks(self):
+        # Given
+        mock_task = MockScheduleTask.get_mock_schedule_task()
+
+        async with AsyncSwimClient() as swim_client:
+            # When
+            actual = swim_client._schedule_task(mock_task.async_infinite_cancel_execute)
+
+        # Then
+        self.assertTrue(actual.cancelled())
+
+    @patch('warnings.warn')
+    async def test_async_swim_client_schedule_task_before_started(self, mock_warn):
+        # Given
+        mock_task = MockScheduleTask.get_mock_schedule_task()
+        swim_client = AsyncSwimClient()
+        # When
+        actual = swim_client._schedule_task(mock_task.async_execute, 'foo')
+        # Then
+        self.assertIsNone(actual)
+        self.assertEqual('Cannot execute "async_execute" before the client has been started!',
+                         mock_warn.call_args_list[0][0][0])
+
+    @patch('warnings.warn')
+    async def test_async_swim_client_schedule_task_that_raises_exception(self, mock_warn):
+        # Given
+        mock_task = MockScheduleTask.get_mock_schedule_task()
+
+        async with AsyncSwimClient() as swim_client:
+            # When
+            swim_client._schedule_task(mock_task.async_exception_execute, 'foo')
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        # Then
+        mock_warn.assert_called_once()
+        self.assertEqual('Mock async execute exception', mock_warn.call_args_list[0][0][0])
+
+    async def test_async_swim_client_run_task(self):
+        # Given
+        async def task(value):
+            return value * 2
+
+        async with AsyncSwimClient() as swim_client:
+            # When
+            with self.assertRaises(Exception) as error:
+                swim_client._run_task(task, 21)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot wait for "task" with the asynchronous client! Use the awaitable methods of the client '
+                         'instead.', message)
+
+    @patch('swimai.client._connections._ConnectionPool._add_downlink_view', new_callable=MockAsyncFunction)
+    @patch('swimai.client._connections._ConnectionPool._remove_downlink_view', new_callable=MockAsyncFunction)
+    async def test_async_swim_client_open_close(self, mock_remove_downlink, mock_add_downlink):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            downlink_view = swim_client.downlink_value()
+            # When
+            opened = await swim_client.open(downlink_view)
+            is_open = downlink_view._is_open
+            await swim_client.open(downlink_view)
+            closed = await swim_client.close(downlink_view)
+
+        # Then
+        self.assertEqual(downlink_view, opened)
+        self.assertEqual(downlink_view, closed)
+        self.assertTrue(is_open)
+        self.assertFalse(downlink_view._is_open)
+        mock_add_downlink.assert_called_once_with(downlink_view)
+        mock_remove_downlink.assert_called_once_with(downlink_view)
+
+    @patch('swimai.client._swim_client.SwimClient._open_downlink_views', new_callable=MockAsyncFunction)
+    @patch('swimai.client._swim_client.SwimClient._close_downlink_views', new_callable=MockAsyncFunction)
+    async def test_async_swim_client_open_close_many(self, mock_close_downlink_views, mock_open_downlink_views):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            first_downlink_view = swim_client.downlink_value()
+            second_downlink_view = swim_client.downlink_event()
+            first_downlink_view._is_open = True
+            # When
+            opened = await swim_client.open_many([first_downlink_view, second_downlink_view])
+            is_open = second_downlink_view._is_open
+            closed = await swim_client.close_many([first_downlink_view, second_downlink_view])
+
+        # Then
+        self.assertEqual([first_downlink_view, second_downlink_view], opened)
+        self.assertEqual([first_downlink_view, second_downlink_view], closed)
+        self.assertTrue(is_open)
+        self.assertFalse(first_downlink_view._is_open)
+        self.assertFalse(second_downlink_view._is_open)
+        mock_open_downlink_views.assert_called_once_with([second_downlink_view], None)
+        mock_close_downlink_views.assert_called_once_with([first_downlink_view, second_downlink_view])
+
+    async def test_async_swim_client_value_downlink(self):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            mock_connection = MockConnection()
+            downlink_view = self.create_value_downlink(swim_client, mock_connection)
+            # When
+            await swim_client.set(downlink_view, 66)
+            downlink_view._model._value = Num.create_from(66)
+            actual = await swim_client.get(downlink_view)
+            actual_wait_sync = await swim_client.get(downlink_view, wait_sync=True)
+
+        # Then
+        self.assertEqual('@command(node:bar_node,lane:foo_lane)66', mock_connection.messages_sent[0])
+        self.assertEqual(66, actual)
+        self.assertEqual(66, actual_wait_sync)
+
+    async def test_async_swim_client_value_downlink_blocking(self):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            mock_connection = MockConnection()
+            downlink_view = self.create_value_downlink(swim_client, mock_connection)
+            downlink_view._model._value = Num.create_from(66)
+            downlink_view._model._synced.set()
+            # When
+            actual = downlink_view.get(wait_sync=True)
+
+        # Then
+        self.assertEqual(66, actual)
+
+    async def test_async_swim_client_value_downlink_blocking_not_synced(self):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            mock_connection = MockConnection()
+            downlink_view = self.create_value_downlink(swim_client, mock_connection)
+            # When
+            with self.assertRaises(Exception) as error:
+                downlink_view.get(wait_sync=True)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot block on "get" with the asynchronous client! Use "await client.get(...)" instead.',
+                         message)
+
+    async def test_async_swim_client_map_downlink_blocking(self):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            mock_connection = MockConnection()
+            model = _MapDownlinkModel(swim_client)
+            model.connection = mock_connection
+            downlink_view = _MapDownlinkView(swim_client)
+            downlink_view._is_open = True
+            downlink_view._model = model
+            # When
+            with self.assertRaises(Exception) as error:
+                downlink_view.put('a', 1, blocking=True)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot block on "put" with the asynchronous client! Use "await client.put(...)" instead.',
+                         message)
+        self.assertEqual(0, len(mock_connection.messages_sent))
+
+    async def test_async_swim_client_map_downlink(self):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            mock_connection = MockConnection()
+            model = _MapDownlinkModel(swim_client)
+            model.connection = mock_connection
+            model.linked.set()
+            model._map[Text.create_from('a')] = (Text.create_from('a'), Num.create_from(1))
+            downlink_view = _MapDownlinkView(swim_client)
+            downlink_view._node_uri = 'map_node'
+            downlink_view._lane_uri = 'map_lane'
+            downlink_view._is_open = True
+            downlink_view._initialised.set()
+            downlink_view._model = model
+            # When
+            await swim_client.put(downlink_view, 'b', 2)
+            await swim_client.remove(downlink_view, 'a')
+            actual = await swim_client.get(downlink_view, 'a')
+            actual_missing = await swim_client.get(downlink_view, 'c', wait_sync=True)
+            actual_all = await swim_client.get(downlink_view, wait_sync=True)
+
+        # Then
+        self.assertEqual('@command(node:map_node,lane:map_lane)@update(key:b)2', mock_connection.messages_sent[0])
+        self.assertEqual('@command(node:map_node,lane:map_lane)@remove(key:a)', mock_connection.messages_sent[1])
+        self.assertEqual(1, actual)
+        self.assertEqual(Value.absent(), actual_missing)
+        self.assertEqual([('a', 1)], actual_all)
+
+    async def test_async_swim_client_get_before_open(self):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            downlink_view = swim_client.downlink_value()
+            # When
+            with self.assertRaises(Exception) as error:
+                await swim_client.get(downlink_view)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot execute "get" before the downlink has been opened!', message)
+
+    async def test_async_swim_client_get_event_downlink(self):
+        async with AsyncSwimClient() as swim_client:
+            # Given
+            downlink_view = swim_client.downlink_event()
+            downlink_view._is_open = True
+            # When
+            with self.assertRaises(TypeError) as error:
+                await swim_client.get(downlink_view)
+
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Downlink of type "_EventDownlinkView" does not support "get"!', message)
+
+    @staticmethod
+    def create_value_downlink(swim_client, mock_connection):
+        downlink_model = _ValueDownlinkModel(swim_client)
+        downlink_model.linked.set()
+        downlink_model.connection = mock_connection
+        downlink_model.node_uri = 'bar_node'
+        downlink_model.lane_uri = 'foo_lane'
+
+        downlink_view = _ValueDownlinkView(swim_client)
+        downlink_view._initialised.set()
+        downlink_view._model = downlink_model
+        downlink_view._node_uri = 'bar_node'
+        downlink_view._lane_uri = 'foo_lane'
+        downlink_view._is_open = True
+
+        return downlink_view
@@ -12,17 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import aiounittest
+import websockets
 
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from unittest.mock import patch
 from swimai import SwimClient
 from swimai.client._connections import _WSConnection, _ConnectionStatus, _ConnectionPool, _DownlinkManagerPool, \
-    _DownlinkManager, _DownlinkManagerStatus
-from swimai.client._downlinks._downlinks import _ValueDownlinkModel
+    _DownlinkManager, _DownlinkManagerStatus, _decode_messages
+from swimai.client._downlinks._downlinks import _ValueDownlinkModel, _DownlinkView
 from swimai.structures import Text, Value
 from swimai.warp._warp import _SyncedResponse, _LinkedResponse, _EventMessage
 from test.utils import MockWebsocket, MockWebsocketConnect, MockAsyncFunction, MockReceiveMessage, MockConnection, \
     MockDownlink, mock_did_set_callback, MockClass, mock_on_event_callback, mock_did_update_callback, \
-    mock_did_remove_callback, MockWebsocketConnectException
+    mock_did_remove_callback, MockWebsocketConnectException, mock_did_update_batch_callback
 
 
 class TestConnections(aiounittest.AsyncTestCase):
@@ -51,6 +53,16 @@ class TestConnections(aiounittest.AsyncTestCase):
         self.assertEqual(_ConnectionStatus.CLOSED, actual.status)
         self.assertEqual(1, pool._size)
 
+    async def test_pool_get_connection_decode_executor(self):
+        # Given
+        with ThreadPoolExecutor(1) as executor:
+            pool = _ConnectionPool(executor)
+            # When
+            actual = await pool._get_connection('ws://foo_bar:9000', 'ws')
+
+        # Then
+        self.assertEqual(executor, actual.decode_executor)
+
     async def test_pool_get_connection_existing(self):
         # Given
         pool = _ConnectionPool()
@@ -92,6 +104,23 @@ class TestConnections(aiounittest.AsyncTestCase):
         self.assertEqual(0, pool._size)
         self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
 
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    async def test_pool_close_connections(self, mock_websocket):
+        # Given
+        pool = _ConnectionPool()
+        first_connection = await pool._get_connection('ws://foo:9000', 'ws')
+        second_connection = await pool._get_connection('ws://bar:9000', 'ws')
+        await first_connection._open()
+        await second_connection._open()
+        # When
+        await pool._close_connections(2.5)
+        # Then
+        self.assertEqual(0, pool._size)
+        self.assertEqual(_ConnectionStatus.CLOSED, first_connection.status)
+        self.assertEqual(_ConnectionStatus.CLOSED, second_connection.status)
+        self.assertEqual(2.5, first_connection.websocket.close_timeout)
+        self.assertTrue(first_connection.websocket.closed)
+
     async def test_pool_remove_connection_non_existing(self):
         # Given
         pool = _ConnectionPool()
@@ -200,6 +229,50 @@ class TestConnections(aiounittest.AsyncTestCase):
         self.assertEqual(0, pool._size)
         mock_deregister_downlink_view.assert_not_called()
 
+    @patch('swimai.client._connections._WSConnection._subscribe_many', new_callable=MockAsyncFunction)
+    async def test_pool_add_downlink_views(self, mock_subscribe_many):
+        # Given
+        pool = _ConnectionPool()
+        first_uri = 'ws://foo_bar:9000'
+        second_uri = 'ws://foo_bar:9001'
+        client = SwimClient()
+        client._has_started = True
+        first_downlink_view = client.downlink_value().set_host_uri(first_uri)
+        second_downlink_view = client.downlink_value().set_host_uri(second_uri)
+        third_downlink_view = client.downlink_event().set_host_uri(first_uri)
+        # When
+        await pool._add_downlink_views([first_downlink_view, second_downlink_view, third_downlink_view])
+        # Then
+        self.assertEqual(2, pool._size)
+        self.assertEqual(first_uri, first_downlink_view._connection.host_uri)
+        self.assertEqual(second_uri, second_downlink_view._connection.host_uri)
+        self.assertEqual(first_downlink_view._connection, third_downlink_view._connection)
+        self.assertEqual(2, mock_subscribe_many.call_count)
+        mock_subscribe_many.assert_any_call([first_downlink_view, third_downlink_view])
+        mock_subscribe_many.assert_any_call([second_downlink_view])
+
+    @patch('swimai.client._connections._WSConnection._subscribe_many', new_callable=MockAsyncFunction)
+    @patch('swimai.client._connections._WSConnection._unsubscribe_many', new_callable=MockAsyncFunction)
+    async def test_pool_remove_downlink_views(self, mock_unsubscribe_many, mock_subscribe_many):
+        # Given
+        pool = _ConnectionPool()
+        first_uri = 'ws://foo_bar:9000'
+        second_uri = 'ws://foo_bar:9001'
+        client = SwimClient()
+        client._has_started = True
+        first_downlink_view = client.downlink_value().set_host_uri(first_uri)
+        second_downlink_view = client.downlink_value().set_host_uri(second_uri)
+        third_downlink_view = client.downlink_value().set_host_uri('ws://foo_bar:9002')
+        await pool._add_downlink_views([first_downlink_view, second_downlink_view])
+        first_downlink_view._connection.status = _ConnectionStatus.IDLE
+        # When
+        await pool._remove_downlink_views([first_downlink_view, second_downlink_view, third_downlink_view])
+        # Then
+        self.assertEqual(1, pool._size)
+        self.assertEqual(2, mock_unsubscribe_many.call_count)
+        mock_unsubscribe_many.assert_any_call([first_downlink_view])
+        mock_unsubscribe_many.assert_any_call([second_downlink_view])
+
     async def test_ws_connection(self):
         # Given
         host_uri = 'ws://localhost:9001'
@@ -329,6 +402,50 @@ class TestConnections(aiounittest.AsyncTestCase):
         mock_add_view.assert_any_call(second_downlink_view)
         mock_remove_view.assert_called_once_with(first_downlink_view)
 
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    @patch('swimai.client._connections._DownlinkManager._add_view', new_callable=MockAsyncFunction)
+    async def test_ws_connection_subscribe_many(self, mock_add_view, mock_websocket):
+        # Given
+        host_uri = 'ws://1.1.1.1:9001'
+        scheme = 'ws'
+        actual = _WSConnection(host_uri, scheme)
+        client = SwimClient()
+        client._has_started = True
+        first_downlink_view = client.downlink_value().set_host_uri(host_uri).set_node_uri('bar').set_lane_uri('baz')
+        second_downlink_view = client.downlink_value().set_host_uri(host_uri).set_node_uri('foo').set_lane_uri('bar')
+        # When
+        await actual._subscribe_many([first_downlink_view, second_downlink_view])
+        # Then
+        self.assertEqual(MockWebsocket.get_mock_websocket(), actual.websocket)
+        self.assertEqual(_ConnectionStatus.IDLE, actual.status)
+        self.assertTrue(actual._has_subscribers())
+        mock_websocket.assert_called_once_with(host_uri)
+        self.assertEqual(2, mock_add_view.call_count)
+        mock_add_view.assert_any_call(first_downlink_view)
+        mock_add_view.assert_any_call(second_downlink_view)
+
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    @patch('swimai.client._connections._DownlinkManager._add_view', new_callable=MockAsyncFunction)
+    @patch('swimai.client._connections._DownlinkManager._remove_view', new_callable=MockAsyncFunction)
+    async def test_ws_connection_unsubscribe_many(self, mock_remove_view, mock_add_view, mock_websocket):
+        # Given
+        host_uri = 'ws://1.2.3.4:9001'
+        scheme = 'ws'
+        actual = _WSConnection(host_uri, scheme)
+        client = SwimClient()
+        client._has_started = True
+        first_downlink_view = client.downlink_value().set_host_uri(host_uri).set_node_uri('foo').set_lane_uri('bar')
+        second_downlink_view = client.downlink_value().set_host_uri(host_uri).set_node_uri('bar').set_lane_uri('baz')
+        await actual._subscribe_many([first_downlink_view, second_downlink_view])
+        # When
+        await actual._unsubscribe_many([first_downlink_view, second_downlink_view])
+        # Then
+        self.assertEqual(_ConnectionStatus.CLOSED, actual.status)
+        self.assertFalse(actual._has_subscribers())
+        self.assertTrue(actual.websocket.closed)
+        mock_remove_view.assert_any_call(first_downlink_view)
+        mock_remove_view.assert_any_call(second_downlink_view)
+
     @patch('websockets.connect', new_callable=MockWebsocketConnect)
     async def test_ws_connection_open_new(self, mock_websocket):
         # Given
@@ -414,6 +531,26 @@ class TestConnections(aiounittest.AsyncTestCase):
         mock_websocket.assert_called_once_with(host_uri)
         self.assertTrue(connection.websocket.closed)
 
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    @patch('swimai.client._connections._DownlinkManager._add_view', new_callable=MockAsyncFunction)
+    @patch('swimai.client._connections._DownlinkManager._close_views')
+    async def test_ws_connection_close_views_of_all_lanes(self, mock_close_views, mock_add_view, mock_websocket):
+        # Given
+        host_uri = 'ws://1.2.3.4:9001'
+        scheme = 'ws'
+        connection = _WSConnection(host_uri, scheme)
+        client = SwimClient()
+        client._has_started = True
+        first_downlink_view = client.downlink_value().set_host_uri(host_uri).set_node_uri('foo').set_lane_uri('bar')
+        second_downlink_view = client.downlink_event().set_host_uri(host_uri).set_node_uri('foo').set_lane_uri('baz')
+        await connection._subscribe(first_downlink_view)
+        await connection._subscribe(second_downlink_view)
+        # When
+        await connection._close()
+        # Then
+        self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
+        self.assertEqual(2, mock_close_views.call_count)
+
     @patch('websockets.connect', new_callable=MockWebsocketConnect)
     async def test_ws_connection_close_missing_websocket(self, mock_websocket):
         # Given
@@ -543,6 +680,35 @@ class TestConnections(aiounittest.AsyncTestCase):
         mock_websocket.assert_called_once_with(host_uri)
         mock_receive_message.assert_called_once()
 
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    @patch('swimai.client._connections._DownlinkManager._add_view', new_callable=MockAsyncFunction)
+    @patch('swimai.client._connections._DownlinkManager._receive_message', new_callable=MockReceiveMessage)
+    async def test_ws_connection_wait_for_message_stopped_receiving(self, mock_receive_message, mock_add_view,
+                                                                    mock_websocket):
+        # Given
+        host_uri = 'ws://1.2.3.4:9001'
+        scheme = 'ws'
+        connection = _WSConnection(host_uri, scheme)
+        MockWebsocket.get_mock_websocket().connection = connection
+
+        client = SwimClient()
+        client._has_started = True
+        downlink_view = client.downlink_value()
+        downlink_view.set_host_uri(host_uri)
+        downlink_view.set_node_uri('foo')
+        downlink_view.set_lane_uri('bar')
+        await connection._subscribe(downlink_view)
+        connection.websocket.messages_to_send.append('@event(node:foo,lane:bar)1')
+        connection.websocket.messages_to_send.append('@linked(node:foo,lane:bar)')
+        # When
+        connection._stop_receiving()
+        await connection._wait_for_messages()
+        # Then
+        self.assertFalse(connection.receiving)
+        self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
+        mock_receive_message.assert_called_once()
+        self.assertEqual('@linked(node:foo,lane:bar)', mock_receive_message.call_args[0][0]._to_recon())
+
     @patch('websockets.connect', new_callable=MockWebsocketConnect)
     @patch('swimai.client._connections._DownlinkManager._add_view', new_callable=MockAsyncFunction)
     @patch('swimai.client._connections._DownlinkManager._receive_message', new_callable=MockReceiveMessage)
@@ -615,6 +781,106 @@ class TestConnections(aiounittest.AsyncTestCase):
         mock_websocket.assert_called_once()
         mock_add_view.assert_called_once_with(downlink_view)
 
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    @patch('swimai.client._connections._DownlinkManager._add_view', new_callable=MockAsyncFunction)
+    @patch('swimai.client._connections._DownlinkManager._receive_message', new_callable=MockAsyncFunction)
+    async def test_ws_connection_wait_for_message_decode_executor(self, mock_receive_message, mock_add_view,
+                                                                  mock_websocket):
+        # Given
+        host_uri = 'ws://2.2.2.2:9001'
+        executor = ThreadPoolExecutor(2)
+        connection = _WSConnection(host_uri, 'ws', executor)
+        MockWebsocket.get_mock_websocket().connection = connection
+
+        client = SwimClient()
+        client._has_started = True
+        downlink_view = client.downlink_value()
+        downlink_view.set_host_uri(host_uri)
+        downlink_view.set_node_uri('baz')
+        downlink_view.set_lane_uri('qux')
+        await connection._subscribe(downlink_view)
+
+        expected = [f'@event(node:baz,lane:qux){index}' for index in range(0, 600)]
+        connection.websocket.messages_to_send.extend(reversed(expected))
+        # When
+        await connection._wait_for_messages()
+        executor.shutdown()
+        # Then
+        actual = [call[0][0]._to_recon() for call in mock_receive_message.call_args_list]
+        self.assertEqual(expected, actual)
+        self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
+        mock_add_view.assert_called_once_with(downlink_view)
+
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    @patch('swimai.client._connections._DownlinkManager._add_view', new_callable=MockAsyncFunction)
+    @patch('swimai.client._connections._DownlinkManager._receive_message', new_callable=MockAsyncFunction)
+    async def test_ws_connection_wait_for_message_decode_executor_exception(self, mock_receive_message, mock_add_view,
+                                                                            mock_websocket):
+        # Given
+        host_uri = 'ws://5.5.5.5:9001'
+        executor = ThreadPoolExecutor(1)
+        connection = _WSConnection(host_uri, 'ws', executor)
+        MockWebsocket.get_mock_websocket().connection = connection
+        mock_websocket.set_raise_exception(True)
+
+        client = SwimClient()
+        client._has_started = True
+        downlink_view = client.downlink_value()
+        downlink_view.set_host_uri(host_uri)
+        downlink_view.set_node_uri('boo')
+        downlink_view.set_lane_uri('far')
+        await connection._subscribe(downlink_view)
+        # When
+        with self.assertRaises(Exception) as error:
+            await connection._wait_for_messages()
+        executor.shutdown()
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('WebSocket Exception!', message)
+        self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
+        mock_receive_message.assert_not_called()
+
+    def test_decode_messages_process_pool(self):
+        # Given
+        messages = ['@event(node:foo,lane:bar){id:1,name:baz}', '@synced(node:foo,lane:bar)']
+        # When
+        with ProcessPoolExecutor(1) as executor:
+            actual = executor.submit(_decode_messages, messages).result()
+        # Then
+        self.assertEqual(messages, [envelope._to_recon() for envelope in actual])
+
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    async def test_ws_connection_wait_for_message_closed_locally(self, mock_websocket):
+        # Given
+        connection = _WSConnection('ws://1.2.3.4:9001', 'ws')
+        await connection._open()
+
+        async def recv():
+            connection.status = _ConnectionStatus.CLOSED
+            raise websockets.exceptions.ConnectionClosedOK(None, None)
+
+        connection.websocket.custom_recv_func = recv
+        # When
+        await connection._wait_for_messages()
+        # Then
+        self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
+
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    async def test_ws_connection_wait_for_message_closed_remotely(self, mock_websocket):
+        # Given
+        connection = _WSConnection('ws://1.2.3.4:9001', 'ws')
+        await connection._open()
+
+        async def recv():
+            raise websockets.exceptions.ConnectionClosedError(None, None)
+
+        connection.websocket.custom_recv_func = recv
+        # When
+        with self.assertRaises(websockets.exceptions.ConnectionClosedError):
+            await connection._wait_for_messages()
+        # Then
+        self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
+
     async def test_downlink_manager_pool(self):
         # When
         actual = _DownlinkManagerPool()
@@ -824,7 +1090,8 @@ class TestConnections(aiounittest.AsyncTestCase):
         await actual._open()
         # Then
         self.assertEqual(_DownlinkManagerStatus.OPEN, actual.status)
-        mock_schedule_task.assert_called_once_with(MockConnection.get_mock_connection()._wait_for_messages)
+        mock_schedule_task.assert_called_once_with(MockConnection.get_mock_connection()._wait_for_messages,
+                                                   drainable=False)
         self.assertEqual(1, len(MockConnection.get_mock_connection().messages_sent))
         self.assertEqual('@sync(node:foo,lane:bar)', MockConnection.get_mock_connection().messages_sent[0])
 
@@ -850,7 +1117,8 @@ class TestConnections(aiounittest.AsyncTestCase):
         self.assertEqual(_DownlinkManagerStatus.OPEN, actual.status)
         self.assertEqual('@sync(node:moo,lane:car)', MockConnection.get_mock_connection().messages_sent[0])
         self.assertEqual(1, len(MockConnection.get_mock_connection().messages_sent))
-        mock_schedule_task.assert_called_once_with(MockConnection.get_mock_connection()._wait_for_messages)
+        mock_schedule_task.assert_called_once_with(MockConnection.get_mock_connection()._wait_for_messages,
+                                                   drainable=False)
 
     @patch('swimai.SwimClient._schedule_task')
     async def test_downlink_manager_close_running(self, mock_schedule_task):
@@ -1171,7 +1439,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         # When
         await actual._receive_message(envelope)
         # Then
-        self.assertEqual(value.value, actual.downlink_model._value)
+        self.assertEqual(value, actual.downlink_model._value)
         self.assertEqual(1, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
 
@@ -1198,7 +1466,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         await actual._receive_message(event_envelope)
         await actual._receive_message(synced_envelope)
         # Then
-        self.assertEqual(value.value, actual.downlink_model._value)
+        self.assertEqual(value, actual.downlink_model._value)
         self.assertTrue(actual.downlink_model._synced.is_set())
         self.assertTrue(actual.downlink_model.linked.is_set())
         self.assertEqual(1, mock_schedule_task.call_count)
@@ -1221,7 +1489,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         actual = _DownlinkManager(connection)
         await actual._add_view(downlink_view)
         # When
-        await actual._subscribers_did_set('dead', 'parrot')
+        await actual._subscribers_did_set(Text.create_from('dead'), Text.create_from('parrot'))
         # Then
         self.assertEqual(2, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1256,7 +1524,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         await actual._add_view(second_downlink_view)
         await actual._add_view(third_downlink_view)
         # When
-        await actual._subscribers_did_set('hello', 'world')
+        await actual._subscribers_did_set(Text.create_from('hello'), Text.create_from('world'))
         # Then
         self.assertEqual(6, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1298,7 +1566,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         actual = _DownlinkManager(connection)
         await actual._add_view(downlink_view)
         # When
-        await actual._subscribers_on_event('Hello, friend!')
+        await actual._subscribers_on_event(Text.create_from('Hello, friend!'))
         # Then
         self.assertEqual(2, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1332,7 +1600,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         await actual._add_view(second_downlink_view)
         await actual._add_view(third_downlink_view)
         # When
-        await actual._subscribers_on_event('Welcome home!')
+        await actual._subscribers_on_event(Text.create_from('Welcome home!'))
         # Then
         self.assertEqual(4, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1363,7 +1631,8 @@ class TestConnections(aiounittest.AsyncTestCase):
         actual = _DownlinkManager(connection)
         await actual._add_view(downlink_view)
         # When
-        await actual._subscribers_did_update('Key', 'New_value', 'Old_Value')
+        await actual._subscribers_did_update(Text.create_from('Key'), Text.create_from('New_value'),
+                                             Text.create_from('Old_Value'))
         # Then
         self.assertEqual(2, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1399,7 +1668,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         await actual._add_view(second_downlink_view)
         await actual._add_view(third_downlink_view)
         # When
-        await actual._subscribers_did_update('KeY', 'NeW', 'OlD')
+        await actual._subscribers_did_update(Text.create_from('KeY'), Text.create_from('NeW'), Text.create_from('OlD'))
         # Then
         self.assertEqual(4, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1436,7 +1705,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         actual = _DownlinkManager(connection)
         await actual._add_view(downlink_view)
         # When
-        await actual._subscribers_did_remove('Key', 'Old_Value')
+        await actual._subscribers_did_remove(Text.create_from('Key'), Text.create_from('Old_Value'))
         # Then
         self.assertEqual(2, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1471,7 +1740,7 @@ class TestConnections(aiounittest.AsyncTestCase):
         await actual._add_view(second_downlink_view)
         await actual._add_view(third_downlink_view)
         # When
-        await actual._subscribers_did_remove('Bar', 'Baz')
+        await actual._subscribers_did_remove(Text.create_from('Bar'), Text.create_from('Baz'))
         # Then
         self.assertEqual(4, mock_schedule_task.call_count)
         self.assertEqual(1, mock_send_message.call_count)
@@ -1488,6 +1757,31 @@ class TestConnections(aiounittest.AsyncTestCase):
         self.assertEqual('Bar', mock_schedule_task.call_args_list[3][0][1])
         self.assertEqual('Baz', mock_schedule_task.call_args_list[3][0][2])
 
+    @patch('swimai.client._connections._WSConnection._send_message', new_callable=MockAsyncFunction)
+    @patch('swimai.SwimClient._schedule_task')
+    async def test_downlink_manager_subscribers_did_update_batch(self, mock_schedule_task, mock_send_message):
+        # Given
+        host_uri = 'ws://4.3.2.1:9001'
+        scheme = 'ws'
+        connection = _WSConnection(host_uri, scheme)
+        client = SwimClient()
+        client._has_started = True
+        downlink_view = client.downlink_map()
+        downlink_view.set_node_uri('bar')
+        downlink_view.set_lane_uri('baz')
+        did_update_batch_callback = mock_did_update_batch_callback
+        downlink_view.did_update_batch(did_update_batch_callback)
+        actual = _DownlinkManager(connection)
+        await actual._add_view(downlink_view)
+        changes = [(Text.create_from('Key'), Text.create_from('New_value'), Text.create_from('Old_Value'))]
+        # When
+        await actual._subscribers_did_update_batch(changes)
+        # Then
+        self.assertEqual(2, mock_schedule_task.call_count)
+        self.assertEqual(1, mock_send_message.call_count)
+        self.assertEqual(did_update_batch_callback, mock_schedule_task.call_args_list[1][0][0])
+        self.assertEqual([('Key', 'New_value', 'Old_Value')], mock_schedule_task.call_args_list[1][0][1])
+
     @patch('swimai.client._connections._WSConnection._send_message', new_callable=MockAsyncFunction)
     @patch('swimai.SwimClient._schedule_task')
     async def test_downlink_manager_close_views_single(self, mock_schedule_task, mock_send_message):
@@ -1535,3 +1829,24 @@ class TestConnections(aiounittest.AsyncTestCase):
         self.assertFalse(third_downlink_view._is_open)
         self.assertTrue(mock_schedule_task.called)
         self.assertTrue(mock_send_message.called)
+
+    @patch('swimai.client._connections._WSConnection._send_message', new_callable=MockAsyncFunction)
+    @patch('swimai.SwimClient._schedule_task')
+    async def test_downlink_manager_close_views_events(self, mock_schedule_task, mock_send_message):
+        # Given
+        host_uri = 'ws://4.3.2.1:9001'
+        scheme = 'ws'
+        connection = _WSConnection(host_uri, scheme)
+        client = SwimClient()
+        client._has_started = True
+        downlink_view = client.downlink_event()
+        downlink_view._is_open = True
+        events = downlink_view.events()
+        actual = _DownlinkManager(connection)
+        await actual._add_view(downlink_view)
+        # When
+        actual._close_views()
+        # Then
+        self.assertTrue(downlink_view._events_closed)
+        self.assertEqual(_DownlinkView._EVENTS_CLOSED, downlink_view._events.get_nowait())
+        self.assertIsNotNone(events)
@@ -0,0 +1,332 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import pickle
+import aiounittest
+import websockets
+from queue import SimpleQueue
+from unittest.mock import patch
+
+from swimai import ShardedSwimClient, AsyncSwimClient
+from swimai.client._sharded_swim_client import _ShardedEventDownlinkView, _ShardedValueDownlinkView, \
+    _ShardedMapDownlinkView, _send_events, _run_shard, _forward_events, _close_events
+from swimai.recon import Recon
+from swimai.structures import Value, Num, Text
+from swimai.warp._warp import _Envelope
+
+
+class MockEventsConnection:
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    def send(self, message):
+        self.sent.append(message)
+
+    def close(self):
+        self.closed = True
+
+
+class MockPicklingEventsConnection(MockEventsConnection):
+
+    def send(self, message):
+        pickle.dumps(message)
+        super().send(message)
+
+
+class MockCommandsConnection:
+
+    def __init__(self, *commands):
+        self.commands = list(commands)
+
+    def recv(self):
+        return self.commands.pop(0)
+
+
+class TestShardedSwimClient(aiounittest.AsyncTestCase):
+
+    @staticmethod
+    async def serve(websocket):
+        async for message in websocket:
+            envelope = _Envelope._parse_recon(message)
+            route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+
+            if envelope._tag == 'sync':
+                await websocket.send(f'@linked{route}')
+                await websocket.send(f'@synced{route}')
+            elif envelope._tag == 'command':
+                await websocket.send(f'@event{route}{message[message.index(")") + 1:]}')
+
+    def test_sharded_swim_client_start_stop(self):
+        # Given
+        client = ShardedSwimClient(shards=2)
+        # When
+        client.start()
+        processes = [shard.process for shard in client._ShardedSwimClient__shards]
+        alive = [process.is_alive() for process in processes]
+        client.stop()
+        # Then
+        self.assertEqual([True, True], alive)
+        self.assertEqual([0, 0], [process.exitcode for process in processes])
+        self.assertFalse(client._has_started)
+
+    def test_sharded_swim_client_default_shards(self):
+        # When
+        actual = ShardedSwimClient()
+        # Then
+        self.assertGreaterEqual(actual.shards, 1)
+
+    def test_sharded_swim_client_get_shard(self):
+        # Given
+        with ShardedSwimClient(shards=3) as client:
+            shards = client._ShardedSwimClient__shards
+            # When
+            actual = client._get_shard('ws://localhost:9001', '/unit/foo', 'info')
+            actual_again = client._get_shard('ws://localhost:9001', '/unit/foo', 'info')
+            actual_all = {client._get_shard('ws://localhost:9001', f'/unit/{index}', 'info') for index in range(0, 30)}
+
+        # Then
+        self.assertIn(actual, shards)
+        self.assertIs(actual, actual_again)
+        self.assertEqual(set(shards), actual_all)
+
+    def test_sharded_swim_client_open_prio_rate(self):
+        # Given
+        with ShardedSwimClient(shards=1) as client:
+            downlink_view = client.downlink_value().set_host_uri('ws://localhost:9001').set_node_uri('foo')
+            downlink_view.set_lane_uri('bar').set_prio(2).set_rate(0.5)
+            # When
+            with patch('swimai.client._sharded_swim_client._Shard._send') as mock_send:
+                downlink_view.open()
+
+        # Then
+        mock_send.assert_called_once_with(('open', downlink_view._id, 'value', 'ws://localhost:9001', 'foo', 'bar', 2,
+                                           0.5))
+
+    @patch('warnings.warn')
+    def test_sharded_swim_client_open_before_started(self, mock_warn):
+        # Given
+        client = ShardedSwimClient(shards=1)
+        downlink_view = client.downlink_value().set_host_uri('ws://localhost:9001').set_node_uri('foo')
+        # When
+        downlink_view.set_lane_uri('bar').open()
+        # Then
+        self.assertFalse(downlink_view._is_open)
+        self.assertEqual('Cannot send to a shard before the client has been started!', mock_warn.call_args_list[0][0][0])
+
+    async def test_sharded_swim_client_value_downlink(self):
+        # Given
+        received = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        actual = []
+
+        def did_set(new_value, old_value):
+            actual.append((new_value, old_value))
+
+            if len(actual) == 2:
+                loop.call_soon_threadsafe(received.set)
+
+        async with websockets.serve(self.serve, 'localhost', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = ShardedSwimClient(shards=2).start()
+            downlink_view = client.downlink_value().set_host_uri(f'ws://localhost:{port}').set_node_uri('foo')
+            downlink_view.set_lane_uri('bar').did_set(did_set).open()
+            # When
+            downlink_view.set(5)
+            downlink_view.set('Hello')
+            await asyncio.wait_for(received.wait(), 10)
+            await loop.run_in_executor(None, client.stop)
+
+        # Then
+        self.assertEqual([(5, Value.absent()), ('Hello', 5)], actual)
+        self.assertEqual('Hello', downlink_view._value)
+
+    async def test_sharded_swim_client_command_event_downlink(self):
+        # Given
+        received = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        actual = []
+
+        def on_event(event):
+            actual.append(event)
+            loop.call_soon_threadsafe(received.set)
+
+        async with websockets.serve(self.serve, 'localhost', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+
+            with ShardedSwimClient(shards=1) as client:
+                downlink_view = client.downlink_event().set_host_uri(f'ws://localhost:{port}').set_node_uri('foo')
+                downlink_view.set_lane_uri('bar').on_event(on_event).open()
+                # When
+                client.command(f'ws://localhost:{port}', 'foo', 'bar', {'x': 1})
+                await asyncio.wait_for(received.wait(), 10)
+                downlink_view.close()
+
+        # Then
+        self.assertEqual([{'x': 1}], actual)
+        self.assertFalse(downlink_view._is_open)
+
+    async def test_sharded_swim_client_tagged_event_downlink(self):
+        # Given
+        received = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        actual = []
+
+        def on_event(event):
+            actual.append(event)
+
+            if len(actual) == 2:
+                loop.call_soon_threadsafe(received.set)
+
+        async with websockets.serve(self.serve, 'localhost', 0) as server:
+            port = server.sockets[0].getsockname()[1]
+
+            with ShardedSwimClient(shards=1) as client:
+                downlink_view = client.downlink_event().set_host_uri(f'ws://localhost:{port}').set_node_uri('foo')
+                downlink_view.set_lane_uri('bar').on_event(on_event).open()
+                # When
+                client.command(f'ws://localhost:{port}', 'foo', 'bar', Recon.parse('@Sensor{status:alarm}'))
+                client.command(f'ws://localhost:{port}', 'foo', 'bar', 5)
+                await asyncio.wait_for(received.wait(), 10)
+
+        # Then
+        self.assertEqual('Sensor', type(actual[0]).__name__)
+        self.assertEqual('alarm', actual[0].status)
+        self.assertEqual(5, actual[1])
+
+    def test_sharded_value_downlink_view_dispatch(self):
+        # Given
+        actual = []
+        downlink_view = _ShardedValueDownlinkView(ShardedSwimClient())
+        downlink_view.did_set(lambda new_value, old_value: actual.append((new_value, old_value)))
+        # When
+        downlink_view._dispatch([(Num.create_from(1), Value.absent()), (Num.create_from(2), Num.create_from(1))])
+        # Then
+        self.assertEqual([(1, Value.absent()), (2, 1)], actual)
+        self.assertEqual(2, downlink_view._value)
+
+    def test_sharded_map_downlink_view_dispatch(self):
+        # Given
+        updated = []
+        removed = []
+        downlink_view = _ShardedMapDownlinkView(ShardedSwimClient())
+        downlink_view.did_update(lambda key, new_value, old_value: updated.append((key, new_value, old_value)))
+        downlink_view.did_remove(lambda key, old_value: removed.append((key, old_value)))
+        # When
+        key = Text.create_from('a')
+        downlink_view._dispatch([(key, Num.create_from(1), Value.absent()), (key, Value.absent(), Num.create_from(1))])
+        # Then
+        self.assertEqual([('a', 1, Value.absent())], updated)
+        self.assertEqual([('a', 1)], removed)
+
+    def test_sharded_event_downlink_view_dispatch_no_callback(self):
+        # Given
+        downlink_view = _ShardedEventDownlinkView(ShardedSwimClient())
+        # When
+        downlink_view._dispatch([Text.create_from('foo')])
+        # Then
+        self.assertIsNone(downlink_view._on_event_callback)
+
+    def test_sharded_downlink_view_invalid_callback(self):
+        # Given
+        async def callback(event):
+            pass
+
+        downlink_view = _ShardedEventDownlinkView(ShardedSwimClient())
+        # When
+        with self.assertRaises(TypeError) as error:
+            downlink_view.on_event(callback)
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Callback must be a function!', message)
+
+    @patch('warnings.warn')
+    def test_sharded_value_downlink_view_set_before_open(self, mock_warn):
+        # Given
+        downlink_view = _ShardedValueDownlinkView(ShardedSwimClient())
+        # When
+        downlink_view.set(1)
+        # Then
+        self.assertEqual('Cannot execute "set" before the downlink has been opened!', mock_warn.call_args_list[0][0][0])
+
+    def test_send_events(self):
+        # Given
+        outbox = SimpleQueue()
+        events = MockEventsConnection()
+        outbox.put((1, ['foo']))
+        outbox.put((2, ['bar', 'baz']))
+        outbox.put(None)
+        # When
+        _send_events(outbox, events)
+        # Then
+        self.assertEqual([[(1, ['foo']), (2, ['bar', 'baz'])], None], events.sent)
+        self.assertTrue(events.closed)
+
+    def test_run_shard_command_error(self):
+        # Given
+        commands = MockCommandsConnection(('set', 99, 1), ('command', 'ws://localhost:9001', 'foo', 'bar', 1), ('stop',))
+        events = MockEventsConnection()
+        # When
+        with patch('swimai.client._swim_client.SwimClient.command') as mock_command:
+            _run_shard(commands, events)
+        # Then
+        self.assertEqual([[(None, 'Command "set" failed in the worker: 99')], None], events.sent)
+        mock_command.assert_called_once_with('ws://localhost:9001', 'foo', 'bar', 1)
+        self.assertTrue(events.closed)
+
+    @patch('warnings.warn')
+    def test_sharded_swim_client_receive_error(self, mock_warn):
+        # Given
+        client = ShardedSwimClient(shards=1)
+        events = MockCommandsConnection([(None, 'Command "set" failed in the worker: 99')], None)
+        # When
+        client._ShardedSwimClient__receive_events(type('MockShard', (), {'events': events})())
+        # Then
+        mock_warn.assert_called_once_with('Command "set" failed in the worker: 99')
+
+    async def test_close_events_forwards_remaining_events(self):
+        # Given
+        outbox = SimpleQueue()
+
+        async with AsyncSwimClient() as client:
+            downlink_view = client.downlink_value()
+            forwarder = asyncio.create_task(_forward_events(1, downlink_view, outbox))
+            await asyncio.sleep(0)
+            await downlink_view._put_event('foo')
+            await downlink_view._put_event('bar')
+            # When
+            await _close_events([downlink_view])
+            await asyncio.wait_for(forwarder, 1)
+
+        # Then
+        self.assertEqual((1, ['foo', 'bar']), outbox.get_nowait())
+        self.assertTrue(outbox.empty())
+
+    def test_send_events_unpicklable(self):
+        # Given
+        outbox = SimpleQueue()
+        events = MockPicklingEventsConnection()
+        outbox.put((1, [lambda: None]))
+        outbox.put((2, ['foo']))
+        outbox.put(None)
+        # When
+        _send_events(outbox, events)
+        # Then
+        self.assertEqual(3, len(events.sent))
+        self.assertIsNone(events.sent[0][0][0])
+        self.assertTrue(events.sent[0][0][1].startswith('Events could not be sent by the worker: '))
+        self.assertEqual([[(2, ['foo'])], None], events.sent[1:])
+        self.assertTrue(events.closed)
@@ -12,13 +12,17 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import asyncio
+import time
 import aiounittest
+import websockets
 from concurrent import futures
 from threading import Thread
 from unittest.mock import patch
 
+from swimai.client._connections import _ConnectionStatus
 from swimai.client._downlinks._downlinks import _ValueDownlinkView, _MapDownlinkView, _EventDownlinkView
-from swimai.structures import Text
+from swimai.structures import Text, Value
+from swimai.warp._warp import _Envelope
 from test.utils import MockWebsocketConnect, MockWebsocket, MockAsyncFunction, MockScheduleTask, \
     mock_exception_callback, MockRunWithExceptionOnce, MockExceptionOnce
 from swimai import SwimClient
@@ -47,6 +51,23 @@ class TestSwimClient(aiounittest.AsyncTestCase):
         self.assertTrue(actual._has_started)
         client.stop()
 
+    def test_swim_client_start_loop_factory(self):
+        # Given
+        loops = []
+
+        def loop_factory():
+            loop = asyncio.new_event_loop()
+            loops.append(loop)
+            return loop
+
+        client = SwimClient(loop_factory=loop_factory)
+        # When
+        actual = client.start()
+        # Then
+        self.assertEqual([actual._loop], loops)
+        self.assertTrue(actual._loop_thread.is_alive())
+        client.stop()
+
     def test_swim_client_stop(self):
         # Given
         client = SwimClient()
@@ -61,6 +82,76 @@ class TestSwimClient(aiounittest.AsyncTestCase):
         self.assertFalse(actual._loop_thread.is_alive())
         self.assertFalse(actual._has_started)
 
+    def test_swim_client_stop_drain(self):
+        # Given
+        completed = []
+
+        async def task():
+            await asyncio.sleep(0.05)
+            completed.append(True)
+
+        client = SwimClient()
+        client.start()
+        future = client._schedule_task(task)
+        # When
+        client.stop(drain=True, timeout=1)
+        # Then
+        self.assertEqual([True], completed)
+        self.assertFalse(future.cancelled())
+        self.assertTrue(client._loop.is_closed())
+
+    def test_swim_client_stop_drain_timeout(self):
+        # Given
+        mock_task = MockScheduleTask.get_mock_schedule_task()
+        client = SwimClient()
+        client.start()
+        future = client._schedule_task(mock_task.async_infinite_cancel_execute)
+        start = time.monotonic()
+        # When
+        client.stop(drain=True, timeout=0.1)
+        # Then
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(future.cancelled())
+
+    def test_swim_client_stop_without_drain(self):
+        # Given
+        completed = []
+
+        async def task():
+            await asyncio.sleep(0.05)
+            completed.append(True)
+
+        client = SwimClient()
+        client.start()
+        future = client._schedule_task(task)
+        # When
+        client.stop()
+        # Then
+        self.assertEqual([], completed)
+        self.assertTrue(future.cancelled())
+
+    @patch('websockets.connect', new_callable=MockWebsocketConnect)
+    def test_swim_client_stop_drain_receiving(self, mock_websocket):
+        # Given
+        async def recv():
+            await asyncio.sleep(10)
+
+        MockWebsocket.get_mock_websocket().custom_recv_func = recv
+        client = SwimClient()
+        client.start()
+        connection = client._run_task(client._get_connection, 'ws://localhost:9001', 'ws')
+        client._run_task(connection._open)
+        future = client._schedule_task(connection._wait_for_messages, drainable=False)
+        start = time.monotonic()
+        # When
+        client.stop(drain=True, timeout=2)
+        # Then
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(future.done())
+        self.assertTrue(MockWebsocket.get_mock_websocket().closed)
+        self.assertEqual(_ConnectionStatus.CLOSED, connection.status)
+        self.assertFalse(connection.receiving)
+
     def test_swim_client_with_statement(self):
         # When
         with SwimClient() as swim_client:
@@ -311,6 +402,179 @@ class TestSwimClient(aiounittest.AsyncTestCase):
         mock_add_downlink.assert_called_once_with(downlink_view)
         mock_remove_downlink.assert_called_once_with(downlink_view)
 
+    @patch('swimai.client._swim_client.SwimClient._open_downlink_views', new_callable=MockAsyncFunction)
+    @patch('swimai.client._swim_client.SwimClient._close_downlink_views', new_callable=MockAsyncFunction)
+    def test_swim_client_open_close_many(self, mock_close_downlink_views, mock_open_downlink_views):
+        with SwimClient() as swim_client:
+            # Given
+            first_downlink_view = swim_client.downlink_value()
+            second_downlink_view = swim_client.downlink_map()
+            first_downlink_view._is_open = True
+            # When
+            swim_client.open_many([first_downlink_view, second_downlink_view]).result()
+            is_open = second_downlink_view._is_open
+            swim_client.close_many([first_downlink_view, second_downlink_view]).result()
+
+        # Then
+        self.assertTrue(is_open)
+        self.assertFalse(first_downlink_view._is_open)
+        self.assertFalse(second_downlink_view._is_open)
+        mock_open_downlink_views.assert_called_once_with([second_downlink_view], None)
+        mock_close_downlink_views.assert_called_once_with([first_downlink_view, second_downlink_view])
+
+    @patch('warnings.warn')
+    def test_swim_client_open_many_before_client_started(self, mock_warn):
+        # Given
+        swim_client = SwimClient()
+        downlink_view = swim_client.downlink_value()
+        # When
+        actual = swim_client.open_many([downlink_view])
+        # Then
+        self.assertIsNone(actual)
+        self.assertFalse(downlink_view._is_open)
+        self.assertEqual('Cannot execute "_open_downlink_views" before the client has been started!',
+                         mock_warn.call_args_list[0][0][0])
+
+    async def test_swim_client_open_close_many_remote(self):
+        # Given
+        async def serve(websocket):
+            async for message in websocket:
+                envelope = _Envelope._parse_recon(message)
+                route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+                await websocket.send(f'@linked{route}')
+
+                if envelope._tag == 'sync':
+                    await websocket.send(f'@synced{route}')
+
+        loop = asyncio.get_running_loop()
+
+        async with websockets.serve(serve, 'localhost', 0) as server:
+            host_uri = f'ws://localhost:{server.sockets[0].getsockname()[1]}'
+
+            with SwimClient() as swim_client:
+                value_views = [swim_client.downlink_value().set_host_uri(host_uri).set_node_uri(f'/unit/{index}')
+                               .set_lane_uri('value') for index in range(0, 50)]
+                map_view = swim_client.downlink_map().set_host_uri(host_uri).set_node_uri('/unit').set_lane_uri('map')
+                event_view = swim_client.downlink_event().set_host_uri(host_uri).set_node_uri('/unit')
+                event_view.set_lane_uri('event')
+                downlink_views = value_views + [map_view, event_view]
+                # When
+                await loop.run_in_executor(None, swim_client.open_many(downlink_views).result, 10)
+                await asyncio.sleep(0.1)
+                opened = [downlink_view._is_open for downlink_view in downlink_views]
+                synced = [downlink_view._model._synced.is_set() for downlink_view in value_views + [map_view]]
+                linked = event_view._model.linked.is_set()
+                await loop.run_in_executor(None, swim_client.close_many(downlink_views).result, 10)
+
+        # Then
+        self.assertTrue(all(opened))
+        self.assertTrue(all(synced))
+        self.assertTrue(linked)
+        self.assertFalse(any(downlink_view._is_open for downlink_view in downlink_views))
+        self.assertEqual(_ConnectionStatus.CLOSED, event_view._connection.status)
+
+    @patch('warnings.warn')
+    async def test_swim_client_open_many_timeout(self, mock_warn):
+        # Given
+        async def serve(websocket):
+            async for message in websocket:
+                envelope = _Envelope._parse_recon(message)
+                route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+
+                if envelope._node_uri == '/unit/0':
+                    await websocket.send(f'@linked{route}')
+                    await websocket.send(f'@synced{route}')
+
+        loop = asyncio.get_running_loop()
+
+        async with websockets.serve(serve, 'localhost', 0) as server:
+            host_uri = f'ws://localhost:{server.sockets[0].getsockname()[1]}'
+
+            with SwimClient() as swim_client:
+                downlink_views = [swim_client.downlink_value().set_host_uri(host_uri).set_node_uri(f'/unit/{index}')
+                                  .set_lane_uri('value') for index in range(0, 2)]
+                # When
+                with self.assertRaises(Exception) as error:
+                    await loop.run_in_executor(None, swim_client.open_many(downlink_views, 0.2).result, 10)
+
+                synced = [downlink_view._model._synced.is_set() for downlink_view in downlink_views]
+                opened = [downlink_view._is_open for downlink_view in downlink_views]
+
+        # Then
+        self.assertEqual('Downlinks /unit/1/value were not established within 0.2 seconds!', str(error.exception))
+        self.assertEqual([True, False], synced)
+        self.assertEqual([True, True], opened)
+        self.assertEqual('Downlinks /unit/1/value were not established within 0.2 seconds!',
+                         mock_warn.call_args_list[0][0][0])
+
+    async def test_swim_client_stop_drain_set_remote(self):
+        # Given
+        received = []
+
+        async def serve(websocket):
+            async for message in websocket:
+                envelope = _Envelope._parse_recon(message)
+                route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+                received.append(envelope._tag)
+
+                if envelope._tag == 'sync':
+                    await websocket.send(f'@event{route}1')
+                    await websocket.send(f'@linked{route}')
+                    await websocket.send(f'@synced{route}')
+
+        loop = asyncio.get_running_loop()
+
+        async with websockets.serve(serve, 'localhost', 0) as server:
+            host_uri = f'ws://localhost:{server.sockets[0].getsockname()[1]}'
+            swim_client = SwimClient().start()
+            downlink_view = swim_client.downlink_value().set_host_uri(host_uri).set_node_uri('/unit')
+            downlink_view.set_lane_uri('value').open()
+            downlink_view.set(42)
+            start = time.monotonic()
+            # When
+            await loop.run_in_executor(None, swim_client.stop, True, 2)
+            elapsed = time.monotonic() - start
+            await asyncio.sleep(0.1)
+
+        # Then
+        self.assertEqual(['sync', 'command'], received)
+        self.assertLess(elapsed, 1)
+
+    async def test_swim_client_stop_drain_flush_batch(self):
+        # Given
+        batches = []
+
+        async def serve(websocket):
+            async for message in websocket:
+                envelope = _Envelope._parse_recon(message)
+                route = f'(node:"{envelope._node_uri}",lane:"{envelope._lane_uri}")'
+
+                if envelope._tag == 'sync':
+                    await websocket.send(f'@linked{route}')
+                    await websocket.send(f'@synced{route}')
+                    await websocket.send(f'@event{route}@update(key:a)1')
+
+        async def did_update_batch(changes):
+            batches.append(changes)
+
+        loop = asyncio.get_running_loop()
+
+        async with websockets.serve(serve, 'localhost', 0) as server:
+            host_uri = f'ws://localhost:{server.sockets[0].getsockname()[1]}'
+            swim_client = SwimClient().start()
+            downlink_view = swim_client.downlink_map().set_host_uri(host_uri).set_node_uri('/unit')
+            downlink_view.set_lane_uri('map').did_update_batch(did_update_batch, window=10).open()
+            deadline = time.monotonic() + 2
+
+            while (downlink_view._model is None or not downlink_view._model._batch) and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+
+            # When
+            await loop.run_in_executor(None, swim_client.stop, True, 2)
+
+        # Then
+        self.assertEqual([[('a', 1, Value.absent())]], batches)
+
     @patch('swimai.client._connections._ConnectionPool._get_connection', new_callable=MockAsyncFunction)
     async def test_swim_client_get_connection(self, mock_get_connection):
         # Given
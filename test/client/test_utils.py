@@ -12,9 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import unittest
+from unittest.mock import patch, MagicMock
 from urllib.parse import urlparse
 
+from swimai.client import uvloop_factory
 from swimai.client._utils import _URI
 
 
@@ -119,3 +122,23 @@ class TestUtils(unittest.TestCase):
         # Then
         message = error.exception.args[0]
         self.assertEqual('Invalid scheme "carp" for Warp URI!', message)
+
+    @patch.dict('sys.modules', {'uvloop': None})
+    def test_uvloop_factory_not_installed(self):
+        # When
+        actual = uvloop_factory()
+        # Then
+        self.assertIsInstance(actual, asyncio.AbstractEventLoop)
+        actual.close()
+
+    def test_uvloop_factory_installed(self):
+        # Given
+        mock_uvloop = MagicMock()
+
+        with patch.dict('sys.modules', {'uvloop': mock_uvloop}):
+            # When
+            actual = uvloop_factory()
+
+        # Then
+        self.assertEqual(mock_uvloop.new_event_loop.return_value, actual)
+        mock_uvloop.new_event_loop.assert_called_once_with()
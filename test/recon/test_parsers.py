@@ -444,6 +444,29 @@ class TestParsers(unittest.TestCase):
         self.assertIsInstance(actual, Text)
         self.assertEqual('test', actual.value)
 
+    def test_parse_keys_interned(self):
+        # Given
+        parser = _ReconParser()
+        # When
+        first = parser._parse_block_expression(_InputMessage._create('@event(lane:status)'))
+        second = parser._parse_block_expression(_InputMessage._create('@event(lane:status)'))
+        # Then
+        self.assertIs(first.get_item(0).key, second.get_item(0).key)
+        self.assertIs(first.get_item(0).value.get_item(0).key, second.get_item(0).value.get_item(0).key)
+        self.assertIsNot(first.get_item(0).value.get_item(0).value, second.get_item(0).value.get_item(0).value)
+        self.assertEqual('status', first.get_item(0).value.get_item(0).value.value)
+
+    def test_parse_ident_not_interned(self):
+        # Given
+        parser = _ReconParser()
+        # When
+        first = parser._parse_ident(_InputMessage._create('sensor_1234'))
+        second = parser._parse_ident(_InputMessage._create('sensor_1234'))
+        # Then
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertNotIn('sensor_1234', Text._interned)
+
     def test_parse_ident_valid_with_leading_spaces(self):
         # Given
         message = _InputMessage._create('   foo')
@@ -17,6 +17,7 @@ import unittest
 from swimai.structures import RecordMap, Attr, Text, Slot
 from swimai.recon import Recon
 from swimai.recon._parsers import _ReconParser
+from swimai.recon._transcoders import _JsonTranscoder
 from swimai.recon._writers import _ReconWriter
 
 
@@ -46,6 +47,67 @@ class TestRecon(unittest.TestCase):
         # Then
         self.assertEqual('@remove(key:foo)', actual)
 
+    def test_to_json(self):
+        # Given
+        recon_string = '@event(node:"/unit/foo",lane:info){@update(key:milk){count:3,items:{1,2}}}'
+        # When
+        actual = Recon.to_json(recon_string)
+        # Then
+        self.assertEqual({'@event': {'node': '/unit/foo', 'lane': 'info'},
+                          '$1': {'@update': {'key': 'milk'}, 'count': 3, 'items': [1, 2]}}, actual)
+
+    def test_transcode_to_json(self):
+        # Given
+        recon_string = '@event(node:"/unit/foo",lane:info){@update(key:milk){count:3,items:{1,2}}}'
+        # When
+        actual = Recon.transcode_to_json(recon_string)
+        # Then
+        self.assertEqual('{"@event":{"node":"/unit/foo","lane":"info"},'
+                         '"$1":{"@update":{"key":"milk"},"count":3,"items":[1,2]}}', actual)
+
+    def test_transcode_to_json_prefixes(self):
+        # Given
+        recon_string = '@event(node:"/unit/foo",lane:info)5{count:3}'
+        # When
+        actual = Recon.transcode_to_json(recon_string, attr_prefix='_', index_prefix='#')
+        # Then
+        self.assertEqual('{"_event":{"node":"/unit/foo","lane":"info"},"#1":5,"count":3}', actual)
+
+    def test_transcode_from_json(self):
+        # Given
+        json_string = '{"@event":{"node":"/unit/foo","lane":"info"},' \
+                      '"$1":{"@update":{"key":"milk"},"count":3,"items":[1,2]}}'
+        # When
+        actual = Recon.transcode_from_json(json_string)
+        # Then
+        self.assertEqual('@event(node:"/unit/foo",lane:info){@update(key:milk){count:3,items:{1,2}}}', actual)
+
+    def test_transcode_from_json_prefixes(self):
+        # Given
+        json_string = '{"_event":{"node":"/unit/foo","lane":"info"},"#1":5,"count":3}'
+        # When
+        actual = Recon.transcode_from_json(json_string, attr_prefix='_', index_prefix='#')
+        # Then
+        self.assertEqual('@event(node:"/unit/foo",lane:info){5,count:3}', actual)
+
+    def test_get_transcoder_once(self):
+        # When
+        actual = Recon._get_transcoder('@', '$')
+        # Then
+        self.assertIsInstance(actual, _JsonTranscoder)
+        self.assertEqual(Recon._get_transcoder('@', '$'), actual)
+
+    def test_get_transcoder_different_prefixes(self):
+        # Given
+        expected = Recon._get_transcoder('@', '$')
+        # When
+        actual = Recon._get_transcoder('_', '$')
+        # Then
+        self.assertIsInstance(actual, _JsonTranscoder)
+        self.assertNotEqual(expected, actual)
+        self.assertEqual('_', actual._attr_prefix)
+        self.assertEqual('$', actual._index_prefix)
+
     def test_get_writer_once(self):
         # When
         actual = Recon._get_writer()
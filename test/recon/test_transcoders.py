@@ -0,0 +1,249 @@
+#  Copyright 2015-2021 SWIM.AI inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import unittest
+
+from swimai.recon import Recon
+from swimai.recon._transcoders import _JsonTranscoder
+
+
+class TestTranscoders(unittest.TestCase):
+
+    def test_json_transcoder_invalid_prefixes(self):
+        # When
+        with self.assertRaises(Exception) as error:
+            _JsonTranscoder('@', '@')
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('The attribute and index prefixes must be different and not empty!', message)
+
+    def test_recon_to_json_primitives(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # Then
+        self.assertEqual('42', transcoder._recon_to_json('42'))
+        self.assertEqual('-3', transcoder._recon_to_json('-3'))
+        self.assertEqual('7', transcoder._recon_to_json('007'))
+        self.assertEqual('2.5', transcoder._recon_to_json('2.50'))
+        self.assertEqual('-0.5', transcoder._recon_to_json('-.5'))
+        self.assertEqual('true', transcoder._recon_to_json('true'))
+        self.assertEqual('false', transcoder._recon_to_json('false'))
+        self.assertEqual('"hello"', transcoder._recon_to_json('hello'))
+        self.assertEqual('null', transcoder._recon_to_json(''))
+
+    def test_recon_to_json_string_escaped(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._recon_to_json('"tab\tslash\\ unicode é"')
+        # Then
+        self.assertEqual('"tab\\tslash\\\\ unicode é"', actual)
+
+    def test_recon_to_json_array(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._recon_to_json('{1, 2.5; foo\n"bar", {true}, {}}')
+        # Then
+        self.assertEqual('[1,2.5,"foo","bar",[true],[]]', actual)
+
+    def test_recon_to_json_object(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._recon_to_json('{id: 42, name: "foo bar", empty:, values: {1, 2}, nested: {x: 1}, 5}')
+        # Then
+        self.assertEqual('{"id":42,"name":"foo bar","empty":null,"values":[1,2],"nested":{"x":1},"$5":5}', actual)
+
+    def test_recon_to_json_object_keys(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._recon_to_json('{"a b": 1, 2: 3, true: 4}')
+        # Then
+        self.assertEqual('{"a b":1,"2":3,"true":4}', actual)
+
+    def test_recon_to_json_attrs(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._recon_to_json('@event(node:"/unit/foo",lane:info)@update(key:"abc")@flag@empty()'
+                                           '@single(5)@many(1,2)@nested(@tag{x:1}){temperature:21.5}')
+        # Then
+        self.assertEqual('{"@event":{"node":"/unit/foo","lane":"info"},"@update":{"key":"abc"},"@flag":null,'
+                         '"@empty":null,"@single":5,"@many":[1,2],"@nested":{"@tag":null,"x":1},"temperature":21.5}',
+                         actual)
+
+    def test_recon_to_json_attrs_values(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._recon_to_json('@sync(node: "foo/node", lane: "foo/lane") "Hello, World" 5')
+        # Then
+        self.assertEqual('{"@sync":{"node":"foo/node","lane":"foo/lane"},"$1":"Hello, World","$2":5}', actual)
+
+    def test_recon_to_json_prefixes(self):
+        # Given
+        transcoder = _JsonTranscoder('_', '#')
+        # When
+        actual = transcoder._recon_to_json('@event(node:foo){1,x:2}')
+        # Then
+        self.assertEqual('{"_event":{"node":"foo"},"#1":1,"x":2}', actual)
+
+    def test_recon_to_json_same_as_converter(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        messages = ['@event(node:"/unit/foo",lane:info)@update(key:"abc"){temperature:21.5,id:42,status:ok}',
+                    '@sync(node: "foo/node", lane: "foo/lane")"Hello, World"',
+                    '@command(node:"/a",lane:b){items:{1,2,3},owner:{name:foo,age:30}}',
+                    '@remove(key:foo)',
+                    '{1, @a 1, 2}',
+                    '5 {x:1}']
+
+        for message in messages:
+            # When
+            actual = transcoder._recon_to_json(message)
+            # Then
+            self.assertEqual(Recon.to_json(message), json.loads(actual))
+
+    def test_recon_to_json_string_not_closed(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        with self.assertRaises(TypeError) as error:
+            transcoder._recon_to_json('{a:"foo}')
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('String starting at position 3 is not closed!\nMessage: {a:"foo}', message)
+
+    def test_recon_to_json_record_not_closed(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        with self.assertRaises(TypeError) as error:
+            transcoder._recon_to_json('{a:1')
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Record is not closed!\nMessage: {a:1', message)
+
+    def test_recon_to_json_invalid_attr(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        with self.assertRaises(TypeError) as error:
+            transcoder._recon_to_json('@1')
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Attribute starting at position 0 is invalid!\nMessage: @1', message)
+
+    def test_recon_to_json_invalid_number(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        with self.assertRaises(TypeError) as error:
+            transcoder._recon_to_json('-.')
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Number starting at position 0 is invalid!\nMessage: -.', message)
+
+    def test_recon_to_json_unexpected_character(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        with self.assertRaises(TypeError) as error:
+            transcoder._recon_to_json('{a:1} }')
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Unexpected character at position 6!\nMessage: {a:1} }', message)
+
+    def test_recon_to_json_empty_key(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        with self.assertRaises(TypeError) as error:
+            transcoder._recon_to_json('{:1}')
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Unexpected character at position 1!\nMessage: {:1}', message)
+
+    def test_json_to_recon_primitives(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # Then
+        self.assertEqual('42', transcoder._json_to_recon('42'))
+        self.assertEqual('2.5', transcoder._json_to_recon('2.5'))
+        self.assertEqual('true', transcoder._json_to_recon('true'))
+        self.assertEqual('false', transcoder._json_to_recon('false'))
+        self.assertEqual('hello', transcoder._json_to_recon('"hello"'))
+        self.assertEqual('"hello world"', transcoder._json_to_recon('"hello world"'))
+        self.assertEqual('"true"', transcoder._json_to_recon('"true"'))
+        self.assertEqual('', transcoder._json_to_recon('null'))
+
+    def test_json_to_recon_array(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._json_to_recon('[1, "foo", [true], []]')
+        # Then
+        self.assertEqual('{1,foo,{true},{}}', actual)
+
+    def test_json_to_recon_object(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._json_to_recon('{"id": 42, "a b": null, "values": [1, 2], "nested": {"x": 1}, "$4": 5}')
+        # Then
+        self.assertEqual('{id:42,"a b":,values:{1,2},nested:{x:1},5}', actual)
+
+    def test_json_to_recon_attrs(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._json_to_recon('{"@event": {"node": "/unit/foo", "lane": "info"}, "@flag": null, '
+                                           '"@single": 5, "@one": [5], "@many": [1, 2], "@empty": {}, '
+                                           '"@nested": {"@tag": null, "x": 1}, "temperature": 21.5, "@late": 1}')
+        # Then
+        self.assertEqual('@event(node:"/unit/foo",lane:info)@flag@single(5)@one({5})@many(1,2)@empty({})'
+                         '@nested(@tag{x:1}){temperature:21.5,"@late":1}', actual)
+
+    def test_json_to_recon_attrs_only(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        # When
+        actual = transcoder._json_to_recon('{"@remove": {"key": "foo"}}')
+        # Then
+        self.assertEqual('@remove(key:foo)', actual)
+
+    def test_json_to_recon_prefixes(self):
+        # Given
+        transcoder = _JsonTranscoder('_', '#')
+        # When
+        actual = transcoder._json_to_recon('{"_event": {"node": "foo"}, "@a": 1, "#2": 2}')
+        # Then
+        self.assertEqual('@event(node:foo){"@a":1,2}', actual)
+
+    def test_json_to_recon_round_trip(self):
+        # Given
+        transcoder = _JsonTranscoder()
+        messages = ['{"@event":{"node":"/unit/foo","lane":"info"},"@update":{"key":"abc"},"temperature":21.5}',
+                    '{"@a":{"@b":null,"x":1},"$1":[1,[2,3],{"y":[4]}],"z":null}',
+                    '{"@a":[5],"@b":[],"@c":{"x":[]}}',
+                    '[{"@a":null},{"x":"foo bar"},true]']
+
+        for message in messages:
+            # When
+            actual = transcoder._recon_to_json(transcoder._json_to_recon(message))
+            # Then
+            self.assertEqual(json.loads(message), json.loads(actual))
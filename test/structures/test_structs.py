@@ -12,11 +12,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import os
+import pickle
 import unittest
 
+from collections import OrderedDict
+
 from swimai.structures import Num, Attr, Slot, Text, RecordMap, Bool, Value, RecordConverter
-from swimai.structures._structs import _Item, _Extant, _Absent, _RecordFlags, _Record, _RecordMapView, _ValueBuilder
-from test.utils import CustomString, CustomItem, MockPerson, MockPet, MockCar
+from swimai.structures._structs import _Item, _Extant, _Absent, _RecordFlags, _Record, _RecordMapView, _ValueBuilder, \
+    _RecordMapSlice, _ClassCodec
+from test.utils import CustomString, CustomItem, MockPerson, MockPet, MockCar, MockDataclassPerson, \
+    MockNamedTuplePerson, MockSlotsPerson, MockRequiredNamedTuple, MockRequiredFrozenDataclass
 
 
 class TestStructs(unittest.TestCase):
@@ -434,6 +439,72 @@ class TestStructs(unittest.TestCase):
         self.assertIsInstance(actual, str)
         self.assertEqual('Dog', actual)
 
+    def test_text_intern_same_key(self):
+        # When
+        first = Text._intern('node')
+        second = Text._intern('node')
+        # Then
+        self.assertEqual('node', first.value)
+        self.assertIs(first, second)
+
+    def test_text_intern_long_key(self):
+        # Given
+        string = 'a' * (Text._INTERN_MAX_LENGTH + 1)
+        # When
+        first = Text._intern(string)
+        second = Text._intern(string)
+        # Then
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertNotIn(string, Text._interned)
+
+    def test_text_intern_full_table(self):
+        # Given
+        interned = Text._interned
+        Text._interned = OrderedDict((str(index), Text(str(index))) for index in range(0, Text._INTERN_MAX_SIZE))
+        # When
+        try:
+            used = Text._intern('0')
+            first = Text._intern('foo_bar')
+            second = Text._intern('foo_bar')
+            actual = Text._interned
+        finally:
+            Text._interned = interned
+        # Then
+        self.assertIs(first, second)
+        self.assertEqual(Text._INTERN_MAX_SIZE, len(actual))
+        self.assertIs(used, actual['0'])
+        self.assertNotIn('1', actual)
+        self.assertIn('foo_bar', actual)
+
+    def test_text_intern_evicted_by_other_thread(self):
+        # Given
+        class MockEvictingTable(OrderedDict):
+
+            def get(self, key, default=None):
+                text = super().get(key, default)
+                self.clear()
+                return text
+
+        interned = Text._interned
+        Text._interned = MockEvictingTable(foo=Text('foo'))
+        # When
+        try:
+            actual = Text._intern('foo')
+        finally:
+            Text._interned = interned
+        # Then
+        self.assertEqual('foo', actual.value)
+
+    def test_text_intern_non_string(self):
+        # When
+        with self.assertRaises(Exception) as error:
+            # noinspection PyTypeChecker
+            Text._intern(1)
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot create a Text object with non string value!', message)
+
     def test_num_integer(self):
         # When
         num = Num(33)
@@ -450,6 +521,29 @@ class TestStructs(unittest.TestCase):
         self.assertEqual(0.11, num.get_num_value())
         self.assertEqual(self.expected_strings.get(self.get_name()), str(num))
 
+    def test_create_num_from_small_integer_cached(self):
+        # When
+        first = Num.create_from(Num._SMALL_MAX)
+        second = Num.create_from(Num._SMALL_MAX)
+        # Then
+        self.assertEqual(Num._SMALL_MAX, first.value)
+        self.assertIs(first, second)
+
+    def test_create_num_from_large_integer_not_cached(self):
+        # When
+        first = Num.create_from(Num._SMALL_MAX + 1)
+        second = Num.create_from(Num._SMALL_MAX + 1)
+        # Then
+        self.assertEqual(Num._SMALL_MAX + 1, first.value)
+        self.assertIsNot(first, second)
+
+    def test_create_num_from_float_not_cached(self):
+        # When
+        actual = Num.create_from(1.0)
+        # Then
+        self.assertIsInstance(actual.value, float)
+        self.assertEqual('1.0', str(actual))
+
     def test_create_num_from_positive_integer(self):
         # Given
         num = 99
@@ -613,6 +707,14 @@ class TestStructs(unittest.TestCase):
         self.assertFalse(actual)
         self.assertFalse(_Extant._get_extant())
 
+    def test_pickle_absent_and_extant(self):
+        # When
+        actual_absent = pickle.loads(pickle.dumps(Value.absent()))
+        actual_extant = pickle.loads(pickle.dumps(Value.extant()))
+        # Then
+        self.assertIs(Value.absent(), actual_absent)
+        self.assertIs(Value.extant(), actual_extant)
+
     def test_slot_key_value(self):
         # Given
         slot = Slot('Foo', 'Bar')
@@ -662,6 +764,59 @@ class TestStructs(unittest.TestCase):
         message = error.exception.args[0]
         self.assertEqual('Empty key for slot!', message)
 
+    def test_value_equal_structural(self):
+        # Given
+        first = [Text.create_from('Foo'), Num.create_from(1), Bool.create_from(True),
+                 Attr.create_attr('Foo', Num.create_from(1)), Slot.create_slot(Text.create_from('Foo'), Num.create_from(1))]
+        second = [Text('Foo'), Num(1.0), Bool(True), Attr(Text('Foo'), Num(1)), Slot(Text('Foo'), Num(1))]
+        # When
+        actual = [(x == y, hash(x) == hash(y)) for x, y in zip(first, second)]
+        # Then
+        self.assertEqual([(True, True)] * 5, actual)
+
+    def test_value_not_equal_different_types(self):
+        # Given
+        text = Text.create_from('1')
+        num = Num.create_from(1)
+        boolean = Bool.create_from(True)
+        # Then
+        self.assertNotEqual(text, num)
+        self.assertNotEqual(num, boolean)
+        self.assertNotEqual(text, '1')
+        self.assertNotEqual(num, 1)
+        self.assertNotEqual(Attr.create_attr('Foo', 1), Slot.create_slot('Foo', 1))
+
+    def test_record_equal_structural(self):
+        # Given
+        first = RecordMap.create()
+        first.add(Attr.create_attr('MockPerson', Value.extant()))
+        first._add_slot('name', 'Foo')._add_slot('age', Num.create_from(1))
+        second = RecordConverter.get_converter().object_to_record(MockPerson('Foo', 1))
+        # Then
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, second.get_body())
+        self.assertEqual(hash(first.commit()), hash(second.commit()))
+        self.assertEqual(_RecordMapView(first, 1, 3), first.get_body())
+
+    def test_value_as_dict_key(self):
+        # Given
+        key = RecordConverter.get_converter().object_to_record(MockPerson('Foo', 1)).commit()
+        entries = {Text.create_from('Foo'): 1, Num.create_from(2): 2, key: 3}
+        # When
+        actual = [entries.get(Text('Foo')), entries.get(Num(2)), entries.get(Text('Bar')),
+                  entries.get(RecordConverter.get_converter().object_to_record(MockPerson('Foo', 1)).commit())]
+        # Then
+        self.assertEqual([1, 2, None, 3], actual)
+
+    def test_structures_slots(self):
+        # Given
+        items = [Text.create_from('foo'), Num.create_from(1), Bool.create_from(True), Value.absent(), Value.extant(),
+                 Attr.create_attr('a', 'b'), Slot.create_slot('c', 'd'), RecordMap.create(),
+                 _RecordMapView(RecordMap.create(), 0, 0)]
+        # Then
+        for item in items:
+            self.assertFalse(hasattr(item, '__dict__'))
+
     def test_record_create(self):
         # When
         actual = _Record.create()
@@ -1047,6 +1202,91 @@ class TestStructs(unittest.TestCase):
         self.assertEqual(first, actual.get_item(0))
         self.assertEqual(second, actual.get_item(1))
 
+    def test_record_map_get_body_multiple_shared(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Goodbye', 'World'))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        record_map.add(Text.create_from('Boo'))
+        # When
+        actual = record_map.get_body()
+        # Then
+        self.assertIsInstance(actual, _RecordMapSlice)
+        self.assertIs(record_map._items, actual._source)
+        self.assertEqual(2, actual.size)
+        self.assertEqual(1, actual._field_count)
+        self.assertEqual(Text.create_from('Boo'), actual.get_item(1))
+        self.assertEqual(Value.absent(), actual.get_item(2))
+        self.assertEqual(Num.create_from(1), actual.get('Moo'))
+
+    def test_record_map_get_body_multiple_mutate_body(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Goodbye', 'World'))
+        record_map.add(Text.create_from('Moo'))
+        record_map.add(Text.create_from('Boo'))
+        body = record_map.get_body()
+        # When
+        body.add(Text.create_from('Foo'))
+        # Then
+        self.assertIsNone(body._source)
+        self.assertEqual(['Moo', 'Boo', 'Foo'], [item.value for item in body.get_items()])
+        self.assertEqual(3, record_map.size)
+        self.assertEqual(3, len(record_map.get_items()))
+
+    def test_record_map_get_body_multiple_mutate_parent(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Goodbye', 'World'))
+        record_map.add(Text.create_from('Moo'))
+        record_map.add(Text.create_from('Boo'))
+        body = record_map.get_body()
+        # When
+        record_map.add(Text.create_from('Foo'))
+        # Then
+        self.assertEqual(2, body.size)
+        self.assertEqual(Value.absent(), body.get_item(2))
+        self.assertEqual(['Moo', 'Boo'], [item.value for item in body.get_items()])
+
+    def test_record_map_get_body_multiple_consumers_shared(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Goodbye', 'World'))
+        record_map.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Foo')))
+        record_map.add(Slot.create_slot(Text.create_from('age'), Num.create_from(1)))
+        other = RecordMap.create()
+        other.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Foo')))
+        other.add(Slot.create_slot(Text.create_from('age'), Num.create_from(1)))
+        body = record_map.get_body()
+        converter = RecordConverter.get_converter()
+        # When
+        actual = [converter.record_to_json(body), converter.record_to_object(body, {}, False), str(body),
+                  body == other, body.get('age'), list(body._iter_items())]
+        body_hash = hash(body.commit())
+        # Then
+        self.assertEqual([{'name': 'Foo', 'age': 1}, {'name': 'Foo', 'age': 1}, 'Record(Slot("name", "Foo"), Slot("age", 1))',
+                          True, Num.create_from(1), record_map.get_items()[1:]], actual)
+        self.assertEqual(hash(other.commit()), body_hash)
+        self.assertIs(record_map._items, body._source)
+
+    def test_record_map_get_body_multiple_nested_slice(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Goodbye', 'World'))
+        record_map.add(Attr.create_attr('Hello', 'World'))
+        record_map.add(Text.create_from('Moo'))
+        record_map.add(Text.create_from('Boo'))
+        # When
+        actual = record_map.get_body().get_body()
+        branch = actual._branch()
+        branch.add(Text.create_from('Foo'))
+        # Then
+        self.assertIsInstance(actual, _RecordMapSlice)
+        self.assertIs(record_map._items, actual._source)
+        self.assertEqual(['Moo', 'Boo'], [item.value for item in actual._iter_items()])
+        self.assertEqual(['Moo', 'Boo', 'Foo'], [item.value for item in branch.get_items()])
+        self.assertEqual(4, record_map.size)
+
     def test_record_immutable_map_add(self):
         # Given
         record_map = RecordMap.create()
@@ -1176,6 +1416,140 @@ class TestStructs(unittest.TestCase):
         self.assertEqual(record_map, actual)
         self.assertEqual(1, actual._flags)
 
+    def test_record_map_commit_recursive(self):
+        # Given
+        attr_value = RecordMap.create_record_map(Text.create_from('Foo'))
+        slot_key = RecordMap.create_record_map(Text.create_from('Moo'))
+        slot_value = RecordMap.create_record_map(Num.create_from(1))
+        nested = RecordMap.create_record_map(Text.create_from('Boo'))
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Foo', attr_value))
+        record_map.add(Slot.create_slot(slot_key, slot_value))
+        record_map.add(nested)
+        # When
+        record_map.commit()
+        # Then
+        for record in [record_map, attr_value, slot_key, slot_value, nested]:
+            self.assertTrue(record._flags & _RecordFlags.IMMUTABLE.value)
+
+        with self.assertRaises(TypeError) as error:
+            slot_value.add(Num.create_from(2))
+
+        message = error.exception.args[0]
+        self.assertEqual('Cannot add item to immutable record!', message)
+
+    def test_record_map_commit_body(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Foo', 'Bar'))
+        record_map.add(Text.create_from('Moo'))
+        record_map.add(RecordMap.create_record_map(Text.create_from('Boo')))
+        body = record_map.get_body()
+        # When
+        body.commit()
+        # Then
+        self.assertTrue(body._flags & _RecordFlags.IMMUTABLE.value)
+        self.assertTrue(body.get_item(1)._flags & _RecordFlags.IMMUTABLE.value)
+        self.assertFalse(record_map._flags & _RecordFlags.IMMUTABLE.value)
+
+    def test_record_map_view_commit(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Text.create_from('Moo'))
+        record_map_view = _RecordMapView(record_map, 0, 1)
+        # When
+        actual = record_map_view.commit()
+        # Then
+        self.assertIs(record_map_view, actual)
+        self.assertTrue(record_map._flags & _RecordFlags.IMMUTABLE.value)
+
+    def test_value_commit(self):
+        # Given
+        text = Text.create_from('Moo')
+        slot = Slot.create_slot(text, Num.create_from(1))
+        # When
+        actual_text = text.commit()
+        actual_slot = slot.commit()
+        # Then
+        self.assertIs(text, actual_text)
+        self.assertIs(slot, actual_slot)
+
+    def test_record_map_hash_cached_when_committed(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        # When
+        with self.assertRaises(TypeError) as error:
+            hash(record_map)
+
+        cached_before_commit = record_map._hash
+        record_map.commit()
+        committed_hash = hash(record_map)
+        # Then
+        self.assertEqual('Cannot hash mutable record Record(Slot("Moo", 1))!', str(error.exception))
+        self.assertIsNone(cached_before_commit)
+        self.assertEqual(committed_hash, record_map._hash)
+        self.assertEqual(committed_hash, hash(record_map))
+
+    def test_record_map_view_hash_when_committed(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Text.create_from('Foo'))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        record_view = _RecordMapView(record_map, 1, 2)
+        # When
+        with self.assertRaises(TypeError):
+            hash(record_view)
+
+        record_map.commit()
+        # Then
+        self.assertEqual(hash(RecordMap.create_record_map(record_map.get_item(1)).commit()), hash(record_view))
+
+    def test_record_map_get_field_record_key(self):
+        # Given
+        key = RecordMap.create_record_map(Text.create_from('Foo'))
+        record_map = RecordMap.create()
+        record_map.add(Slot.create_slot(key, Num.create_from(1)))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(2)))
+        # When
+        actual = [record_map.get(RecordMap.create_record_map(Text.create_from('Foo'))), record_map.get('Moo')]
+        # Then
+        self.assertEqual([Num.create_from(1), Num.create_from(2)], actual)
+        self.assertFalse(key._is_immutable())
+
+    def test_record_map_get_field_primitive_key_types(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Slot.create_slot(Num.create_from(1), Text.create_from('int')))
+        record_map.add(Slot.create_slot(Num.create_from(1.0), Text.create_from('float')))
+        record_map.add(Slot.create_slot(Bool.create_from(True), Text.create_from('bool')))
+        record_map.add(Slot.create_slot(Text.create_from('1'), Text.create_from('text')))
+        view = _RecordMapView(record_map, 0, 4)
+        # When
+        actual = [record_map.get(1), record_map.get(1.0), record_map.get(True), record_map.get('1')]
+        actual_view = [view.get(1), view.get(1.0), view.get(True), view.get('1')]
+        # Then
+        expected = [Text.create_from('int'), Text.create_from('float'), Text.create_from('bool'),
+                    Text.create_from('text')]
+        self.assertEqual(expected, actual)
+        self.assertEqual(expected, actual_view)
+
+    def test_record_map_equal_committed(self):
+        # Given
+        first = RecordMap.create()
+        first.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        second = RecordMap.create()
+        second.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        third = RecordMap.create()
+        third.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(2)))
+        # When
+        for record in [first, second, third]:
+            hash(record.commit())
+        # Then
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+        self.assertEqual(1, len({first, second}))
+
     def test_record_map_contains_key_value(self):
         # Given
         record_map = RecordMap.create()
@@ -1216,6 +1590,110 @@ class TestStructs(unittest.TestCase):
         # Then
         self.assertFalse(actual)
 
+    def test_record_map_contains_key_keeps_hashtable(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Foo', 'Poo'))
+        record_map.contains_key('Foo')
+        fields = record_map._fields
+        # When
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Text.create_from('Boo')))
+        actual = record_map.contains_key('Moo')
+        # Then
+        self.assertTrue(actual)
+        self.assertIs(fields, record_map._fields)
+
+    def test_record_map_contains_key_mixed_items(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Text.create_from('Foo'))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Text.create_from('Boo')))
+        # When
+        actual = record_map.contains_key('Foo')
+        # Then
+        self.assertFalse(actual)
+        self.assertEqual(1, len(record_map._fields))
+
+    def test_record_map_get(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Foo', Text.create_from('Poo')))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        record_map.add(Slot.create_slot(Num.create_from(2), Text.create_from('Boo')))
+        # When
+        first = record_map.get('Foo')
+        second = record_map.get(Text.create_from('Moo'))
+        third = record_map.get(2)
+        missing = record_map.get('Boo')
+        # Then
+        self.assertEqual(Text.create_from('Poo'), first)
+        self.assertEqual(Num.create_from(1), second)
+        self.assertEqual(Text.create_from('Boo'), third)
+        self.assertEqual(Value.absent(), missing)
+
+    def test_record_map_get_duplicate(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Slot.create_slot(Text.create_from('Foo'), Num.create_from(1)))
+        record_map.add(Slot.create_slot(Text.create_from('Foo'), Num.create_from(2)))
+        # When
+        actual = record_map.get('Foo')
+        # Then
+        self.assertEqual(Num.create_from(2), actual)
+
+    def test_record_map_get_record_key(self):
+        # Given
+        key = RecordMap.create()
+        key.add(Text.create_from('Foo'))
+        record_map = RecordMap.create()
+        record_map.add(Slot.create_slot(key, Num.create_from(1)))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(2)))
+        # When
+        actual = record_map.get(RecordMap.create_record_map(Text.create_from('Foo')))
+        # Then
+        self.assertEqual(Num.create_from(1), actual)
+
+    def test_record_map_get_slot(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Foo', Text.create_from('Poo')))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        # When
+        attr = record_map.get_slot('Foo')
+        slot = record_map.get_slot('Moo')
+        # Then
+        self.assertEqual(Value.absent(), attr)
+        self.assertEqual(Num.create_from(1), slot)
+
+    def test_record_map_get_after_branch(self):
+        # Given
+        original_record = RecordMap.create()
+        original_record.add(Slot.create_slot(Text.create_from('Foo'), Num.create_from(1)))
+        original_record.get('Foo')
+        copy_record = original_record._branch()
+        # When
+        copy_record.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(2)))
+        # Then
+        self.assertEqual(Num.create_from(2), copy_record.get('Moo'))
+        self.assertEqual(Value.absent(), original_record.get('Moo'))
+        self.assertIsNot(original_record._fields, copy_record._fields)
+        self.assertEqual(2, len(copy_record._fields))
+        self.assertEqual(1, len(original_record._fields))
+
+    def test_record_map_view_get(self):
+        # Given
+        record_map = RecordMap.create()
+        record_map.add(Attr.create_attr('Foo', Text.create_from('Poo')))
+        record_map.add(Slot.create_slot(Text.create_from('Moo'), Num.create_from(1)))
+        record_map.add(Text.create_from('Boo'))
+        record_map_view = _RecordMapView(record_map, 1, 3)
+        # When
+        slot = record_map_view.get('Moo')
+        attr = record_map_view.get('Foo')
+        # Then
+        self.assertEqual(Num.create_from(1), slot)
+        self.assertEqual(Value.absent(), attr)
+
     def test_record_map_contains_key_field_count_empty(self):
         # Given
         record_map = RecordMap.create()
@@ -1329,6 +1807,34 @@ class TestStructs(unittest.TestCase):
         self.assertEqual(2, len(original_record._fields))
         self.assertEqual(4, len(copy_record._fields))
 
+    def test_record_map_add_mutable_in_place(self):
+        # Given
+        record = _Record.create()
+        record.add(Text.create_from('a'))
+        items = record._items
+        # When
+        record.add(Text.create_from('b'))
+        record.add(Text.create_from('c'))
+        # Then
+        self.assertEqual(0, record._flags)
+        self.assertIs(items, record._items)
+        self.assertEqual(3, record._item_count)
+        self.assertEqual(['a', 'b', 'c'], [item.value for item in record.get_items()])
+
+    def test_record_map_branch_mutate_both(self):
+        # Given
+        original_record = _Record.create()
+        original_record.add(Text.create_from('a'))
+        copy_record = original_record._branch()
+        # When
+        original_record.add(Text.create_from('b'))
+        original_record.add(Text.create_from('c'))
+        copy_record.add(Text.create_from('d'))
+        # Then
+        self.assertIsNot(original_record._items, copy_record._items)
+        self.assertEqual(['a', 'b', 'c'], [item.value for item in original_record.get_items()])
+        self.assertEqual(['a', 'd'], [item.value for item in copy_record.get_items()])
+
     def test_record_map_view(self):
         # Given
         record = _Record.create()
@@ -2117,3 +2623,266 @@ class TestStructs(unittest.TestCase):
         # Then
         message = error.exception.args[0]
         self.assertEqual('Missing attribute age for class MockCar.', message)
+
+    def test_converter_get_codec_cached(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        # When
+        first = converter._get_codec(MockPerson)
+        second = converter._get_codec(MockPerson)
+        # Then
+        self.assertIsInstance(first, _ClassCodec)
+        self.assertIs(first, second)
+        self.assertEqual('MockPerson', first._tag.value)
+        self.assertEqual(frozenset({'name', 'age', 'friend'}), first._attributes)
+        self.assertIsNone(first._arguments)
+
+    def test_converter_object_record_dataclass(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        obj = MockDataclassPerson('Foo', 30)
+        classes = {'MockDataclassPerson': MockDataclassPerson}
+        # When
+        record = converter.object_to_record(obj)
+        actual = converter.record_to_object(record, classes, True)
+        # Then
+        self.assertEqual('MockDataclassPerson', record.get_item(0).key.value)
+        self.assertEqual('Foo', record.get('name').value)
+        self.assertEqual(30, record.get('age').value)
+        self.assertEqual(obj, actual)
+
+    def test_converter_object_record_named_tuple(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        obj = MockNamedTuplePerson('Bar', 40)
+        classes = {'MockNamedTuplePerson': MockNamedTuplePerson}
+        # When
+        record = converter.object_to_record(obj)
+        actual = converter.record_to_object(record, classes, True)
+        # Then
+        self.assertEqual('MockNamedTuplePerson', record.get_item(0).key.value)
+        self.assertEqual('Bar', record.get('name').value)
+        self.assertEqual(40, record.get('age').value)
+        self.assertEqual(obj, actual)
+
+    def test_converter_object_record_slots(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        obj = MockSlotsPerson('Baz', 50)
+        classes = {'MockSlotsPerson': MockSlotsPerson}
+        # When
+        record = converter.object_to_record(obj)
+        actual = converter.record_to_object(record, classes, True)
+        # Then
+        self.assertEqual('MockSlotsPerson', record.get_item(0).key.value)
+        self.assertEqual('Baz', record.get('name').value)
+        self.assertEqual(50, record.get('age').value)
+        self.assertIsInstance(actual, MockSlotsPerson)
+        self.assertEqual('Baz', actual.name)
+        self.assertEqual(50, actual.age)
+
+    def test_converter_record_to_object_dataclass_extra_attribute_not_strict(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Attr.create_attr(Text.create_from('MockDataclassPerson'), Value.extant()))
+        record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Foo')))
+        record.add(Slot.create_slot(Text.create_from('owner'), Text.create_from('Bar')))
+        classes = {'MockDataclassPerson': MockDataclassPerson}
+        # When
+        actual = converter.record_to_object(record, classes, False)
+        # Then
+        self.assertEqual(MockDataclassPerson('Foo'), actual)
+
+    def test_converter_record_to_object_dataclass_extra_attribute_strict(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Attr.create_attr(Text.create_from('MockDataclassPerson'), Value.extant()))
+        record.add(Slot.create_slot(Text.create_from('owner'), Text.create_from('Bar')))
+        classes = {'MockDataclassPerson': MockDataclassPerson}
+        # When
+        with self.assertRaises(Exception) as error:
+            converter.record_to_object(record, classes, True)
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Missing attribute owner for class MockDataclassPerson.', message)
+
+    def test_converter_record_to_object_dynamic_type_cached(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        first_record = RecordMap.create()
+        first_record.add(Attr.create_attr(Text.create_from('MockUnknown'), Value.extant()))
+        first_record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Foo')))
+        second_record = RecordMap.create()
+        second_record.add(Attr.create_attr(Text.create_from('MockUnknown'), Value.extant()))
+        second_record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Bar')))
+        # When
+        first = converter.record_to_object(first_record, {}, False)
+        second = converter.record_to_object(second_record, {}, False)
+        # Then
+        self.assertEqual('MockUnknown', type(first).__name__)
+        self.assertIs(type(first), type(second))
+        self.assertEqual('Foo', first.name)
+        self.assertEqual('Bar', second.name)
+
+    def test_class_codec_private_slots(self):
+        # Given
+        class MockPrivateSlots:
+            __slots__ = ('__secret',)
+
+            def __init__(self, secret=None):
+                self.__secret = secret
+
+        # When
+        actual = _ClassCodec(MockPrivateSlots)
+        # Then
+        self.assertEqual(['_MockPrivateSlots__secret'], actual._slots)
+        self.assertEqual({'_MockPrivateSlots__secret': 'Foo'}, actual._get_entries(MockPrivateSlots('Foo')))
+
+    def test_class_codec_does_not_instantiate_class(self):
+        # Given
+        instances = []
+
+        class MockCounted:
+
+            def __init__(self, name=None, *args, **kwargs):
+                instances.append(self)
+                self.name = name
+
+        # When
+        actual = _ClassCodec(MockCounted)
+        # Then
+        self.assertEqual(0, len(instances))
+        self.assertEqual(frozenset({'name'}), actual._attributes)
+
+    def test_class_codec_can_create_objects(self):
+        # Given
+        class MockRequired:
+
+            def __init__(self, name):
+                self.name = name
+
+        class MockOptional:
+
+            def __init__(self, name=None, *args, **kwargs):
+                self.name = name
+
+        # Then
+        self.assertFalse(_ClassCodec(MockRequired)._can_create_objects())
+        self.assertTrue(_ClassCodec(MockOptional)._can_create_objects())
+        self.assertTrue(_ClassCodec(MockRequiredNamedTuple)._can_create_objects())
+        self.assertTrue(_ClassCodec(MockRequiredFrozenDataclass)._can_create_objects())
+
+    def test_converter_record_to_object_strict_undeclared_attribute(self):
+        # Given
+        class MockUndeclared:
+
+            def __init__(self):
+                self.name = None
+
+        converter = RecordConverter()
+        record = RecordMap.create()
+        record.add(Attr.create_attr(Text.create_from('MockUndeclared'), _Extant._get_extant()))
+        record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Foo')))
+        # When
+        actual = converter.record_to_object(record, {'MockUndeclared': MockUndeclared}, True)
+        # Then
+        self.assertIsInstance(actual, MockUndeclared)
+        self.assertEqual('Foo', actual.name)
+
+    def test_converter_record_to_object_missing_slot(self):
+        # Given
+        converter = RecordConverter()
+        record = RecordMap.create()
+        record.add(Attr.create_attr(Text.create_from('MockSlotsPerson'), _Extant._get_extant()))
+        record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Foo')))
+        record.add(Slot.create_slot(Text.create_from('height'), Num.create_from(180)))
+        # When
+        with self.assertRaises(Exception) as error:
+            converter.record_to_object(record, {'MockSlotsPerson': MockSlotsPerson}, False)
+        # Then
+        message = error.exception.args[0]
+        self.assertEqual('Cannot set attribute height for class MockSlotsPerson.', message)
+
+    def test_converter_record_to_json_primitives(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        # When
+        actual = [converter.record_to_json(Text.create_from('foo')), converter.record_to_json(Num.create_from(1.5)),
+                  converter.record_to_json(Bool.create_from(True)), converter.record_to_json(Value.extant()),
+                  converter.record_to_json(Value.absent())]
+        # Then
+        self.assertEqual(['foo', 1.5, True, None, None], actual)
+
+    def test_converter_record_to_json_array(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Num.create_from(1))
+        record.add(RecordMap.create_record_map(Text.create_from('foo')))
+        # When
+        actual = converter.record_to_json(record)
+        # Then
+        self.assertEqual([1, ['foo']], actual)
+
+    def test_converter_record_to_json_object(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Attr.create_attr(Text.create_from('MockPerson'), Value.extant()))
+        record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Foo')))
+        record.add(Slot.create_slot(Num.create_from(2), Bool.create_from(False)))
+        record.add(Text.create_from('Bar'))
+        # When
+        actual = converter.record_to_json(record)
+        # Then
+        self.assertEqual({'@MockPerson': None, 'name': 'Foo', '2': False, '$3': 'Bar'}, actual)
+
+    def test_converter_record_to_json_attr_values(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Attr.create_attr(Text.create_from('single'), RecordMap.create_record_map(Num.create_from(1))))
+        record.add(Attr.create_attr(Text.create_from('slots'), RecordMap.create_record_map(
+            Slot.create_slot(Text.create_from('key'), Text.create_from('foo')))))
+        # When
+        actual = converter.record_to_json(record)
+        # Then
+        self.assertEqual({'@single': 1, '@slots': {'key': 'foo'}}, actual)
+
+    def test_converter_record_to_json_view(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Text.create_from('Foo'))
+        record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Bar')))
+        # When
+        actual = [converter.record_to_json(_RecordMapView(record, 0, 1)),
+                  converter.record_to_json(_RecordMapView(record, 0, 2))]
+        # Then
+        self.assertEqual([['Foo'], {'$0': 'Foo', 'name': 'Bar'}], actual)
+
+    def test_converter_record_to_json_bytes(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Attr.create_attr(Text.create_from('MockPerson'), Value.extant()))
+        record.add(Slot.create_slot(Text.create_from('name'), Text.create_from('Zoë')))
+        # When
+        actual = converter.record_to_json_bytes(record)
+        # Then
+        self.assertEqual('{"@MockPerson":null,"name":"Zoë"}'.encode('utf-8'), actual)
+
+    def test_converter_record_to_json_values_before_fields(self):
+        # Given
+        converter = RecordConverter.get_converter()
+        record = RecordMap.create()
+        record.add(Num.create_from(1))
+        record.add(Text.create_from('Foo'))
+        record.add(Slot.create_slot(Text.create_from('name'), RecordMap.create_record_map(Num.create_from(2))))
+        record.add(Bool.create_from(True))
+        # When
+        actual = converter.record_to_json(record)
+        # Then
+        self.assertEqual({'$0': 1, '$1': 'Foo', 'name': [2], '$3': True}, actual)
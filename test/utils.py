@@ -13,9 +13,11 @@
 #  limitations under the License.
 
 import asyncio
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, NamedTuple
 from unittest.mock import MagicMock
 from swimai.client._connections import _ConnectionStatus
+from swimai.structures import RecordConverter
 from swimai.structures._structs import _Item
 
 
@@ -227,6 +229,22 @@ async def mock_did_remove_callback(key, old):
     pass
 
 
+async def mock_did_update_batch_callback(changes):
+    str(changes)
+    pass
+
+
+def create_map_entries(*entries):
+    converter = RecordConverter.get_converter()
+    map_entries = dict()
+
+    for key, value in entries:
+        key = converter.object_to_record(key).commit()
+        map_entries[key] = (key, converter.object_to_record(value))
+
+    return map_entries
+
+
 def mock_exception_callback():
     print('Mock exception callback')
 
@@ -338,6 +356,34 @@ class MockCar:
         self.year = year
 
 
+@dataclass(frozen=True)
+class MockDataclassPerson:
+    name: str = None
+    age: int = None
+
+
+class MockNamedTuplePerson(NamedTuple):
+    name: str = None
+    age: int = None
+
+
+class MockRequiredNamedTuple(NamedTuple):
+    x: int
+
+
+@dataclass(frozen=True)
+class MockRequiredFrozenDataclass:
+    a: int
+
+
+class MockSlotsPerson:
+    __slots__ = ('name', 'age')
+
+    def __init__(self, name=None, age=None):
+        self.name = name
+        self.age = age
+
+
 def mock_func():
     return 'mock_func_response'
 
@@ -395,6 +441,7 @@ class MockDownlinkManager:
         self.update_value_old = None
         self.remove_key = None
         self.remove_old_value = None
+        self.update_batch = None
         self.strict = False
         self.registered_classes = dict()
 
@@ -418,6 +465,10 @@ class MockDownlinkManager:
         self.remove_key = remove_key
         self.remove_old_value = remove_old_value
 
+    async def _subscribers_did_update_batch(self, changes):
+        self.called = self.called + 1
+        self.update_batch = changes
+
 
 class MockEventCallback:
 
@@ -456,6 +507,16 @@ class MockDidUpdateCallback:
         self.old_value = old_value
 
 
+class MockDidUpdateBatchCallback:
+    def __init__(self):
+        self.called = False
+        self.changes = None
+
+    async def execute(self, changes):
+        self.called = True
+        self.changes = changes
+
+
 class MockDidRemoveCallback:
     def __init__(self):
         self.called = False